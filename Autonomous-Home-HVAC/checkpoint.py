@@ -0,0 +1,302 @@
+"""***************************************************************************
+Title:          Checkpoint
+File:           checkpoint.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Compact binary checkpoints of the simulation, model,
+                controller, zone and telemetry state. A checkpoint can be
+                written at a fixed simulated interval during a long run and
+                resumed later, or used to branch what-if scenarios from a
+                warmed-up state without simulating the history again.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import os
+import glob
+import pickle
+import struct
+import time
+import zlib
+from model import ZONE_NAMES
+from simulation import ThermalSimulation
+
+
+"""*********************Global*********************************************"""
+# File layout: magic, format version, payload length and checksum, then the
+# zlib compressed payload
+MAGIC = b"HVACCKPT"
+VERSION = 1
+HEADER = struct.Struct("<8sHQI")
+COMPRESSION_LEVEL = 6
+
+# Controller attributes saved besides the zone temperatures and dampers
+CONTROLLER_FIELDS = ("date", "time", "setpoint", "mode", "temp_out",
+                     "current_temp", "aircon_status", "aircon_energy",
+                     "furnace_status", "furnace_energy", "fan_status",
+                     "fan_speed", "damper", "airflow", "damp_sup_pos",
+                     "damp_ret_pos", "damp_out_pos")
+
+# Controller accumulators saved with their state() and restore()
+HISTORY_FIELDS = ("energy", "history")
+
+# Model attributes saved besides current_values
+MODEL_FIELDS = ("user_selected_date", "user_selected_hour", "stop_polling",
+                "q_furnace", "q_aircon")
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def save_checkpoint(file_path, state):
+    """
+    Writes a state to a checkpoint file. The file is replaced atomically so
+    an interrupted write never leaves a broken checkpoint behind.
+
+    file_path: Path of the checkpoint file (string)
+    state: State to save, e.g. from capture_state (dictionary)
+    Returns: Size of the checkpoint in bytes (int)
+    """
+    payload = zlib.compress(pickle.dumps(state,
+                                         protocol=pickle.HIGHEST_PROTOCOL),
+                            COMPRESSION_LEVEL)
+    header = HEADER.pack(MAGIC, VERSION, len(payload), zlib.crc32(payload))
+    temporary = f"{file_path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(header)
+        file.write(payload)
+    os.replace(temporary, file_path)
+    return len(header) + len(payload)
+
+
+def load_checkpoint(file_path):
+    """
+    Reads a state from a checkpoint file.
+
+    file_path: Path of the checkpoint file (string)
+    Returns: The saved state (dictionary)
+    Raises: ValueError if the file is not a valid checkpoint
+    """
+    with open(file_path, "rb") as file:
+        header = file.read(HEADER.size)
+        payload = file.read()
+    if len(header) < HEADER.size:
+        raise ValueError(f"{file_path} is too short to be a checkpoint.")
+    magic, version, length, checksum = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{file_path} is not a checkpoint.")
+    if version > VERSION:
+        raise ValueError(f"Checkpoint version {version} is not supported.")
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        raise ValueError(f"{file_path} is truncated or corrupted.")
+    return pickle.loads(zlib.decompress(payload))
+
+
+def model_state(model):
+    """
+    Returns: The current values and stage state of a model (dictionary)
+    """
+    state = {"current_values": dict(model.current_values)}
+    for field in MODEL_FIELDS:
+        if hasattr(model, field):
+            state[field] = getattr(model, field)
+    return state
+
+
+def restore_model(model, state):
+    """
+    Writes a saved state back into a model.
+
+    model: The model to restore (Model)
+    state: A state returned by model_state (dictionary)
+    """
+    model.current_values.update(state["current_values"])
+    for field in MODEL_FIELDS:
+        if field in state:
+            setattr(model, field, state[field])
+
+
+def controller_state(controller):
+    """
+    Returns: The settings, appliance, zone, staging, energy and history
+             state of a controller together with its telemetry
+             (dictionary)
+    """
+    state = {field: getattr(controller, field) for field in CONTROLLER_FIELDS
+             if hasattr(controller, field)}
+    state["zones"] = controller.zone_temperatures()
+    state["dampers"] = {zone: getattr(controller, f"{zone}_damper")
+                        for zone in ZONE_NAMES
+                        if hasattr(controller, f"{zone}_damper")}
+    state["models"] = {name: model_state(getattr(controller, name))
+                       for name in ("thermostat", "furnace", "aircon")
+                       if hasattr(controller, name)}
+
+    # Staging timers and cycle counts, energy accounts and the history
+    if hasattr(controller, "staging"):
+        state["staging"] = controller.staging.state(time.monotonic())
+    for name in HISTORY_FIELDS:
+        if hasattr(controller, name):
+            state[name] = getattr(controller, name).state()
+
+    # Telemetry is kept for inspection and not restored
+    telemetry = {}
+    if hasattr(controller, "executor"):
+        telemetry["executor"] = controller.executor_metrics()
+    if getattr(controller, "sensor_bus", None) is not None:
+        telemetry["sensors"] = dict(controller.sensor_bus.stats)
+    state["telemetry"] = telemetry
+    return state
+
+
+def restore_controller(controller, state):
+    """
+    Writes a saved state back into a controller.
+
+    controller: The controller to restore (ThermostatController)
+    state: A state returned by controller_state (dictionary)
+    """
+    for field in CONTROLLER_FIELDS:
+        if field in state:
+            setattr(controller, field, state[field])
+    controller.update_zone_temperatures(state["zones"])
+    for zone, position in state["dampers"].items():
+        setattr(controller, f"{zone}_damper", position)
+    for name, saved in state["models"].items():
+        if hasattr(controller, name):
+            restore_model(getattr(controller, name), saved)
+    if "staging" in state and hasattr(controller, "staging"):
+        controller.staging.restore(state["staging"], time.monotonic())
+    for name in HISTORY_FIELDS:
+        if name in state and hasattr(controller, name):
+            getattr(controller, name).restore(state[name])
+
+
+def capture_state(simulation=None, controller=None, **extra):
+    """
+    Collects everything to be saved in one checkpoint.
+
+    simulation: Simulation to save (ThermalSimulation)
+    controller: Controller to save (ThermostatController)
+    extra: Further picklable state, e.g. a model or telemetry (any)
+    Returns: The state for save_checkpoint (dictionary)
+    """
+    state = {"created": time.time(), **extra}
+    if simulation is not None:
+        state["simulation"] = simulation.state()
+    if controller is not None:
+        state["controller"] = controller_state(controller)
+    return state
+
+
+def resume_simulation(file_path, outdoor_temperatures, **options):
+    """
+    Builds a simulation continuing from a checkpoint. The zone properties
+    and step size of the saved run are used unless given in the options, so
+    the weather, setpoints or policy can be changed for a what-if branch.
+
+    file_path: Path of the checkpoint file (string)
+    outdoor_temperatures: Hourly outdoor temperatures (array)
+    options: Further arguments of ThermalSimulation (any)
+    Returns: The simulation at the saved step (ThermalSimulation)
+    """
+    saved = load_checkpoint(file_path)["simulation"]
+    options.setdefault("zones", saved["zones"])
+    options.setdefault("heat_loss", saved["heat_loss"])
+    options.setdefault("capacity", saved["capacity"])
+    options.setdefault("step_seconds", saved["step_seconds"])
+    options.setdefault("record", saved["hourly_temperatures"] is not None)
+    simulation = ThermalSimulation(outdoor_temperatures, **options)
+    return simulation.restore(saved)
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class Checkpointer:
+    """
+    Writes a checkpoint at a fixed simulated interval. An instance is
+    passed as the callback of ThermalSimulation.run.
+    """
+    def __init__(self, directory, interval_hours=24 * 7, keep=3,
+                 controller=None):
+        """
+        Initializes the checkpointer.
+
+        directory: Directory of the checkpoint files (string)
+        interval_hours: Simulated hours between checkpoints (int)
+        keep: Number of newest checkpoints kept, all if None (int)
+        controller: Controller saved with the simulation (ThermostatController)
+        """
+        if interval_hours < 1:
+            raise ValueError("The checkpoint interval is at least one hour.")
+        self.directory = directory
+        self.interval_hours = interval_hours
+        self.keep = keep
+        self.controller = controller
+        self.written = []
+        os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, simulation):
+        """
+        Writes a checkpoint when the simulation reaches the interval.
+
+        simulation: The running simulation (ThermalSimulation)
+        """
+        hour = int(simulation.hour)
+        if hour % self.interval_hours == 0:
+            self.save(simulation)
+
+    def path_for(self, hour):
+        """
+        Returns: Path of the checkpoint at a simulated hour (string)
+        """
+        return os.path.join(self.directory, f"checkpoint-{hour:07d}.ckpt")
+
+    def save(self, simulation):
+        """
+        Writes a checkpoint now and removes the oldest beyond keep.
+
+        simulation: The simulation to save (ThermalSimulation)
+        Returns: Path of the checkpoint (string)
+        """
+        file_path = self.path_for(int(simulation.hour))
+        save_checkpoint(file_path, capture_state(simulation, self.controller))
+        self.written.append(file_path)
+        if self.keep is not None:
+            for old_file in self.checkpoints()[:-self.keep]:
+                os.remove(old_file)
+        return file_path
+
+    def checkpoints(self):
+        """
+        Returns: Paths of the checkpoints, oldest first (list)
+        """
+        return sorted(glob.glob(os.path.join(self.directory,
+                                             "checkpoint-*.ckpt")))
+
+    def latest(self):
+        """
+        Returns: Path of the newest checkpoint, None if there is none
+        """
+        checkpoints = self.checkpoints()
+        return checkpoints[-1] if checkpoints else None
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration with a year of synthetic weather and 100 zones
+    import numpy as np
+    hours = np.arange(24 * 365)
+    outdoor = (5 + 12 * np.sin(2 * np.pi * (hours / 24 - 80) / 365) +
+               6 * np.sin(2 * np.pi * hours / 24))
+    checkpointer = Checkpointer("checkpoints", interval_hours=24 * 30)
+    simulation = ThermalSimulation(outdoor, zones=100, setpoints=21.0)
+    simulation.run(hours=24 * 180, callback=checkpointer)
+    latest = checkpointer.latest()
+    print(f"Checkpoint {latest}: {os.path.getsize(latest)} bytes")
+
+    # Resume the rest of the year, and a warmer setpoint branched from it
+    for setpoint in (21.0, 23.0):
+        branch = resume_simulation(latest, outdoor, setpoints=setpoint)
+        branch.run()
+        print(f"Setpoint {setpoint}: heating "
+              f"{branch.heating_energy.sum():.0f}, cooling "
+              f"{branch.cooling_energy.sum():.0f}")
@@ -1,312 +1,651 @@
-"""***************************************************************************
-Title:          Controller
-File:           controller.py
-Release Notes:  N/A
-Author:         Aadil Khatri
-Description:    Controls method for the automated HVAC controls
-***************************************************************************"""
-
-"""*********************Libraries ******************************************"""
-from model import Model, ThermostatModel, FanModel
-from model import FurnaceModel, AirConditionerModel
-import gui
-from PyQt5.QtCore import QTime, QDate
-import threading
-import time
-from PyQt5.QtWidgets import QApplication
-import sys
-
-
-"""*********************Classes********************************************"""
-class ThermostatController:
-    def __init__(self):
-        """
-        Initialize the thermostat, fan, furnace, and air conditioner models.
-        """
-        try:
-            # Instantiate the GUI
-            app = QApplication(sys.argv)
-            main_window = gui.MainWindow(self)
-            main_window.show()
-            sys.exit(app.exec_())
-            
-            # Initialize general properties taken input from gui
-            self.date = "2024-01-01"
-            self.time = "12:00"
-            self.setpoint = 22
-
-            # Initializing room variables to updated in controller
-            self.aircon_status = 0 # 0: Off and 1: On
-            self.aircon_energy = 0
-            self.furnace_status = 0 # 0: Off and 1: On
-            self.furnace_energy = 0
-            self.fan_status = "Off"
-            self.fan_speed = "Low"
-            self.damper = 100
-            self.mode = "Normal mode"
-            self.current_temp = 22
-            self.airflow = 300
-            self.damp_sup_pos = 100
-            self.damp_ret_pos = 80
-            self.damp_out_pos = 20
-
-            # Outdoor temperature taken from simulation
-            self.temp_out = 27
-
-            # Ground Floor
-            self.bdrm_1_temp = 22
-            self.bdrm_1_damper = 100
-            self.bdrm_2_temp = 22
-            self.bdrm_2_damper = 100
-            self.bath_1_temp = 22
-            self.bath_1_damper = 100
-            self.living_temp = 22
-            self.living_damper = 100
-            self.kitchen_temp = 22
-            self.kitchen_damper = 100
-            
-            # Basement
-            self.bdrm_3_temp = 22
-            self.bdrm_3_damper = 100
-            self.bath_2_temp = 22
-            self.bath_2_damper = 100
-            self.mech_rm_temp = 22
-            self.mech_rm_damper = 100
-            self.rec_rm_temp = 22
-            self.rec_rm_damper = 100
-            
-        except Exception as e:
-            print(f"Error initializing components: {e}")
-            raise
-
-    def system_overview(self):
-        """
-        Returns the mechanical room GUI properties.
-        """
-        try:
-            return [self.bdrm_1_temp, self.bdrm_2_temp, self.bdrm_3_temp, 
-                self.bath_1_temp, self.bath_2_temp, 
-                self.living_temp, self.kitchen_temp, 
-                self.mech_rm_temp, self.rec_rm_temp, 
-                self.temp_out, self.date, self.time, self.mode, 
-                self.furnace_status, self.furnace_energy, 
-                self.aircon_status, self.aircon_energy, 
-                self.fan_status, 
-                self.damp_sup_pos, self.damp_ret_pos, self.damp_out_pos]
-        except AttributeError as e:
-            print(f"Missing attributes in system_overview: {e}")
-            raise
-
-    def mechanical_room(self):
-        """
-        Returns the mechanical room GUI properties.
-        """
-        try:
-            return [self.furnace_status, self.furnace_energy, 
-                self.aircon_status, self.aircon_energy, 
-                self.fan_status, self.fan_speed, self.airflow, 
-                self.damp_sup_pos, self.damp_ret_pos, self.damp_out_pos, 
-                self.temp_out]
-        except AttributeError as e:
-            print(f"Missing attributes in mechanical_room: {e}")
-            raise
-
-    def ground_floor(self):
-        """
-        Returns the ground floor GUI properties.
-        """
-        try:
-            return [self.bdrm_1_temp, self.bdrm_1_damper, 
-                self.bdrm_2_temp, self.bdrm_2_damper, 
-                self.bath_1_temp, self.bath_1_damper, 
-                self.living_temp, self.living_damper, 
-                self.kitchen_temp, self.kitchen_damper, 
-                self.setpoint, self.temp_out]
-        except AttributeError as e:
-            print(f"Missing attributes in ground_floor: {e}")
-            raise
-    
-    def basement(self):
-        """
-        Returns the basement GUI properties.
-        """
-        try:
-            return [self.bdrm_3_temp, self.bdrm_3_damper, 
-                self.bath_2_temp, self.bath_2_damper, 
-                self.mech_rm_temp, self.mech_rm_damper,
-                self.rec_rm_temp, self.rec_rm_damper, 
-                self.setpoint, self.temp_out]
-        except AttributeError as e:
-            print(f"Missing attributes in basement: {e}")
-            raise
-            
-    def settings(self):
-        """
-        Returns the ground floor GUI properties.
-        """
-        try:
-            return [self.date, self.time, self.mode]
-        except AttributeError as e:
-            print(f"Missing attributes in ground_floor: {e}")
-            raise
-
-    def set_current_temperature_aircon(self):
-        """
-        Continuously  updates the value of all the features while cooling.
-        """
-        try:
-            while not self.aircon.stop_polling:
-                self.current_temp = self.aircon.read_current_temp()
-                print(f"current_temp: {self.current_temp}")
-                self.aircon_energy = self.aircon.read_q_aircon()
-
-                # Update temperatures for all rooms
-                self.bdrm_1_temp = self.current_temp
-                self.bdrm_2_temp = self.current_temp
-                self.bath_1_temp = self.current_temp
-                self.living_temp = self.current_temp
-                self.kitchen_temp = self.current_temp
-                self.bdrm_3_temp = self.current_temp
-                self.bath_2_temp = self.current_temp
-                self.mech_rm_temp = self.current_temp
-                self.rec_rm_temp = self.current_temp
-                time.sleep(0.001)
-            self.aircon_status = 0 
-            self.fan_speed = "high"
-        except Exception as e:
-            print(f"Error in set_current_temperature_aircon: {e}")
-        
-    def set_current_temperature_furnace(self):
-        """
-        Continuously  updates the value of all the features while heating.
-        """
-        try:
-            while not self.furnace.stop_polling:
-                self.current_temp = self.furnace.read_current_temp()
-                print(f"current_temp: {self.current_temp}")
-                self.aircon_energy = self.aircon.read_q_aircon()
-
-                # Update temperatures for all rooms
-                self.bdrm_1_temp = self.current_temp
-                self.bdrm_2_temp = self.current_temp
-                self.bath_1_temp = self.current_temp
-                self.living_temp = self.current_temp
-                self.kitchen_temp = self.current_temp
-                self.bdrm_3_temp = self.current_temp
-                self.bath_2_temp = self.current_temp
-                self.mech_rm_temp = self.current_temp
-                self.rec_rm_temp = self.current_temp
-                time.sleep(0.001)
-            self.furnace_status = 0
-            self.fan_speed = "low"
-        except Exception as e:
-            print(f"Error in set_current_temperature_furnace: {e}")
-
-    def control_temperature(self):
-        """
-        Control the indoor temperature by heating or cooling as needed.
-        """
-        try:
-            if self.setpoint > self.current_temp:
-                print("Furnace started heating.")
-                # Heating mode: Activate the furnace
-                self.furnace_status = 1
-                t1 = threading.Thread(target=self.furnace.heating, 
-                                      args=(self.current_temp,self.setpoint,))
-                t2 = threading.Thread(
-                    target=self.set_current_temperature_furnace)
-                t1.start()
-                t2.start()
-                t1.join()
-                t2.join()
-            elif self.setpoint < self.current_temp:
-                print("Air Conditioner started cooling.")
-                # Cooling mode: Activate the AC
-                self.aircon_status=1
-                t1 = threading.Thread(target=self.aircon.Cooling, args=(
-                    self.current_temp, self.setpoint,))
-                t2 = threading.Thread(
-                    target=self.set_current_temperature_aircon)
-                t1.start()
-                t2.start()
-                t1.join()
-                t2.join()
-            else:
-                # Optimal temperature, no action needed
-                print("Temperature is already optimal. No action needed.")
-        except Exception as e:
-            print(f"Error in temperature control: {e}")
-
-    def start_operation_heating_cooling(self, set_point, 
-                                        date_input, time_input):
-        """
-        Start the thermostat controller using the inputs provided by the GUI. 
-        This Function will be called from gui after getting the input from GUI
-        in the dictionary format.
-        
-        set_point: Temperature setpoint to initiate heating/cooling (float)
-        date_input: Date input as yyyy-mm-dd (string)
-        time_input: Time input h:dd (string)
-        """
-        try:
-            self.setpoint = set_point
-            self.date = date_input
-            self.time = time_input
-            
-            # Initializing Models
-            self.model = Model()
-            self.model.load_data_from_csv()
-            self.thermostat = ThermostatModel(self.model.temperature_data)
-            self.fan = FanModel(self.model)
-            self.furnace = FurnaceModel(self.model)
-            self.aircon = AirConditionerModel(self.model)
-            
-            # Set the date and time on the thermostat
-            self.thermostat.set_date_time(self.date, self.time)
-
-            # Get outdoor temperature
-            self.temp_out = float(self.thermostat.get_outdoor_temperature())
-            if self.temp_out is None:
-                raise ValueError("Unable to retrieve outdoor temperature.")
-
-            # Set the thermostat to the desired target temperature
-            set_temp = self.thermostat.set_temperature_value(self.setpoint)
-
-            # Determine the mode (e.g., heating or cooling)
-            self.mode = self.thermostat.set_mode()
-            try:
-                self.fan_status="On"
-                # Set the fan speed based on the mode
-                self.fan_speed = self.fan.set_fan_speed_value(self.mode)
-            
-            except:
-                self.fan_status="Off"
-
-            # in the begining the current temp == outdoor temp
-            self.current_temp = self.temp_out
-            self.control_temperature()
-        except ValueError as ve:
-            print(f"Value error: {ve}")
-        except Exception as e:
-            print(f"An unexpected error occurred: {e}")
-
-    def update_time(self):
-        """
-        Update the time every second.
-        """
-        self.time = QTime.currentTime().toString('HH:mm:ss')
-        self.date = QDate.currentDate().toString('yyyy-MM-dd')
-
-    def update_temperature(self):
-        """
-        Update the current temperature and system status.
-        """
-        print(f"Updating temperature...")
-        self.current_temp = self.thermostat.read_current_temp()
-        self.fan_status = self.fan.read_status()
-        self.fan_speed = self.fan.read_speed()
-        print(f"Current Temperature: {self.current_temp}")
-        print(f"Fan Status: {self.fan_status}")
-        print(f"Fan Speed: {self.fan_speed}")
-
-        
+"""***************************************************************************
+Title:          Controller
+File:           controller.py
+Release Notes:  N/A
+Author:         Aadil Khatri
+Description:    Controls method for the automated HVAC controls
+***************************************************************************"""
+
+"""*********************Libraries ******************************************"""
+from model import Model, ThermostatModel, FanModel
+from model import FurnaceModel, AirConditionerModel
+from model import ZONE_NAMES
+from executor import RunExecutor
+from sensors import SensorBus
+from checkpoint import save_checkpoint, load_checkpoint
+from checkpoint import capture_state, restore_controller
+from replay import RunRecorder
+from staging import StagingStateMachine, MAX_TRANSITIONS
+from energy import EnergyLedger
+from lod import MinMaxPyramid
+import gui
+from PyQt5.QtCore import QTime, QDate
+import threading
+import time
+from PyQt5.QtWidgets import QApplication
+import sys
+
+
+"""*********************Classes********************************************"""
+class ThermostatController:
+    def __init__(self):
+        """
+        Initialize the thermostat, fan, furnace, and air conditioner models.
+        """
+        try:
+            # Persistent workers for heating/cooling runs, the GUI starts
+            # the first run while it is being built
+            self.executor = RunExecutor(max_workers=2, max_queue=8)
+            self.run = None
+
+            # Zone temperatures may also be written by the sensor bus
+            self.zone_lock = threading.Lock()
+            self.sensor_bus = None
+
+            # Heating/cooling runs are traced while recording
+            self.recorder = None
+
+            # Deadband and minimum run times decide when to switch, a
+            # request held back by a minimum time is checked again when
+            # the time is up
+            self.staging = StagingStateMachine()
+            self.run_setpoint = None
+            self.run_stage = None
+            self.control_lock = threading.Lock()
+            self.recheck_lock = threading.Lock()
+            self.recheck = None
+
+            # Energy integrated per appliance and zone with hourly, daily
+            # and monthly totals
+            self.energy = EnergyLedger()
+
+            # Zone, outdoor and stage history sampled by the GUI each second
+            self.history = MinMaxPyramid()
+
+            # Instantiate the GUI
+            app = QApplication(sys.argv)
+            main_window = gui.MainWindow(self)
+            main_window.show()
+            sys.exit(app.exec_())
+            
+            # Initialize general properties taken input from gui
+            self.date = "2024-01-01"
+            self.time = "12:00"
+            self.setpoint = 22
+
+            # Initializing room variables to updated in controller
+            self.aircon_status = 0 # 0: Off and 1: On
+            self.aircon_energy = 0
+            self.furnace_status = 0 # 0: Off and 1: On
+            self.furnace_energy = 0
+            self.fan_status = "Off"
+            self.fan_speed = "Low"
+            self.damper = 100
+            self.mode = "Normal mode"
+            self.current_temp = 22
+            self.airflow = 300
+            self.damp_sup_pos = 100
+            self.damp_ret_pos = 80
+            self.damp_out_pos = 20
+
+            # Outdoor temperature taken from simulation
+            self.temp_out = 27
+
+            # Ground Floor
+            self.bdrm_1_temp = 22
+            self.bdrm_1_damper = 100
+            self.bdrm_2_temp = 22
+            self.bdrm_2_damper = 100
+            self.bath_1_temp = 22
+            self.bath_1_damper = 100
+            self.living_temp = 22
+            self.living_damper = 100
+            self.kitchen_temp = 22
+            self.kitchen_damper = 100
+            
+            # Basement
+            self.bdrm_3_temp = 22
+            self.bdrm_3_damper = 100
+            self.bath_2_temp = 22
+            self.bath_2_damper = 100
+            self.mech_rm_temp = 22
+            self.mech_rm_damper = 100
+            self.rec_rm_temp = 22
+            self.rec_rm_damper = 100
+            
+        except Exception as e:
+            print(f"Error initializing components: {e}")
+            raise
+
+    def system_overview(self):
+        """
+        Returns the mechanical room GUI properties.
+        """
+        try:
+            return [self.bdrm_1_temp, self.bdrm_2_temp, self.bdrm_3_temp, 
+                self.bath_1_temp, self.bath_2_temp, 
+                self.living_temp, self.kitchen_temp, 
+                self.mech_rm_temp, self.rec_rm_temp, 
+                self.temp_out, self.date, self.time, self.mode, 
+                self.furnace_status, self.furnace_energy, 
+                self.aircon_status, self.aircon_energy, 
+                self.fan_status, 
+                self.damp_sup_pos, self.damp_ret_pos, self.damp_out_pos]
+        except AttributeError as e:
+            print(f"Missing attributes in system_overview: {e}")
+            raise
+
+    def mechanical_room(self):
+        """
+        Returns the mechanical room GUI properties.
+        """
+        try:
+            return [self.furnace_status, self.furnace_energy, 
+                self.aircon_status, self.aircon_energy, 
+                self.fan_status, self.fan_speed, self.airflow, 
+                self.damp_sup_pos, self.damp_ret_pos, self.damp_out_pos, 
+                self.temp_out]
+        except AttributeError as e:
+            print(f"Missing attributes in mechanical_room: {e}")
+            raise
+
+    def ground_floor(self):
+        """
+        Returns the ground floor GUI properties.
+        """
+        try:
+            return [self.bdrm_1_temp, self.bdrm_1_damper, 
+                self.bdrm_2_temp, self.bdrm_2_damper, 
+                self.bath_1_temp, self.bath_1_damper, 
+                self.living_temp, self.living_damper, 
+                self.kitchen_temp, self.kitchen_damper, 
+                self.setpoint, self.temp_out]
+        except AttributeError as e:
+            print(f"Missing attributes in ground_floor: {e}")
+            raise
+    
+    def basement(self):
+        """
+        Returns the basement GUI properties.
+        """
+        try:
+            return [self.bdrm_3_temp, self.bdrm_3_damper, 
+                self.bath_2_temp, self.bath_2_damper, 
+                self.mech_rm_temp, self.mech_rm_damper,
+                self.rec_rm_temp, self.rec_rm_damper, 
+                self.setpoint, self.temp_out]
+        except AttributeError as e:
+            print(f"Missing attributes in basement: {e}")
+            raise
+            
+    def settings(self):
+        """
+        Returns the ground floor GUI properties.
+        """
+        try:
+            return [self.date, self.time, self.mode]
+        except AttributeError as e:
+            print(f"Missing attributes in ground_floor: {e}")
+            raise
+
+    def zone_temperatures(self):
+        """
+        Returns the temperature of every zone by zone name.
+        """
+        with self.zone_lock:
+            return {zone: getattr(self, f"{zone}_temp") 
+                    for zone in ZONE_NAMES}
+
+    def update_zone_temperatures(self, temperatures):
+        """
+        Writes measured zone temperatures, called by the sensor bus with one
+        micro batch at a time. While the bus is running the heating and
+        cooling pollers leave the zone temperatures to it.
+        
+        temperatures: Temperature by zone name (dictionary)
+        """
+        with self.zone_lock:
+            for zone, temperature in temperatures.items():
+                if zone in ZONE_NAMES:
+                    setattr(self, f"{zone}_temp", temperature)
+
+    def start_sensor_bus(self, path=None, port=0):
+        """
+        Starts receiving zone sensor readings in the background.
+        
+        path: UNIX-domain socket path, local TCP is used if None (string)
+        port: Local TCP port, any free port if 0 (int)
+        Returns: The socket path or the (host, port) listened on
+        """
+        try:
+            if self.sensor_bus is None:
+                self.sensor_bus = SensorBus(self)
+                return self.sensor_bus.start(path=path, port=port)
+            return self.sensor_bus.address
+        except Exception as e:
+            print(f"Error starting the sensor bus: {e}")
+            self.sensor_bus = None
+
+    def stop_sensor_bus(self):
+        """
+        Stops receiving zone sensor readings, the simulated temperatures of
+        the runs are written to the zones again.
+        """
+        try:
+            if self.sensor_bus is not None:
+                self.sensor_bus.stop()
+                self.sensor_bus = None
+        except Exception as e:
+            print(f"Error stopping the sensor bus: {e}")
+
+    def set_current_temperature_aircon(self, run=None):
+        """
+        Continuously  updates the value of all the features while cooling.
+        
+        run: Handle of the run, polling stops if it is cancelled (RunHandle)
+        """
+        try:
+            last = time.monotonic()
+            while not self.aircon.stop_polling:
+                if run is not None and run.cancelled:
+                    break
+                self.current_temp = self.aircon.read_current_temp()
+                print(f"current_temp: {self.current_temp}")
+                self.aircon_energy = self.aircon.read_q_aircon()
+                # On while polling, the reset of a superseded run of the
+                # same appliance is overwritten
+                self.aircon_status = 1
+                last = self.__record_energy("aircon", self.aircon_energy,
+                                            last)
+
+                # Update temperatures for all rooms, the measured ones win
+                # while the sensor bus is running
+                if self.sensor_bus is None:
+                    with self.zone_lock:
+                        self.bdrm_1_temp = self.current_temp
+                        self.bdrm_2_temp = self.current_temp
+                        self.bath_1_temp = self.current_temp
+                        self.living_temp = self.current_temp
+                        self.kitchen_temp = self.current_temp
+                        self.bdrm_3_temp = self.current_temp
+                        self.bath_2_temp = self.current_temp
+                        self.mech_rm_temp = self.current_temp
+                        self.rec_rm_temp = self.current_temp
+                time.sleep(0.001)
+            self.aircon_status = 0 
+            self.fan_speed = "high"
+        except Exception as e:
+            print(f"Error in set_current_temperature_aircon: {e}")
+        
+    def set_current_temperature_furnace(self, run=None):
+        """
+        Continuously  updates the value of all the features while heating.
+        
+        run: Handle of the run, polling stops if it is cancelled (RunHandle)
+        """
+        try:
+            last = time.monotonic()
+            while not self.furnace.stop_polling:
+                if run is not None and run.cancelled:
+                    break
+                self.current_temp = self.furnace.read_current_temp()
+                print(f"current_temp: {self.current_temp}")
+                self.furnace_energy = self.furnace.read_q_furnace()
+                # On while polling, the reset of a superseded run of the
+                # same appliance is overwritten
+                self.furnace_status = 1
+                last = self.__record_energy("furnace", self.furnace_energy,
+                                            last)
+
+                # Update temperatures for all rooms, the measured ones win
+                # while the sensor bus is running
+                if self.sensor_bus is None:
+                    with self.zone_lock:
+                        self.bdrm_1_temp = self.current_temp
+                        self.bdrm_2_temp = self.current_temp
+                        self.bath_1_temp = self.current_temp
+                        self.living_temp = self.current_temp
+                        self.kitchen_temp = self.current_temp
+                        self.bdrm_3_temp = self.current_temp
+                        self.bath_2_temp = self.current_temp
+                        self.mech_rm_temp = self.current_temp
+                        self.rec_rm_temp = self.current_temp
+                time.sleep(0.001)
+            self.furnace_status = 0
+            self.fan_speed = "low"
+        except Exception as e:
+            print(f"Error in set_current_temperature_furnace: {e}")
+
+    def __record_energy(self, appliance, output, last):
+        """
+        Adds the output held since the last poll to the energy ledger,
+        shared between the zones by their damper positions.
+        
+        appliance: "furnace" or "aircon" (string)
+        output: Current stage output in BTU (float)
+        last: Time of the last poll from time.monotonic() (float)
+        Returns: Time of this poll (float)
+        """
+        now = time.monotonic()
+        try:
+            # Dampers not yet set by the GUI are fully open
+            shares = {zone: getattr(self, f"{zone}_damper", 100) 
+                      for zone in ZONE_NAMES}
+            if not any(share > 0 for share in shares.values()):
+                shares = None
+            self.energy.record(appliance, output, now - last, shares=shares)
+        except Exception as e:
+            # Never stops the polling of the appliance
+            print(f"Error recording energy: {e}")
+        return now
+
+    def energy_totals(self, period=None, bucket=None):
+        """
+        Returns the energy of every appliance and zone, in total or of one
+        hour, day or month.
+        
+        period: "hour", "day" or "month", the total if None (string)
+        bucket: The bucket, e.g. "2024-01", the current one if None (string)
+        """
+        if period is None:
+            read = self.energy.total
+        else:
+            read = lambda **key: self.energy.rollup(period, bucket, **key)
+        totals = {"total": read()}
+        for appliance in self.energy.appliances:
+            totals[appliance] = read(appliance=appliance)
+        for zone in self.energy.zones:
+            totals[zone] = read(zone=zone)
+        return totals
+
+    def record_history(self):
+        """
+        Appends the zone temperatures, outdoor temperature and the net stage
+        output, heating positive and cooling negative, to the history.
+        """
+        try:
+            # Attributes not yet set by the GUI read as the current
+            # temperature and as appliances that are off
+            current = getattr(self, "current_temp", float("nan"))
+            with self.zone_lock:
+                temperatures = [getattr(self, f"{zone}_temp", current) 
+                                for zone in ZONE_NAMES]
+            stage = (getattr(self, "furnace_energy", 0) * 
+                     getattr(self, "furnace_status", 0) - 
+                     getattr(self, "aircon_energy", 0) * 
+                     getattr(self, "aircon_status", 0))
+            self.history.append(temperatures + 
+                                [getattr(self, "temp_out", float("nan")),
+                                 stage])
+        except Exception as e:
+            print(f"Error recording history: {e}")
+
+    def control_temperature(self, setpoint=None, outdoor_temp=None):
+        """
+        Control the indoor temperature by heating or cooling as needed. The
+        staging state machine decides whether to switch and on which stage
+        the model runs, so differences within the deadband or inside the
+        minimum on/off times start no new run. Such a held back request is
+        checked again when the minimum time is up. A new run is handed to
+        the persistent executor and supersedes any run still in flight.
+        
+        setpoint: New temperature setpoint, keeps the current if None (float)
+        outdoor_temp: New outdoor temperature, kept if None (float)
+        Returns: Handle of the submitted run, None if no action (RunHandle)
+        """
+        try:
+            with self.control_lock:
+                if setpoint is not None:
+                    self.setpoint = setpoint
+                if outdoor_temp is not None:
+                    self.temp_out = outdoor_temp
+                start_temp, set_temp = self.current_temp, self.setpoint
+                outdoor = self.temp_out
+                now = time.monotonic()
+                # Apply every transition already due, e.g. off and on again,
+                # bounded as zero deadband and times may never settle
+                for _ in range(MAX_TRANSITIONS):
+                    if not self.staging.update(start_temp, set_temp, now):
+                        break
+                wait = self.staging.deferred(start_temp, set_temp, now)
+                self.__schedule_recheck(wait if wait > 0 else None)
+                mode, stage = self.staging.mode_name, self.staging.stage
+                if (self.run is not None and self.run.label == mode and
+                        self.run_setpoint == set_temp and
+                        self.run_stage == stage):
+                    # The latest run already does what is needed
+                    return self.run
+                if mode == "idle":
+                    mode = "none"
+                trace = None
+                if self.recorder is not None:
+                    appliance = (self.aircon if mode == "cooling"
+                                 else self.furnace)
+                    trace = self.recorder.begin(
+                        mode, start_temp=start_temp, set_temp=set_temp,
+                        outdoor_temp=outdoor, date=self.date,
+                        time=self.time, heat_loss=appliance.heat_loss,
+                        capacity=appliance.capacity,
+                        stage_outputs=appliance.stage_outputs, stage=stage)
+                
+                self.run_setpoint = set_temp
+                self.run_stage = stage
+                if mode == "heating":
+                    print("Furnace started heating.")
+                    # Heating mode: Activate the furnace
+                    self.furnace_status = 1
+                    self.furnace.stop_polling = False
+                    self.run = self.executor.submit(
+                        lambda run: self.__run_model(
+                            self.furnace.heating, outdoor, start_temp,
+                            set_temp, stage, run, trace),
+                        self.set_current_temperature_furnace,
+                        label="heating")
+                elif mode == "cooling":
+                    print("Air Conditioner started cooling.")
+                    # Cooling mode: Activate the AC
+                    self.aircon_status = 1
+                    self.aircon.stop_polling = False
+                    self.run = self.executor.submit(
+                        lambda run: self.__run_model(
+                            self.aircon.cooling, outdoor, start_temp,
+                            set_temp, stage, run, trace),
+                        self.set_current_temperature_aircon,
+                        label="cooling")
+                else:
+                    if trace is not None:
+                        trace.finish(True)
+                    self.executor.cancel_all()
+                    self.run = None
+                    if wait > 0:
+                        # Held back by the minimum off time
+                        print("Waiting for the minimum off time.")
+                    else:
+                        # Optimal temperature, no action needed
+                        print("Temperature is already optimal. "
+                              "No action needed.")
+                return self.run
+        except Exception as e:
+            print(f"Error in temperature control: {e}")
+
+    def __schedule_recheck(self, delay):
+        """
+        Runs control_temperature again after a delay, replacing any check
+        already scheduled.
+        
+        delay: Seconds to wait, only cancels the scheduled check if None
+               (float)
+        """
+        with self.recheck_lock:
+            if self.recheck is not None:
+                self.recheck.cancel()
+                self.recheck = None
+            if delay is not None:
+                self.recheck = threading.Timer(delay,
+                                               self.control_temperature)
+                self.recheck.daemon = True
+                self.recheck.start()
+
+    def __run_model(self, process, outdoor_temp, start_temp, set_temp, stage,
+                    run, trace):
+        """
+        Runs the heating or cooling process of a model on a worker thread.
+        
+        process: FurnaceModel.heating or AirConditionerModel.cooling (method)
+        outdoor_temp: Outdoor temperature of the run (float)
+        start_temp: Temperature at the start of the run (float)
+        set_temp: Temperature setpoint (float)
+        stage: Stage chosen by the staging state machine (int)
+        run: Handle of the run (RunHandle)
+        trace: Trace of the run while recording, else None (RunTrace)
+        """
+        completed = process(outdoor_temp, set_temp, run.cancel_event,
+                            trace=trace, start_temp=start_temp, stage=stage)
+        if trace is not None:
+            trace.finish(completed)
+        if completed:
+            # Let the state machine step down or switch off at the setpoint
+            self.__schedule_recheck(0.0)
+
+    def start_recording(self):
+        """
+        Starts tracing the inputs and stage decisions of every run.
+        """
+        self.recorder = RunRecorder()
+
+    def stop_recording(self, file_path):
+        """
+        Stops tracing and writes the recorded runs for replay.
+        
+        file_path: Path of the log file (string)
+        """
+        try:
+            if self.recorder is None:
+                print("Not recording.")
+                return
+            self.executor.cancel_all()
+            self.executor.join()
+            runs = self.recorder.save(file_path)
+            self.recorder = None
+            print(f"Recorded {runs} runs.")
+        except Exception as e:
+            print(f"Error saving recording: {e}")
+
+    def cycle_counts(self):
+        """
+        Returns the number of furnace and air conditioner starts and stage
+        changes.
+        """
+        return {"heating_cycles": self.staging.heating_cycles,
+                "cooling_cycles": self.staging.cooling_cycles,
+                "stage_changes": self.staging.stage_changes}
+
+    def executor_metrics(self):
+        """
+        Returns the queue depth and run latency of the run executor.
+        """
+        return self.executor.metrics()
+
+    def save_checkpoint(self, file_path):
+        """
+        Saves the settings, model, zone, staging, energy, history and
+        telemetry state to a file.
+        
+        file_path: Path of the checkpoint file (string)
+        """
+        try:
+            size = save_checkpoint(file_path, capture_state(controller=self))
+            print(f"Checkpoint saved ({size} bytes).")
+        except Exception as e:
+            print(f"Error saving checkpoint: {e}")
+
+    def load_checkpoint(self, file_path):
+        """
+        Restores the settings, model, zone, staging, energy and history
+        state saved in a file. The run in flight is cancelled first.
+        
+        file_path: Path of the checkpoint file (string)
+        """
+        try:
+            state = load_checkpoint(file_path)["controller"]
+            self.executor.cancel_all()
+            self.run = None
+            self.run_stage = None
+            restore_controller(self, state)
+            print("Checkpoint restored.")
+        except Exception as e:
+            print(f"Error loading checkpoint: {e}")
+
+    def start_operation_heating_cooling(self, set_point, 
+                                        date_input, time_input):
+        """
+        Start the thermostat controller using the inputs provided by the GUI. 
+        This Function will be called from gui after getting the input from GUI
+        in the dictionary format.
+        
+        set_point: Temperature setpoint to initiate heating/cooling (float)
+        date_input: Date input as yyyy-mm-dd (string)
+        time_input: Time input h:dd (string)
+        """
+        try:
+            self.setpoint = set_point
+            self.date = date_input
+            self.time = time_input
+            
+            # Initializing Models
+            self.model = Model()
+            self.model.load_data_from_csv()
+            self.thermostat = ThermostatModel(self.model.temperature_data)
+            self.fan = FanModel(self.model)
+            self.furnace = FurnaceModel(self.model)
+            self.aircon = AirConditionerModel(self.model)
+            
+            # Set the date and time on the thermostat
+            self.thermostat.set_date_time(self.date, self.time)
+
+            # Get outdoor temperature
+            self.temp_out = float(self.thermostat.get_outdoor_temperature())
+            if self.temp_out is None:
+                raise ValueError("Unable to retrieve outdoor temperature.")
+
+            # Set the thermostat to the desired target temperature
+            set_temp = self.thermostat.set_temperature_value(self.setpoint)
+
+            # Determine the mode (e.g., heating or cooling)
+            self.mode = self.thermostat.set_mode()
+            try:
+                self.fan_status="On"
+                # Set the fan speed based on the mode
+                self.fan_speed = self.fan.set_fan_speed_value(self.mode)
+            
+            except:
+                self.fan_status="Off"
+
+            # in the begining the current temp == outdoor temp
+            self.current_temp = self.temp_out
+            self.control_temperature()
+        except ValueError as ve:
+            print(f"Value error: {ve}")
+        except Exception as e:
+            print(f"An unexpected error occurred: {e}")
+
+    def update_time(self):
+        """
+        Update the time every second.
+        """
+        self.time = QTime.currentTime().toString('HH:mm:ss')
+        self.date = QDate.currentDate().toString('yyyy-MM-dd')
+
+    def update_temperature(self):
+        """
+        Update the current temperature and system status.
+        """
+        print(f"Updating temperature...")
+        self.current_temp = self.thermostat.read_current_temp()
+        self.fan_status = self.fan.read_status()
+        self.fan_speed = self.fan.read_speed()
+        print(f"Current Temperature: {self.current_temp}")
+        print(f"Fan Status: {self.fan_status}")
+        print(f"Fan Speed: {self.fan_speed}")
+
+        
@@ -0,0 +1,264 @@
+"""***************************************************************************
+Title:          Energy
+File:           energy.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Running energy accounts of the furnace and air conditioner.
+                The output of an appliance is integrated over time per
+                appliance and per zone with compensated (Kahan) summation,
+                and the hourly, daily and monthly totals are kept up to
+                date as energy is recorded, so reading any total is a
+                dictionary lookup instead of a scan of the history.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import copy
+from datetime import datetime, timedelta
+import threading
+from model import TIME_STEP, ZONE_NAMES
+
+
+"""*********************Global*********************************************"""
+APPLIANCES = ("furnace", "aircon")
+
+# Bucket key of every rollup period
+PERIOD_FORMATS = {"hour": "%Y-%m-%d %H:00",
+                  "day": "%Y-%m-%d",
+                  "month": "%Y-%m"}
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class KahanSum:
+    """
+    Sum of many small terms without the rounding drift of a plain float.
+    """
+    def __init__(self, value=0.0):
+        """
+        value: Starting value (float)
+        """
+        self.value = float(value)
+        self.__compensation = 0.0  # Low order bits lost by the last add
+
+    def add(self, term):
+        """
+        Adds a term to the sum.
+
+        term: Value to add (float)
+        """
+        corrected = term - self.__compensation
+        total = self.value + corrected
+        self.__compensation = (total - self.value) - corrected
+        self.value = total
+
+    def __float__(self):
+        return self.value
+
+    def __repr__(self):
+        return f"KahanSum({self.value!r})"
+
+
+'========================================='
+class EnergyLedger:
+    """
+    Energy delivered by every appliance to every zone, in total and rolled
+    up by hour, day and month. Energy is the stage output in BTU per model
+    iteration times the number of iterations it was held, the unit used
+    by ThermalSimulation.
+    """
+    def __init__(self, appliances=APPLIANCES, zones=ZONE_NAMES):
+        """
+        Initializes empty accounts.
+
+        appliances: Names of the appliances (tuple)
+        zones: Names of the zones (tuple)
+        """
+        self.appliances = tuple(appliances)
+        self.zones = tuple(zones)
+        self.__lock = threading.Lock()
+        self.__totals = {}
+        self.__rollups = {period: {} for period in PERIOD_FORMATS}
+        self.__current = (None, None)  # Hour and accounts of the last add
+
+    def record(self, appliance, output, seconds, end=None, shares=None):
+        """
+        Records an appliance holding an output for a time. An interval
+        that spans the end of an hour is split between the buckets.
+
+        appliance: Name of the appliance (string)
+        output: Stage output in BTU per model iteration (float)
+        seconds: Time the output was held in seconds (float)
+        end: Time the interval ended, now if None (datetime)
+        shares: Weight of every zone, e.g. its damper position, shared
+                equally if None (dictionary)
+        Returns: The energy recorded (float)
+        """
+        if appliance not in self.appliances:
+            raise ValueError(f"Unknown appliance '{appliance}'.")
+        if seconds < 0:
+            raise ValueError("The interval must not be negative.")
+        energy = output * seconds / TIME_STEP
+        if energy == 0:
+            return 0.0
+        fractions = self.__fractions(shares)
+        end = datetime.now() if end is None else end
+
+        with self.__lock:
+            # Split at the hour boundaries, days and months follow hours
+            remaining = timedelta(seconds=seconds)
+            while remaining > timedelta(0):
+                hour_start = end.replace(minute=0, second=0, microsecond=0)
+                if hour_start == end:
+                    hour_start -= timedelta(hours=1)
+                part = min(remaining, end - hour_start)
+                self.__add(appliance, fractions,
+                           energy * (part / timedelta(seconds=seconds)),
+                           hour_start)
+                remaining -= part
+                end -= part
+        return energy
+
+    def state(self):
+        """
+        Returns: Copy of the totals and rollups, see restore (dictionary)
+        """
+        with self.__lock:
+            return copy.deepcopy({"appliances": self.appliances,
+                                  "zones": self.zones,
+                                  "totals": self.__totals,
+                                  "rollups": self.__rollups})
+
+    def restore(self, state):
+        """
+        Continues from saved totals and rollups.
+
+        state: A state returned by state() (dictionary)
+        """
+        with self.__lock:
+            self.appliances = tuple(state["appliances"])
+            self.zones = tuple(state["zones"])
+            self.__totals = copy.deepcopy(state["totals"])
+            self.__rollups = copy.deepcopy(state["rollups"])
+            self.__current = (None, None)
+
+    def __fractions(self, shares):
+        """
+        Returns: Fraction of the energy going to every zone (dictionary)
+        """
+        if shares is None:
+            return {zone: 1 / len(self.zones) for zone in self.zones}
+        unknown = set(shares) - set(self.zones)
+        if unknown:
+            raise ValueError(f"Unknown zones {sorted(unknown)}.")
+        total = sum(max(weight, 0) for weight in shares.values())
+        if total <= 0:
+            raise ValueError("At least one zone must have a positive share.")
+        return {zone: max(weight, 0) / total
+                for zone, weight in shares.items() if weight > 0}
+
+    def __add(self, appliance, fractions, energy, hour):
+        """
+        Adds energy of one hour to the total and every rollup.
+        """
+        # Readings arrive in order, so the buckets rarely change
+        current_hour, accounts = self.__current
+        if hour != current_hour:
+            accounts = [self.__totals]
+            for period, period_format in PERIOD_FORMATS.items():
+                bucket = hour.strftime(period_format)
+                accounts.append(self.__rollups[period].setdefault(bucket, {}))
+            self.__current = (hour, accounts)
+        for account in accounts:
+            self.__account(account, None).add(energy)
+            self.__account(account, ("appliance", appliance)).add(energy)
+            for zone, fraction in fractions.items():
+                self.__account(account, ("zone", zone)).add(energy * fraction)
+                self.__account(account, (appliance, zone)).add(
+                    energy * fraction)
+
+    @staticmethod
+    def __account(account, key):
+        """
+        Returns: The running sum of a key, created if new (KahanSum)
+        """
+        total = account.get(key)
+        if total is None:
+            total = account[key] = KahanSum()
+        return total
+
+    @staticmethod
+    def __key(appliance, zone):
+        """
+        Returns: Key of the account of an appliance and/or zone (tuple)
+        """
+        if appliance is None and zone is None:
+            return None
+        if zone is None:
+            return ("appliance", appliance)
+        if appliance is None:
+            return ("zone", zone)
+        return (appliance, zone)
+
+    def total(self, appliance=None, zone=None):
+        """
+        Returns the energy recorded since the ledger was created.
+
+        appliance: Only this appliance, every appliance if None (string)
+        zone: Only this zone, every zone if None (string)
+        Returns: The energy (float)
+        """
+        total = self.__totals.get(self.__key(appliance, zone))
+        return 0.0 if total is None else total.value
+
+    def rollup(self, period, bucket=None, appliance=None, zone=None):
+        """
+        Returns the energy of one hour, day or month.
+
+        period: "hour", "day" or "month" (string)
+        bucket: The bucket, e.g. "2024-01-01 12:00", "2024-01-01" or
+                "2024-01", the current one if None (string)
+        appliance: Only this appliance, every appliance if None (string)
+        zone: Only this zone, every zone if None (string)
+        Returns: The energy (float)
+        """
+        if period not in PERIOD_FORMATS:
+            raise ValueError(f"Unknown period '{period}'.")
+        if bucket is None:
+            bucket = datetime.now().strftime(PERIOD_FORMATS[period])
+        total = self.__rollups[period].get(bucket, {}).get(
+            self.__key(appliance, zone))
+        return 0.0 if total is None else total.value
+
+    def series(self, period, appliance=None, zone=None):
+        """
+        Returns the energy of every bucket of a period recorded so far.
+
+        period: "hour", "day" or "month" (string)
+        appliance: Only this appliance, every appliance if None (string)
+        zone: Only this zone, every zone if None (string)
+        Returns: Energy per bucket in time order (dictionary)
+        """
+        if period not in PERIOD_FORMATS:
+            raise ValueError(f"Unknown period '{period}'.")
+        key = self.__key(appliance, zone)
+        with self.__lock:
+            buckets = sorted(self.__rollups[period].items())
+        return {bucket: account[key].value if key in account else 0.0
+                for bucket, account in buckets}
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration with a simulated day of one second readings
+    ledger = EnergyLedger()
+    start = datetime(2024, 1, 1)
+    naive = 0.0
+    for second in range(1, 24 * 3600 + 1):
+        output = 300 if second % 600 < 300 else 0.1
+        naive += output / TIME_STEP
+        ledger.record("furnace", output, 1.0, start + timedelta(
+            seconds=second), shares={"living": 2, "kitchen": 1})
+    print(f"Total {ledger.total():.6f}, living "
+          f"{ledger.total(zone='living'):.6f}, plain sum {naive:.6f}")
+    print("Hour 12:", ledger.rollup("hour", "2024-01-01 12:00"))
+    print("Day:", ledger.rollup("day", "2024-01-01", appliance="furnace"))
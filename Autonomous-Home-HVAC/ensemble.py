@@ -0,0 +1,329 @@
+"""***************************************************************************
+Title:          Ensemble
+File:           ensemble.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Monte Carlo estimates of energy use and comfort under
+                weather uncertainty. The outdoor series is perturbed by
+                configurable noise and bias models, every member runs as
+                one zone of the vectorized thermal simulation, chunks of
+                members run across a process pool, and the results are
+                folded into streaming histograms so memory stays bounded
+                however many members are run.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import os
+from multiprocessing import Pool
+import numpy as np
+from model import HEAT_LOSS_COEFFICIENT, THERMAL_CAPACITY
+from simulation import ThermalSimulation, DEFAULT_STEP_SECONDS
+
+
+"""*********************Global*********************************************"""
+METRICS = ("heating_energy", "cooling_energy", "total_energy",
+           "comfort_deviation")
+PERCENTILES = (5, 25, 50, 75, 95)
+HISTOGRAM_BINS = 4096
+
+# Weather and settings of every worker process, set by _attach_settings
+_settings = None
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def _attach_settings(settings):
+    """
+    Pool initializer, keeps the ensemble settings in the worker.
+
+    settings: Weather, perturbations and simulation options (dictionary)
+    """
+    global _settings
+    _settings = settings
+
+
+def _simulate_chunk(chunk):
+    """
+    Simulates one chunk of members, every member one zone.
+
+    chunk: Number of members and seed of the chunk (tuple)
+    Returns: The value of every metric per member and period
+             (dictionary of members x periods arrays)
+    """
+    members, seed = chunk
+    settings = _settings
+    rng = np.random.default_rng(seed)
+    outdoor = settings["outdoor"]
+    weather = np.repeat(outdoor[:, None], members, axis=1)
+    for perturbation in settings["perturbations"]:
+        weather += perturbation.sample(rng, len(outdoor), members)
+
+    simulation = ThermalSimulation(
+        weather, setpoints=settings["setpoint"], zones=members,
+        heat_loss=settings["heat_loss"], capacity=settings["capacity"],
+        step_seconds=settings["step_seconds"])
+
+    # Cumulative metrics at the end of every period
+    period_hours = settings["period_hours"]
+    periods = -(-len(outdoor) // period_hours)
+    values = {metric: np.empty((members, periods)) for metric in METRICS}
+    for period in range(periods):
+        simulation.run(hours=period_hours)
+        values["heating_energy"][:, period] = simulation.heating_energy
+        values["cooling_energy"][:, period] = simulation.cooling_energy
+        values["comfort_deviation"][:, period] = \
+            simulation.comfort_deviation
+    values["total_energy"] = (values["heating_energy"] +
+                              values["cooling_energy"])
+    return values
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class GaussianNoise:
+    """
+    Independent noise on every hourly reading.
+    """
+    def __init__(self, sigma=1.0):
+        """
+        sigma: Standard deviation in °C (float)
+        """
+        self.sigma = sigma
+
+    def sample(self, rng, hours, members):
+        """
+        Returns: Perturbation of every hour and member (array)
+        """
+        return rng.normal(0.0, self.sigma, (hours, members))
+
+
+'========================================='
+class AutoregressiveNoise:
+    """
+    Noise correlated from hour to hour (AR(1)), like a forecast error that
+    persists for a while.
+    """
+    def __init__(self, sigma=1.5, correlation=0.9):
+        """
+        sigma: Stationary standard deviation in °C (float)
+        correlation: Correlation of consecutive hours, 0 to below 1 (float)
+        """
+        if not 0 <= correlation < 1:
+            raise ValueError("The correlation must be in [0, 1).")
+        self.sigma = sigma
+        self.correlation = correlation
+
+    def sample(self, rng, hours, members):
+        """
+        Returns: Perturbation of every hour and member (array)
+        """
+        innovation = rng.normal(0.0, self.sigma *
+                                np.sqrt(1 - self.correlation ** 2),
+                                (hours, members))
+        noise = np.empty((hours, members))
+        noise[0] = rng.normal(0.0, self.sigma, members)
+        for hour in range(1, hours):
+            noise[hour] = self.correlation * noise[hour - 1] + \
+                innovation[hour]
+        return noise
+
+
+'========================================='
+class BiasOffset:
+    """
+    A constant offset of the whole series per member, e.g. a warmer or
+    colder year than the reference.
+    """
+    def __init__(self, sigma=1.0, mean=0.0):
+        """
+        sigma: Standard deviation of the offset in °C (float)
+        mean: Mean offset in °C (float)
+        """
+        self.sigma = sigma
+        self.mean = mean
+
+    def sample(self, rng, hours, members):
+        """
+        Returns: Perturbation of every hour and member (array)
+        """
+        return np.broadcast_to(rng.normal(self.mean, self.sigma, members),
+                               (hours, members))
+
+
+'========================================='
+class StreamingHistogram:
+    """
+    Histogram over a range that grows as values arrive, for quantiles of
+    any number of values in fixed memory. Quantiles are accurate to about
+    one bin width.
+    """
+    def __init__(self, bins=HISTOGRAM_BINS):
+        """
+        bins: Number of bins (int)
+        """
+        self.bins = bins
+        self.counts = np.zeros(bins)
+        self.low = None
+        self.high = None
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+
+    def add(self, values):
+        """
+        Adds values to the histogram.
+
+        values: New values (array)
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        if not values.size:
+            return
+        low, high = values.min(), values.max()
+        if self.low is None:
+            self.low = low
+            self.high = high if high > low else low + max(abs(low), 1.0)
+        while low < self.low or high >= self.high:
+            self.__widen(low < self.low)
+        counts, _ = np.histogram(values, self.bins,
+                                 (self.low, self.high))
+        self.counts += counts
+        self.count += values.size
+        self.total += values.sum()
+        self.total_squares += np.square(values).sum()
+
+    def __widen(self, downward):
+        """
+        Doubles the range, merging pairs of bins.
+        """
+        width = self.high - self.low
+        merged = self.counts.reshape(-1, 2).sum(axis=1)
+        if downward:
+            self.low -= width
+            self.counts = np.concatenate([np.zeros(self.bins // 2), merged])
+        else:
+            self.high += width
+            self.counts = np.concatenate([merged, np.zeros(self.bins // 2)])
+
+    @property
+    def mean(self):
+        """
+        Returns: The mean of the values (float)
+        """
+        return self.total / self.count if self.count else np.nan
+
+    @property
+    def std(self):
+        """
+        Returns: The standard deviation of the values (float)
+        """
+        if not self.count:
+            return np.nan
+        variance = self.total_squares / self.count - self.mean ** 2
+        return float(np.sqrt(max(variance, 0.0)))
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """
+        Returns: The percentiles of the values, linear within a bin (array)
+        """
+        if not self.count:
+            return np.full(len(percentiles), np.nan)
+        edges = np.linspace(self.low, self.high, self.bins + 1)
+        cumulative = np.concatenate([[0.0], np.cumsum(self.counts)])
+        return np.interp(np.asarray(percentiles) / 100 * self.count,
+                         cumulative, edges)
+
+
+'========================================='
+class WeatherEnsemble:
+    """
+    Runs many perturbed copies of the weather through the thermal
+    simulation and reduces the results as they arrive.
+    """
+    def __init__(self, outdoor_temperatures, perturbations=None,
+                 setpoint=22.0, heat_loss=HEAT_LOSS_COEFFICIENT,
+                 capacity=THERMAL_CAPACITY, step_seconds=DEFAULT_STEP_SECONDS,
+                 period_hours=24 * 30, processes=None, chunk_size=256):
+        """
+        Initializes the ensemble.
+
+        outdoor_temperatures: Hourly reference weather (array)
+        perturbations: Noise and bias models added to the weather, one
+                       AR(1) noise and one bias if None (list)
+        setpoint: Setpoint of the simulated zone (float)
+        heat_loss: Heat loss coefficient U of the zone (float)
+        capacity: Thermal capacity C of the zone (float)
+        step_seconds: Simulated seconds between control decisions (int)
+        period_hours: Hours between the points of the percentile bands (int)
+        processes: Number of worker processes, one per core if None (int)
+        chunk_size: Members simulated together by a worker (int)
+        """
+        self.outdoor_temperatures = np.asarray(outdoor_temperatures,
+                                               dtype=np.float64)
+        if perturbations is None:
+            perturbations = [AutoregressiveNoise(), BiasOffset()]
+        self.settings = {"outdoor": self.outdoor_temperatures,
+                         "perturbations": list(perturbations),
+                         "setpoint": setpoint, "heat_loss": heat_loss,
+                         "capacity": capacity, "step_seconds": step_seconds,
+                         "period_hours": period_hours}
+        self.periods = -(-len(self.outdoor_temperatures) // period_hours)
+        self.processes = processes or os.cpu_count()
+        self.chunk_size = chunk_size
+
+    def run(self, members, seed=0):
+        """
+        Simulates the members and returns their percentile bands. The
+        result depends on the seed and chunk size, not on the number of
+        processes.
+
+        members: Number of ensemble members (int)
+        seed: Seed of the perturbations (int)
+        Returns: Per metric the mean, standard deviation and percentiles at
+                 the end of every period (dictionary)
+        """
+        sizes = [min(self.chunk_size, members - start)
+                 for start in range(0, members, self.chunk_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        histograms = {metric: [StreamingHistogram()
+                               for _ in range(self.periods)]
+                      for metric in METRICS}
+
+        with Pool(self.processes, initializer=_attach_settings,
+                  initargs=(self.settings,)) as pool:
+            # In order, so the histogram ranges grow the same way however
+            # many processes there are
+            for values in pool.imap(_simulate_chunk, zip(sizes, seeds)):
+                for metric in METRICS:
+                    for period, histogram in enumerate(histograms[metric]):
+                        histogram.add(values[metric][:, period])
+
+        bands = {"members": members, "percentiles": PERCENTILES,
+                 "period_hours": self.settings["period_hours"]}
+        for metric in METRICS:
+            bands[metric] = {
+                "mean": np.array([h.mean for h in histograms[metric]]),
+                "std": np.array([h.std for h in histograms[metric]]),
+                "bands": np.array([h.percentiles()
+                                   for h in histograms[metric]]),
+            }
+        return bands
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration with 2000 members of a synthetic year
+    import time
+    hours = np.arange(24 * 365)
+    outdoor = (8 + 12 * np.sin(2 * np.pi * (hours / 24 - 110) / 365) +
+               5 * np.sin(2 * np.pi * hours / 24))
+    ensemble = WeatherEnsemble(outdoor, period_hours=24 * 73)
+    start = time.perf_counter()
+    result = ensemble.run(2000, seed=1)
+    print(f"{result['members']} members in "
+          f"{time.perf_counter() - start:.1f} s")
+    for metric in ("total_energy", "comfort_deviation"):
+        print(metric, "percentiles", result["percentiles"])
+        for period, band in enumerate(result[metric]["bands"]):
+            print(f"  to hour {(period + 1) * result['period_hours']}:",
+                  np.round(band, -3 if metric == "total_energy" else 1))
@@ -0,0 +1,282 @@
+"""***************************************************************************
+Title:          Run Executor
+File:           executor.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    A persistent pool of worker threads for the heating and
+                cooling runs of the controller. A new run supersedes the
+                one in flight instead of stacking new threads, the queue is
+                bounded for back-pressure, and queue depth and run latency
+                are tracked.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import itertools
+import queue
+import threading
+import time
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class RunHandle:
+    """
+    Tracks one run, made of one or more tasks sharing a cancel flag.
+    """
+    def __init__(self, run_id, label, tasks):
+        """
+        Initializes the handle when the run is submitted.
+
+        run_id: Sequential identifier of the run (int)
+        label: Description of the run, e.g. "heating" (string)
+        tasks: Number of tasks in the run (int)
+        """
+        self.run_id = run_id
+        self.label = label
+        self.cancel_event = threading.Event()
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+        self.errors = []
+        self.__remaining = tasks
+        self.__done_event = threading.Event()
+        self.__lock = threading.Lock()
+
+    def __repr__(self):
+        """
+        Returns: The run and its state (string)
+        """
+        if self.cancelled:
+            state = "cancelled"
+        elif self.done():
+            state = "done"
+        else:
+            state = "running" if self.started_at else "queued"
+        return f"<RunHandle {self.run_id} {self.label} {state}>"
+
+    def cancel(self):
+        """
+        Requests the run to stop. Tasks not yet started are skipped and
+        running tasks stop at their next check of cancel_event.
+        """
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        """
+        Returns: True if the run was cancelled (bool)
+        """
+        return self.cancel_event.is_set()
+
+    def done(self):
+        """
+        Returns: True once every task of the run has returned (bool)
+        """
+        return self.__done_event.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Blocks until the run is done.
+
+        timeout: Maximum wait in seconds, forever if None (float)
+        Returns: True if the run is done (bool)
+        """
+        return self.__done_event.wait(timeout)
+
+    @property
+    def latency(self):
+        """
+        Returns: Seconds from submission to completion, None if running
+        """
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.submitted_at
+
+    def _task_started(self):
+        """
+        Records the start of the first task.
+        """
+        with self.__lock:
+            if self.started_at is None:
+                self.started_at = time.perf_counter()
+
+    def _task_finished(self):
+        """
+        Records the end of a task.
+
+        Returns: True if it was the last task of the run (bool)
+        """
+        with self.__lock:
+            self.__remaining -= 1
+            if self.__remaining:
+                return False
+            self.finished_at = time.perf_counter()
+        self.__done_event.set()
+        return True
+
+
+'========================================='
+class RunExecutor:
+    """
+    Persistent worker threads that execute runs submitted by the controller.
+    """
+    def __init__(self, max_workers=2, max_queue=8):
+        """
+        Starts the worker threads.
+
+        max_workers: Number of worker threads, at least the number of tasks
+                     that must run together in one run (int)
+        max_queue: Maximum number of queued tasks before submit blocks (int)
+        """
+        self.__tasks = queue.Queue(maxsize=max_queue)
+        self.__lock = threading.Lock()
+        self.__ids = itertools.count(1)
+        self.__active = []
+        self.__running = True
+
+        # Metrics
+        self.__submitted = 0
+        self.__completed = 0
+        self.__cancelled = 0
+        self.__total_latency = 0.0
+        self.__last_latency = None
+        self.__max_latency = 0.0
+
+        self.__workers = [threading.Thread(target=self.__worker,
+                                           name=f"hvac-run-{i}", daemon=True)
+                          for i in range(max_workers)]
+        for worker in self.__workers:
+            worker.start()
+
+    def submit(self, *targets, label="run", supersede=True, timeout=None):
+        """
+        Submits a run whose tasks execute together on the worker threads.
+        Every target is called with the RunHandle as its only argument.
+
+        targets: Callables making up the run (functions)
+        label: Description of the run (string)
+        supersede: Cancel the runs still queued or in flight (bool)
+        timeout: Seconds to wait for queue space, forever if None (float)
+        Returns: The handle of the new run (RunHandle)
+        Raises: queue.Full if the queue stays full past the timeout
+        """
+        if not self.__running:
+            raise RuntimeError("The executor has been shut down.")
+        if not targets:
+            raise ValueError("At least one task is required for a run.")
+
+        with self.__lock:
+            if supersede:
+                for run in self.__active:
+                    run.cancel()
+            run = RunHandle(next(self.__ids), label, len(targets))
+            self.__active.append(run)
+            self.__submitted += 1
+
+        # Blocks while the queue is full, which throttles the caller
+        for target in targets:
+            self.__tasks.put((run, target), timeout=timeout)
+        return run
+
+    def cancel_all(self):
+        """
+        Cancels every run still queued or in flight.
+        """
+        with self.__lock:
+            for run in self.__active:
+                run.cancel()
+
+    def join(self, timeout=None):
+        """
+        Blocks until every run submitted so far is done.
+
+        timeout: Maximum wait in seconds per run, forever if None (float)
+        """
+        with self.__lock:
+            runs = list(self.__active)
+        for run in runs:
+            run.wait(timeout)
+
+    @property
+    def queue_depth(self):
+        """
+        Returns: The number of tasks waiting for a worker (int)
+        """
+        return self.__tasks.qsize()
+
+    @property
+    def in_flight(self):
+        """
+        Returns: The number of runs not yet done (int)
+        """
+        with self.__lock:
+            return len(self.__active)
+
+    def metrics(self):
+        """
+        Returns: Queue depth, run counts and run latency in seconds (dict)
+        """
+        with self.__lock:
+            finished = self.__completed + self.__cancelled
+            return {
+                "queue_depth": self.__tasks.qsize(),
+                "in_flight": len(self.__active),
+                "submitted": self.__submitted,
+                "completed": self.__completed,
+                "cancelled": self.__cancelled,
+                "last_latency": self.__last_latency,
+                "mean_latency": (self.__total_latency / finished
+                                 if finished else None),
+                "max_latency": self.__max_latency,
+            }
+
+    def shutdown(self, wait=True):
+        """
+        Cancels all runs and stops the worker threads.
+
+        wait: Block until the workers have exited (bool)
+        """
+        self.__running = False
+        self.cancel_all()
+        for _ in self.__workers:
+            self.__tasks.put((None, None))
+        if wait:
+            for worker in self.__workers:
+                worker.join()
+
+    def __worker(self):
+        """
+        Takes tasks from the queue until shut down.
+        """
+        while True:
+            run, target = self.__tasks.get()
+            if run is None:
+                break
+            try:
+                # Superseded runs are skipped without running their tasks
+                if not run.cancelled:
+                    run._task_started()
+                    target(run)
+            except Exception as e:
+                run.errors.append(e)
+                print(f"Error in {run.label} run {run.run_id}: {e}")
+            finally:
+                if run._task_finished():
+                    self.__record(run)
+
+    def __record(self, run):
+        """
+        Updates the metrics when a run is done.
+
+        run: The finished run (RunHandle)
+        """
+        with self.__lock:
+            self.__active.remove(run)
+            if run.cancelled:
+                self.__cancelled += 1
+            else:
+                self.__completed += 1
+            latency = run.latency
+            self.__last_latency = latency
+            self.__total_latency += latency
+            self.__max_latency = max(self.__max_latency, latency)
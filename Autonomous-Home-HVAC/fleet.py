@@ -0,0 +1,196 @@
+"""***************************************************************************
+Title:          Fleet
+File:           fleet.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Simulates a portfolio of homes in parallel. Homes are split
+                into shards across a process pool, every worker attaches to
+                one shared-memory copy of the weather array, and each worker
+                appends its results to its own output file so no locking is
+                needed until the files are merged.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import os
+import glob
+from multiprocessing import Pool, shared_memory
+import numpy as np
+import pandas as pd
+from model import HEAT_LOSS_COEFFICIENT, THERMAL_CAPACITY, ZONE_NAMES
+from simulation import ThermalSimulation, DEFAULT_STEP_SECONDS
+
+
+"""*********************Global*********************************************"""
+# Properties of a home when not given in its description
+HOME_DEFAULTS = {
+    "zones": len(ZONE_NAMES),
+    "setpoint": 22.0,
+    "heat_loss": HEAT_LOSS_COEFFICIENT,
+    "capacity": THERMAL_CAPACITY,
+    "initial_temp": None,  # The first outdoor temperature
+}
+
+RESULT_COLUMNS = ["home_id", "zones", "heating_energy", "cooling_energy",
+                  "heating_cycles", "cooling_cycles", "comfort_deviation",
+                  "final_temperature"]
+
+# Weather attached by every worker process in _attach_weather
+_weather = None
+_weather_memory = None
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def _attach_weather(name, shape, dtype):
+    """
+    Pool initializer, maps the shared weather array into the worker.
+
+    name: Name of the shared memory block (string)
+    shape: Shape of the weather array (tuple)
+    dtype: Data type of the weather array (string)
+    """
+    global _weather, _weather_memory
+    _weather_memory = shared_memory.SharedMemory(name=name)
+    _weather = np.ndarray(shape, dtype=dtype, buffer=_weather_memory.buf)
+
+
+def _simulate_shard(shard):
+    """
+    Simulates every zone of a shard of homes in one vectorized simulation
+    and appends one row per home to the output file of this worker.
+
+    shard: Homes, output directory and step size (tuple)
+    Returns: The number of homes simulated (int)
+    """
+    homes, output_dir, step_seconds = shard
+
+    # Repeat each home's properties once per zone
+    zones = np.array([home["zones"] for home in homes])
+    def per_zone(key):
+        return np.repeat([home[key] for home in homes], zones)
+    initial = [home["initial_temp"] if home["initial_temp"] is not None
+               else _weather[0] for home in homes]
+
+    simulation = ThermalSimulation(
+        _weather, setpoints=per_zone("setpoint"), zones=int(zones.sum()),
+        heat_loss=per_zone("heat_loss"), capacity=per_zone("capacity"),
+        initial_temperatures=np.repeat(initial, zones),
+        step_seconds=step_seconds)
+    simulation.run()
+    summary = simulation.summary()
+
+    # Sum the zones of each home
+    starts = np.concatenate([[0], np.cumsum(zones)[:-1]])
+    rows = {"home_id": [home["home_id"] for home in homes], "zones": zones}
+    for key in RESULT_COLUMNS[2:-1]:
+        rows[key] = np.add.reduceat(summary[key], starts)
+    rows["final_temperature"] = (np.add.reduceat(summary["temperature"],
+                                                starts) / zones)
+
+    # One file per worker process, so appends never contend
+    output_file = os.path.join(output_dir, f"fleet-worker-{os.getpid()}.csv")
+    pd.DataFrame(rows, columns=RESULT_COLUMNS).to_csv(
+        output_file, mode="a", index=False,
+        header=not os.path.exists(output_file))
+    return len(homes)
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class FleetRunner:
+    """
+    Runs the thermal simulation of many homes across a process pool.
+    """
+    def __init__(self, outdoor_temperatures, processes=None, shard_size=256,
+                 step_seconds=DEFAULT_STEP_SECONDS):
+        """
+        Initializes the runner.
+
+        outdoor_temperatures: Hourly outdoor temperatures (array)
+        processes: Number of worker processes, one per core if None (int)
+        shard_size: Number of homes simulated together by a worker (int)
+        step_seconds: Simulated seconds between control decisions (int)
+        """
+        self.outdoor_temperatures = np.ascontiguousarray(
+            outdoor_temperatures, dtype=np.float64)
+        self.processes = processes or os.cpu_count()
+        self.shard_size = shard_size
+        self.step_seconds = step_seconds
+
+    @staticmethod
+    def describe_homes(homes):
+        """
+        Fills in the default properties of every home.
+
+        homes: Home descriptions, e.g. {"setpoint": 21} (list of dict)
+        Returns: Complete home descriptions with a home_id (list of dict)
+        """
+        described = []
+        for i, home in enumerate(homes):
+            home = {**HOME_DEFAULTS, "home_id": i, **home}
+            if home["zones"] < 1:
+                raise ValueError(f"Home {home['home_id']} has no zones.")
+            described.append(home)
+        return described
+
+    def run(self, homes, output_dir):
+        """
+        Simulates every home and merges the per-worker result files.
+
+        homes: Home descriptions, see describe_homes (list of dict)
+        output_dir: Directory for the per-worker result files (string)
+        Returns: One row of results per home, ordered by home_id (DataFrame)
+        """
+        homes = self.describe_homes(homes)
+        os.makedirs(output_dir, exist_ok=True)
+        for old_file in glob.glob(os.path.join(output_dir,
+                                               "fleet-worker-*.csv")):
+            os.remove(old_file)
+
+        shards = [(homes[i:i + self.shard_size], output_dir,
+                   self.step_seconds)
+                  for i in range(0, len(homes), self.shard_size)]
+
+        # Single copy of the weather for every worker
+        weather = self.outdoor_temperatures
+        memory = shared_memory.SharedMemory(create=True, size=weather.nbytes)
+        try:
+            np.ndarray(weather.shape, dtype=weather.dtype,
+                       buffer=memory.buf)[:] = weather
+            with Pool(self.processes, initializer=_attach_weather,
+                      initargs=(memory.name, weather.shape,
+                                weather.dtype.str)) as pool:
+                simulated = sum(pool.imap_unordered(_simulate_shard, shards))
+        finally:
+            memory.close()
+            memory.unlink()
+        print(f"Simulated {simulated} homes.")
+        return self.collect(output_dir)
+
+    @staticmethod
+    def collect(output_dir):
+        """
+        Merges the per-worker result files.
+
+        output_dir: Directory of the per-worker result files (string)
+        Returns: One row of results per home, ordered by home_id (DataFrame)
+        """
+        files = sorted(glob.glob(os.path.join(output_dir,
+                                              "fleet-worker-*.csv")))
+        if not files:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+        results = pd.concat([pd.read_csv(file) for file in files],
+                            ignore_index=True)
+        return results.sort_values("home_id", ignore_index=True)
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration with a week of synthetic weather and 100 homes
+    hours = np.arange(24 * 7)
+    outdoor = 5 + 10 * np.sin(2 * np.pi * hours / 24)
+    rng = np.random.default_rng(0)
+    homes = [{"setpoint": rng.uniform(20, 23),
+              "heat_loss": rng.uniform(8, 12)} for _ in range(100)]
+    runner = FleetRunner(outdoor, shard_size=25, step_seconds=300)
+    print(runner.run(homes, "fleet_output").head())
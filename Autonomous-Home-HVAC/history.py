@@ -0,0 +1,225 @@
+"""***************************************************************************
+Title:          History Plot Graphic
+File:           history.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    This file is used to draw the history chart of the zone
+                temperatures, outdoor temperature and appliance stages.
+                Every repaint asks the level of detail pyramid for about
+                one min/max column per pixel, so a year of 1 Hz data pans
+                and zooms as fast as a minute of it.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import numpy as np
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QPolygonF
+from PyQt5.QtCore import Qt, QPointF
+
+
+"""*********************Global*********************************************"""
+# Line colour of every channel, zones cycle through the palette
+zone_colors = [QColor(31, 119, 180), QColor(44, 160, 44),
+               QColor(148, 103, 189), QColor(140, 86, 75),
+               QColor(227, 119, 194), QColor(23, 190, 207),
+               QColor(188, 189, 34), QColor(127, 127, 127),
+               QColor(255, 187, 120)]
+outdoor_color = QColor(0, 0, 0)
+stage_color = QColor(214, 39, 40)
+
+MARGIN = 45  # Pixels left of the plot for the axis labels
+MIN_SPAN = 60  # Fewest samples shown when zoomed in
+STAGE_HEIGHT = 0.25  # Share of the height given to the stage strip
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def format_seconds(seconds):
+    """
+    Formats a time offset as d h:mm:ss.
+
+    seconds: Seconds since the first sample (float)
+    Returns: The formatted time (string)
+    """
+    days, rest = divmod(int(seconds), 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, seconds = divmod(rest, 60)
+    text = f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{days}d {text}" if days else text
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class HistoryPlot(QWidget):
+    """
+    Generates the history chart of a MinMaxPyramid. The wheel zooms around
+    the cursor, dragging pans and a double click shows everything and
+    follows new samples again.
+    """
+    def __init__(self, pyramid, size_x=900, size_y=480,
+                 pos_x=0, pos_y=0, instance=None):
+        """
+        Initializes the chart.
+
+        pyramid: History of the controller (MinMaxPyramid)
+        size_x: Size along the x axis in the graphic window (>0).
+        size_y: Size along the y axis in the graphic window (>0).
+        pos_x: Position along x axis on the graphic window (>=0).
+        pos_y: Position along y axis on the graphic window (>=0).
+        instance: For callout in a class, this would be self (usually a window).
+        """
+        super().__init__(instance)
+        self.pyramid = pyramid
+        self.setGeometry(pos_x, pos_y, size_x, size_y)
+
+        # Visible span in samples, None follows the newest samples
+        self.__view = None
+        self.__drag_x = None
+
+    def visible_span(self):
+        """
+        Returns: The first and last sample of the view (tuple)
+        """
+        if self.__view is None:
+            return 0.0, float(max(self.pyramid.count, MIN_SPAN))
+        return self.__view
+
+    def paintEvent(self, event):
+        """
+        This method is called to update the graphic
+        """
+        try:
+            painter = QPainter(self)
+            painter.setFont(QFont("Aptos", 8))
+            width = self.width() - MARGIN
+            height = self.height() - 20
+            stage_top = int(height * (1 - STAGE_HEIGHT))
+            painter.fillRect(MARGIN, 0, width, height, QColor(255, 255, 255))
+            painter.setPen(QColor(200, 200, 200))
+            painter.drawLine(MARGIN, stage_top, MARGIN + width, stage_top)
+
+            start, end = self.visible_span()
+            positions, low, high = self.pyramid.query(start, end, width)
+            painter.setPen(outdoor_color)
+            painter.drawText(MARGIN, height + 15, format_seconds(
+                start * self.pyramid.sample_seconds))
+            painter.drawText(MARGIN + width - 80, height + 15, format_seconds(
+                end * self.pyramid.sample_seconds))
+            if not len(positions):
+                painter.drawText(MARGIN + 10, 20, "No history yet")
+                return
+            x = MARGIN + (positions - start) / (end - start) * width
+
+            # Temperatures on the upper part, common scale of all channels
+            temps = slice(0, len(self.pyramid.channels) - 1)
+            with np.errstate(all="ignore"):
+                lowest = np.nanmin(low[:, temps])
+                highest = np.nanmax(high[:, temps])
+            if not np.isfinite(lowest):
+                lowest, highest = 0.0, 1.0
+            if highest - lowest < 1.0:
+                lowest, highest = lowest - 0.5, highest + 0.5
+            scale = (stage_top - 10) / (highest - lowest)
+            for channel in range(len(self.pyramid.channels) - 1):
+                if self.pyramid.channels[channel] == "outdoor":
+                    pen = QPen(outdoor_color, 1, Qt.DashLine)
+                else:
+                    pen = QPen(zone_colors[channel % len(zone_colors)])
+                self.__draw_envelope(
+                    painter, pen, x,
+                    5 + (highest - low[:, channel]) * scale,
+                    5 + (highest - high[:, channel]) * scale)
+            painter.setPen(outdoor_color)
+            painter.drawText(2, 12, f"{highest:.1f}°C")
+            painter.drawText(2, stage_top - 2, f"{lowest:.1f}°C")
+
+            # Stage output on the strip below, heating up and cooling down
+            with np.errstate(all="ignore"):
+                limit = np.nanmax(np.abs(np.concatenate([low[:, -1],
+                                                         high[:, -1]])))
+            if not np.isfinite(limit) or limit < 1.0:
+                limit = 1.0
+            middle = (stage_top + height) / 2
+            scale = (height - stage_top - 10) / (2 * limit)
+            self.__draw_envelope(painter, QPen(stage_color), x,
+                                 middle - low[:, -1] * scale,
+                                 middle - high[:, -1] * scale)
+            painter.setPen(outdoor_color)
+            painter.drawText(2, stage_top + 14, f"{limit:.0f}")
+            painter.drawText(2, height - 2, f"{-limit:.0f}")
+        except Exception as e:
+            print(f"Error in HistoryPlot paintEvent: {e}")
+
+    def __draw_envelope(self, painter, pen, x, low, high):
+        """
+        Draws one channel as a line through the minimum and maximum of every
+        column, so every peak shows as a vertical stroke.
+        """
+        valid = np.isfinite(low) & np.isfinite(high)
+        points = np.empty((2 * valid.sum(), 2))
+        points[0::2, 0] = points[1::2, 0] = x[valid]
+        points[0::2, 1] = low[valid]
+        points[1::2, 1] = high[valid]
+        painter.setPen(pen)
+        painter.drawPolyline(QPolygonF([QPointF(px, py)
+                                        for px, py in points]))
+
+    def __sample_at(self, pixel):
+        """
+        Returns: The sample under a horizontal pixel position (float)
+        """
+        start, end = self.visible_span()
+        width = max(self.width() - MARGIN, 1)
+        return start + (pixel - MARGIN) / width * (end - start)
+
+    def wheelEvent(self, event):
+        """
+        Zooms in or out around the cursor.
+        """
+        start, end = self.visible_span()
+        anchor = self.__sample_at(event.pos().x())
+        factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+        span = min(max((end - start) * factor, MIN_SPAN),
+                   max(self.pyramid.count, MIN_SPAN))
+        start = anchor - (anchor - start) / (end - start) * span
+        self.__set_view(start, start + span)
+
+    def mousePressEvent(self, event):
+        """
+        Starts panning.
+        """
+        self.__drag_x = event.pos().x()
+
+    def mouseMoveEvent(self, event):
+        """
+        Pans the view with the mouse.
+        """
+        if self.__drag_x is None:
+            return
+        start, end = self.visible_span()
+        shift = (self.__sample_at(self.__drag_x) -
+                 self.__sample_at(event.pos().x()))
+        self.__drag_x = event.pos().x()
+        self.__set_view(start + shift, end + shift)
+
+    def mouseReleaseEvent(self, event):
+        """
+        Stops panning.
+        """
+        self.__drag_x = None
+
+    def mouseDoubleClickEvent(self, event):
+        """
+        Shows the whole history and follows new samples.
+        """
+        self.__view = None
+        self.update()
+
+    def __set_view(self, start, end):
+        """
+        Moves the view inside the recorded samples and repaints.
+        """
+        span = end - start
+        start = min(max(start, 0.0), max(self.pyramid.count - span, 0.0))
+        self.__view = (start, start + span)
+        self.update()
@@ -0,0 +1,233 @@
+"""***************************************************************************
+Title:          Identification
+File:           identification.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Identifies the heat loss coefficient U, thermal capacity C
+                and the output of every stage of each zone from recorded
+                temperature and stage logs. All zones are fitted together
+                by batched least squares on normal equations accumulated
+                chunk by chunk, so long logs never need to be held in
+                memory at once.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import numpy as np
+from model import STAGE_OUTPUTS, TIME_STEP
+
+
+"""*********************Global*********************************************"""
+# Nominal stage outputs of the logs, heating positive and cooling negative
+STAGE_LEVELS = np.array(list(STAGE_OUTPUTS) +
+                        [-output for output in reversed(STAGE_OUTPUTS)],
+                        dtype=np.float64)
+DEFAULT_CHUNK_SIZE = 100_000  # Samples per chunk of the normal equations
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def apply_parameters(parameters, zone, furnace=None, aircon=None):
+    """
+    Feeds the identified parameters of one zone back into the models,
+    whose heating and cooling iterations are the equation that was
+    fitted. Stages never seen in the logs keep their current output.
+
+    parameters: Result of ParameterIdentifier.solve (dictionary)
+    zone: Index of the zone (int)
+    furnace: Furnace model to update (FurnaceModel)
+    aircon: Air conditioner model to update (AirConditionerModel)
+    """
+    heat_loss = parameters["heat_loss"][zone]
+    capacity = parameters["capacity"][zone]
+    if not (np.isfinite(heat_loss) and np.isfinite(capacity)):
+        raise ValueError(f"Zone {zone} could not be identified.")
+    outputs = parameters["stage_outputs"][zone]
+    stages = len(STAGE_OUTPUTS)
+    for model, fitted in ((furnace, outputs[:stages]),
+                          (aircon, -outputs[stages:][::-1])):
+        if model is None:
+            continue
+        stage_outputs = [q if np.isfinite(q) else current
+                         for q, current in zip(fitted, model.stage_outputs)]
+        model.set_parameters(heat_loss, capacity, stage_outputs)
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class ParameterIdentifier:
+    """
+    Fits the lumped model of every zone to its logs. Over one sample of
+    m iterations T += (Q - U * (T - T_out)) / C of FurnaceModel.heating
+    and AirConditionerModel.cooling with the inputs held, the model gives
+
+        T[k+1] - T[k] = -a * (T[k] - T_out[k]) + sum_s g_s * on_s[k]
+
+    with a = 1 - (1 - U / C)^m and g_s = a Q_s / U, which is linear in a
+    and g. The scale of Q and U is fixed by the nominal output of the
+    stage seen most often in each zone.
+    """
+    def __init__(self, zones, sample_seconds=TIME_STEP):
+        """
+        Initializes empty normal equations.
+
+        zones: Number of zones in the logs (int)
+        sample_seconds: Seconds between log samples (float)
+        """
+        self.zones = zones
+        self.sample_seconds = sample_seconds
+        features = 1 + STAGE_LEVELS.size
+        self.__gram = np.zeros((zones, features, features))
+        self.__moment = np.zeros((zones, features))
+        self.__energy = np.zeros(zones)  # Sum of squared targets
+        self.samples = np.zeros(zones, dtype=np.int64)
+        self.stage_counts = np.zeros((zones, STAGE_LEVELS.size),
+                                     dtype=np.int64)
+        self.__last = None  # Last sample of the previous chunk
+
+    def accumulate(self, temperatures, outdoor, stages):
+        """
+        Adds a chunk of consecutive log samples. Chunks must follow each
+        other in time, the step between chunks is included.
+
+        temperatures: Zone temperatures (samples x zones) (array)
+        outdoor: Outdoor temperatures (samples) or (samples x zones) (array)
+        stages: Nominal stage output held after each sample, heating
+                positive, cooling negative and 0 if off (samples x zones)
+                (array)
+        """
+        temperatures = np.asarray(temperatures, dtype=np.float64)
+        outdoor = np.broadcast_to(
+            np.asarray(outdoor, dtype=np.float64).reshape(
+                len(temperatures), -1), temperatures.shape)
+        stages = np.asarray(stages, dtype=np.float64)
+        if self.__last is not None:
+            temperatures = np.concatenate([self.__last[0], temperatures])
+            outdoor = np.concatenate([self.__last[1], outdoor])
+            stages = np.concatenate([self.__last[2], stages])
+        self.__last = (temperatures[-1:], outdoor[-1:], stages[-1:])
+        if len(temperatures) < 2:
+            return
+
+        # Samples with a missing reading are left out
+        target = temperatures[1:] - temperatures[:-1]
+        on = stages[:-1, :, None] == STAGE_LEVELS
+        features = np.concatenate(
+            [-(temperatures[:-1] - outdoor[:-1])[:, :, None], on], axis=2)
+        valid = (np.isfinite(target) &
+                 np.isfinite(features[:, :, 0]))[:, :, None]
+        features = np.where(valid, features, 0.0)
+        target = np.where(valid[:, :, 0], target, 0.0)
+
+        self.__gram += np.einsum("nzp,nzq->zpq", features, features)
+        self.__moment += np.einsum("nzp,nz->zp", features, target)
+        self.__energy += np.einsum("nz,nz->z", target, target)
+        self.samples += valid[:, :, 0].sum(axis=0)
+        self.stage_counts += (on & valid).sum(axis=0)
+
+    def fit(self, temperatures, outdoor, stages,
+            chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Accumulates a whole log chunk by chunk and solves it.
+
+        temperatures: Zone temperatures (samples x zones) (array)
+        outdoor: Outdoor temperatures (samples) or (samples x zones) (array)
+        stages: Nominal stage output after each sample (samples x zones)
+                (array)
+        chunk_size: Samples per chunk (int)
+        Returns: The identified parameters, see solve (dictionary)
+        """
+        for start in range(0, len(temperatures), chunk_size):
+            end = start + chunk_size
+            self.accumulate(temperatures[start:end], outdoor[start:end],
+                            stages[start:end])
+        return self.solve()
+
+    def solve(self):
+        """
+        Solves the normal equations of every zone at once.
+
+        Returns: Per zone U (heat_loss), C (capacity), the output of every
+                 stage of STAGE_LEVELS (stage_outputs, NaN if never seen),
+                 the residual standard deviation per sample and the
+                 number of samples (dictionary of arrays)
+        """
+        gram = self.__gram.copy()
+        unseen = self.stage_counts == 0
+
+        # Stages never seen get an identity row so the system stays solvable
+        diagonal = np.arange(1, gram.shape[1])
+        gram[:, diagonal, diagonal] += unseen
+        try:
+            theta = np.linalg.solve(gram, self.__moment[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            theta = np.stack([np.linalg.lstsq(g, m, rcond=None)[0]
+                              for g, m in zip(gram, self.__moment)])
+        residual = (self.__energy - 2 * np.einsum("zp,zp->z", theta,
+                                                  self.__moment) +
+                    np.einsum("zp,zpq,zq->z", theta, self.__gram, theta))
+        residual_std = np.sqrt(np.maximum(residual, 0.0) /
+                               np.maximum(self.samples - theta.shape[1], 1))
+
+        loss, gains = theta[:, 0], np.where(unseen, np.nan, theta[:, 1:])
+        iterations = self.sample_seconds / TIME_STEP
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # U / C from the decay (1 - U / C) of one iteration
+            decay_rate = -np.expm1(np.log1p(-loss) / iterations)
+
+            # Scale by the stage seen most often in each zone
+            anchor = self.stage_counts.argmax(axis=1)
+            zones = np.arange(self.zones)
+            heat_loss = (STAGE_LEVELS[anchor] * loss /
+                         gains[zones, anchor])
+            capacity = heat_loss / decay_rate
+            stage_outputs = heat_loss[:, None] * gains / loss[:, None]
+
+        identified = ((loss > 0) & (loss < 1) & ~unseen.all(axis=1) &
+                      (heat_loss > 0))
+        heat_loss = np.where(identified, heat_loss, np.nan)
+        capacity = np.where(identified, capacity, np.nan)
+        stage_outputs = np.where(identified[:, None], stage_outputs, np.nan)
+        return {"heat_loss": heat_loss, "capacity": capacity,
+                "stage_outputs": stage_outputs,
+                "residual_std": residual_std, "samples": self.samples.copy()}
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration with a month of synthetic logs of 9 zones at 10 s
+    import time
+    rng = np.random.default_rng(0)
+    zones, sample_seconds = 9, 10.0
+    samples = int(30 * 24 * 3600 / sample_seconds)
+    true_u = rng.uniform(8, 12, zones)
+    true_c = rng.uniform(400, 700, zones)
+    true_q = np.tile(STAGE_LEVELS, (zones, 1))
+    hours = np.arange(samples) * sample_seconds / 3600
+    outdoor = 5 + 10 * np.sin(2 * np.pi * hours / 24)
+
+    # Random stage sequence held for a few minutes at a time
+    picks = rng.integers(-1, STAGE_LEVELS.size, (samples // 30 + 1, zones))
+    level = np.where(picks < 0, 0, picks)
+    stages = np.where(picks < 0, 0.0, STAGE_LEVELS[level])
+    stages = np.repeat(stages, 30, axis=0)[:samples]
+    outputs = np.where(picks < 0, 0.0,
+                       np.take_along_axis(true_q, level.T, axis=1).T)
+    outputs = np.repeat(outputs, 30, axis=0)[:samples]
+    temperatures = np.empty((samples, zones))
+    temperatures[0] = 20.0
+    decay = (1 - true_u / true_c) ** (sample_seconds / TIME_STEP)
+    for k in range(samples - 1):
+        equilibrium = outdoor[k] + outputs[k] / true_u
+        temperatures[k + 1] = (equilibrium + decay *
+                               (temperatures[k] - equilibrium))
+    temperatures += rng.normal(0, 0.01, temperatures.shape)
+
+    start = time.perf_counter()
+    parameters = ParameterIdentifier(zones, sample_seconds).fit(
+        temperatures, outdoor, stages)
+    print(f"Fitted {samples} samples of {zones} zones in "
+          f"{time.perf_counter() - start:.2f} s")
+    print("U error %:", np.round(100 * (parameters["heat_loss"] / true_u - 1),
+                                 1))
+    print("C error %:", np.round(100 * (parameters["capacity"] / true_c - 1),
+                                 1))
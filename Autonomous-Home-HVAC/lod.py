@@ -0,0 +1,232 @@
+"""***************************************************************************
+Title:          Level of Detail
+File:           lod.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Level of detail pyramid of recorded time series. Every level
+                keeps the minimum and maximum of blocks FACTOR times longer
+                than the level below, updated as samples are appended, so a
+                view of any span is drawn from the coarsest level that still
+                gives about one block per pixel and the peaks are never lost.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import numpy as np
+from model import ZONE_NAMES
+
+
+"""*********************Global*********************************************"""
+# Channels of the controller history, one row per sample
+HISTORY_CHANNELS = tuple(ZONE_NAMES) + ("outdoor", "stage")
+FACTOR = 4  # Samples per block of the next level
+INITIAL_CAPACITY = 4096
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class MinMaxPyramid:
+    """
+    Appendable multi-channel series with min/max decimated levels. Level 0
+    holds the samples, level k the min and max of FACTOR^k samples.
+    Samples are float32, a year of 1 Hz data of 11 channels takes about
+    1.4 GB of samples and 1 GB of levels.
+    """
+    def __init__(self, channels=HISTORY_CHANNELS, sample_seconds=1.0,
+                 factor=FACTOR):
+        """
+        Initializes an empty series.
+
+        channels: Names of the channels (tuple)
+        sample_seconds: Seconds between samples (float)
+        factor: Samples per block of the next level, at least 2 (int)
+        """
+        if factor < 2:
+            raise ValueError("The factor must be at least 2.")
+        self.channels = tuple(channels)
+        self.sample_seconds = sample_seconds
+        self.factor = factor
+        self.count = 0
+        self.__samples = np.empty((INITIAL_CAPACITY, len(self.channels)),
+                                  dtype=np.float32)
+        self.__levels = []  # (minimum, maximum, count) of level 1 and up
+
+    @property
+    def levels(self):
+        """
+        Returns: The number of levels including the samples (int)
+        """
+        return 1 + len(self.__levels)
+
+    @property
+    def duration(self):
+        """
+        Returns: Seconds covered by the samples (float)
+        """
+        return self.count * self.sample_seconds
+
+    @staticmethod
+    def __grow(array, needed):
+        """
+        Returns: The array with room for at least needed rows (array)
+        """
+        if needed <= len(array):
+            return array
+        grown = np.empty((max(needed, 2 * len(array)),) + array.shape[1:],
+                         dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+
+    def append(self, values):
+        """
+        Appends one sample of every channel.
+
+        values: Value of every channel, NaN if missing (list)
+        """
+        self.extend(np.asarray(values, dtype=np.float32)[None, :])
+
+    def extend(self, rows):
+        """
+        Appends many samples and updates the levels they complete.
+
+        rows: Samples (samples x channels) (array)
+        """
+        rows = np.asarray(rows, dtype=np.float32)
+        if rows.ndim != 2 or rows.shape[1] != len(self.channels):
+            raise ValueError(f"Expected rows of {len(self.channels)} values.")
+        end = self.count + len(rows)
+        self.__samples = self.__grow(self.__samples, end)
+        self.__samples[self.count:end] = rows
+        self.count = end
+
+        # Each level completes the blocks its lower level has filled
+        lower_min = lower_max = self.__samples
+        lower_count = self.count
+        level = 0
+        while True:
+            complete = lower_count // self.factor
+            if level == len(self.__levels):
+                if not complete:
+                    break
+                empty = np.empty((0, len(self.channels)), dtype=np.float32)
+                self.__levels.append([empty, empty.copy(), 0])
+            minimum, maximum, count = self.__levels[level]
+            if complete > count:
+                blocks = (slice(count * self.factor, complete * self.factor),)
+                shape = (complete - count, self.factor, len(self.channels))
+                minimum = self.__grow(minimum, complete)
+                maximum = self.__grow(maximum, complete)
+                minimum[count:complete] = np.fmin.reduce(
+                    lower_min[blocks].reshape(shape), axis=1)
+                maximum[count:complete] = np.fmax.reduce(
+                    lower_max[blocks].reshape(shape), axis=1)
+                self.__levels[level] = [minimum, maximum, complete]
+            lower_min, lower_max, lower_count = minimum, maximum, complete
+            level += 1
+
+    def state(self):
+        """
+        Returns: Copy of the samples, the levels are rebuilt on restore
+                 (dictionary)
+        """
+        return {"channels": self.channels,
+                "sample_seconds": self.sample_seconds,
+                "factor": self.factor, "samples": self.samples().copy()}
+
+    def restore(self, state):
+        """
+        Continues from saved samples.
+
+        state: A state returned by state() (dictionary)
+        """
+        self.channels = tuple(state["channels"])
+        self.sample_seconds = state["sample_seconds"]
+        self.factor = state["factor"]
+        self.count = 0
+        self.__samples = np.empty((INITIAL_CAPACITY, len(self.channels)),
+                                  dtype=np.float32)
+        self.__levels = []
+        self.extend(state["samples"])
+
+    def samples(self, start=0, end=None):
+        """
+        Returns: The samples of a range of indices (samples x channels)
+                 (array)
+        """
+        end = self.count if end is None else min(end, self.count)
+        return self.__samples[max(start, 0):end]
+
+    def query(self, start, end, pixels):
+        """
+        Returns the envelope of a span at about one column per pixel. The
+        first and last column may reach up to one block past the span.
+
+        start: First sample of the span (float)
+        end: Sample after the span (float)
+        pixels: Width of the view in pixels (int)
+        Returns: First sample of every column, and the minimum and maximum
+                 of every column and channel (columns x channels)
+                 (tuple of arrays)
+        """
+        start = max(int(np.floor(start)), 0)
+        end = min(int(np.ceil(end)), self.count)
+        pixels = max(int(pixels), 1)
+        span = end - start
+        if span <= 0:
+            empty = np.empty((0, len(self.channels)), dtype=np.float32)
+            return np.empty(0, dtype=np.int64), empty, empty
+
+        # Coarsest level with at least one block per pixel
+        level = 0
+        while (level < len(self.__levels) and
+               self.factor ** (level + 1) * pixels <= span):
+            level += 1
+        if level == 0:
+            minimum = maximum = self.__samples[start:end]
+            positions = np.arange(start, end)
+        else:
+            block = self.factor ** level
+            level_min, level_max, count = self.__levels[level - 1]
+            first, last = start // block, min(-(-end // block), count)
+            minimum = level_min[first:last]
+            maximum = level_max[first:last]
+            positions = np.arange(first, last) * block
+            if end > count * block:
+                # Samples after the last complete block, less than one block
+                tail = self.__samples[max(start, count * block):end]
+                minimum = np.vstack([minimum, np.fmin.reduce(tail)[None]])
+                maximum = np.vstack([maximum, np.fmax.reduce(tail)[None]])
+                positions = np.append(positions, max(start, count * block))
+
+        # Merge the blocks into at most one column per pixel
+        if len(positions) > pixels:
+            edges = np.unique(np.linspace(0, len(positions), pixels + 1,
+                                          dtype=np.int64)[:-1])
+            minimum = np.fmin.reduceat(minimum, edges, axis=0)
+            maximum = np.fmax.reduceat(maximum, edges, axis=0)
+            positions = positions[edges]
+        return positions, minimum, maximum
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration with a month of 1 Hz data, viewed at 1000 pixels
+    import time
+    pyramid = MinMaxPyramid()
+    seconds = np.arange(30 * 24 * 3600)
+    outdoor = 5 + 10 * np.sin(2 * np.pi * seconds / 86400)
+    rows = np.repeat((21 + 0.5 * np.sin(seconds / 300))[:, None],
+                     len(HISTORY_CHANNELS), axis=1)
+    rows[:, -2] = outdoor
+    rows[:, -1] = np.where(np.sin(seconds / 300) < 0, 300, 0)
+    start = time.perf_counter()
+    for chunk in range(0, len(rows), 86400):
+        pyramid.extend(rows[chunk:chunk + 86400])
+    print(f"Appended {pyramid.count} samples in "
+          f"{time.perf_counter() - start:.2f} s, {pyramid.levels} levels")
+    for span in (600, 86400, pyramid.count):
+        start = time.perf_counter()
+        positions, low, high = pyramid.query(pyramid.count - span,
+                                             pyramid.count, 1000)
+        print(f"Span {span} s: {len(positions)} columns in "
+              f"{1000 * (time.perf_counter() - start):.2f} ms, outdoor "
+              f"{low[:, -2].min():.2f} to {high[:, -2].max():.2f}")
@@ -0,0 +1,263 @@
+"""***************************************************************************
+Title:          MPC
+File:           mpc.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Model predictive scheduling of the furnace and air
+                conditioner stages. Every candidate sequence of stage and
+                damper settings over the horizon is rolled out for every
+                zone in one vectorized batch of the lumped model over the
+                weather forecast, and the cheapest plan that keeps the zone
+                in its comfort band is applied until the next re-plan.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import itertools
+import numpy as np
+from model import STAGE_OUTPUTS, TIME_STEP
+from model import HEAT_LOSS_COEFFICIENT, THERMAL_CAPACITY
+from simulation import thermal_step
+
+
+"""*********************Global*********************************************"""
+# Net output of every stage, heating positive and cooling negative, and off
+STAGE_LEVELS = tuple(STAGE_OUTPUTS) + (0,) + tuple(
+    -output for output in reversed(STAGE_OUTPUTS))
+
+# Move blocking: the plan holds one setting per block. The first block is
+# the re-plan interval, the second looks far enough ahead for the zone to
+# settle. Partly closed dampers give the outputs between the stages.
+DEFAULT_BLOCK_SECONDS = (60, 1800)
+DEFAULT_DAMPERS = (0.25, 0.5, 0.75, 1.0)
+COMFORT_BAND = 1.0  # Allowed distance to the setpoint in °C
+COMFORT_WEIGHT = 1e4  # Cost of a squared degree outside the band
+REPLAN_SECONDS = 60  # Seconds between re-plans of a zone
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def build_candidates(blocks, dampers=DEFAULT_DAMPERS):
+    """
+    Enumerates the distinct plans, one delivered output per block.
+
+    blocks: Number of blocks of the horizon (int)
+    dampers: Damper positions a stage can be combined with (tuple)
+    Returns: Delivered output of every plan and block (plans x blocks)
+             (array)
+    """
+    settings = np.unique([stage * damper for stage in STAGE_LEVELS
+                          for damper in dampers])
+    return np.array(list(itertools.product(settings, repeat=blocks)),
+                    dtype=np.float64)
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class MPCScheduler:
+    """
+    Plans the output of many zones at once by batched rollouts.
+    """
+    def __init__(self, block_seconds=DEFAULT_BLOCK_SECONDS,
+                 dampers=DEFAULT_DAMPERS, comfort_band=COMFORT_BAND,
+                 comfort_weight=COMFORT_WEIGHT,
+                 heat_loss=HEAT_LOSS_COEFFICIENT, capacity=THERMAL_CAPACITY):
+        """
+        Initializes the scheduler and its candidate plans.
+
+        block_seconds: Length of every block of the horizon (tuple)
+        dampers: Damper positions a stage can be combined with (tuple)
+        comfort_band: Allowed distance to the setpoint in °C (float)
+        comfort_weight: Cost of a squared degree outside the band for one
+                        model iteration (float)
+        heat_loss: Heat loss coefficient U per zone (float/array)
+        capacity: Thermal capacity C per zone (float/array)
+        """
+        self.block_seconds = np.asarray(block_seconds, dtype=np.float64)
+        self.block_iterations = self.block_seconds / TIME_STEP
+        self.candidates = build_candidates(len(block_seconds), dampers)
+        self.comfort_band = comfort_band
+        self.comfort_weight = comfort_weight
+        self.heat_loss = np.asarray(heat_loss, dtype=np.float64)
+        self.capacity = np.asarray(capacity, dtype=np.float64)
+
+    @property
+    def horizon_seconds(self):
+        """
+        Returns: The length of the horizon in seconds (float)
+        """
+        return float(self.block_seconds.sum())
+
+    def block_midpoints(self):
+        """
+        Returns: Seconds from now to the middle of every block (array)
+        """
+        return np.cumsum(self.block_seconds) - self.block_seconds / 2
+
+    def rollout(self, temperatures, outdoor, heat_loss=None, capacity=None):
+        """
+        Rolls every candidate plan out for every zone. Each block holds its
+        output, so the model is solved in closed form block by block.
+
+        temperatures: Zone temperatures (zones) (array)
+        outdoor: Outdoor forecast of every block (blocks) or
+                 (zones x blocks) (array)
+        heat_loss: U per zone, the scheduler's if None (array)
+        capacity: C per zone, the scheduler's if None (array)
+        Returns: Temperature at the start and end of every block
+                 (zones x plans x blocks + 1) (array)
+        """
+        zones = len(temperatures)
+        outdoor = np.broadcast_to(outdoor, (zones, len(self.block_seconds)))
+        heat_loss = np.broadcast_to(
+            self.heat_loss if heat_loss is None else heat_loss,
+            (zones,))[:, None]
+        capacity = np.broadcast_to(
+            self.capacity if capacity is None else capacity,
+            (zones,))[:, None]
+        trajectory = np.empty((zones, len(self.candidates),
+                               len(self.block_seconds) + 1))
+        trajectory[:, :, 0] = temperatures[:, None]
+        for block, iterations in enumerate(self.block_iterations):
+            output = self.candidates[:, block]
+            trajectory[:, :, block + 1] = thermal_step(
+                trajectory[:, :, block], outdoor[:, block, None],
+                np.maximum(output, 0), np.maximum(-output, 0),
+                heat_loss, capacity, iterations)
+        return trajectory
+
+    def plan(self, temperatures, outdoor, setpoints, heat_loss=None,
+             capacity=None):
+        """
+        Chooses the plan of every zone: the least energy among the plans
+        that end every block inside the comfort band, or the lowest
+        energy plus discomfort cost if no plan does.
+
+        temperatures: Zone temperatures (zones) (array)
+        outdoor: Outdoor forecast of every block (blocks) or
+                 (zones x blocks) (array)
+        setpoints: Setpoint per zone (float/array)
+        heat_loss: U per zone, the scheduler's if None (array)
+        capacity: C per zone, the scheduler's if None (array)
+        Returns: Output of the first block, index of the plan, its cost and
+                 whether it is feasible, per zone (dictionary of arrays)
+        """
+        temperatures = np.asarray(temperatures, dtype=np.float64)
+        setpoints = np.broadcast_to(np.asarray(setpoints, dtype=np.float64),
+                                    temperatures.shape)[:, None, None]
+        trajectory = self.rollout(temperatures, outdoor, heat_loss, capacity)
+
+        energy = np.abs(self.candidates) @ self.block_iterations
+        excess = np.maximum(np.abs(trajectory - setpoints) -
+                            self.comfort_band, 0.0)
+        # Deviation is monotone within a block, trapezoid over its ends
+        discomfort = (0.5 * (excess[:, :, :-1] ** 2 + excess[:, :, 1:] ** 2)
+                      @ self.block_iterations)
+        feasible = (excess[:, :, 1:] == 0).all(axis=2)
+        cost = energy + self.comfort_weight * discomfort
+        any_feasible = feasible.any(axis=1, keepdims=True)
+        score = np.where(any_feasible,
+                         np.where(feasible, energy, np.inf), cost)
+        best = score.argmin(axis=1)
+        zones = np.arange(len(temperatures))
+        return {"output": self.candidates[best, 0], "plan": best,
+                "cost": cost[zones, best], "feasible": feasible[zones, best]}
+
+
+'========================================='
+class MPCPolicy:
+    """
+    Receding-horizon control rule for ThermalSimulation: every zone
+    re-plans with the scheduler at a fixed interval and holds the first
+    block of its plan in between.
+    """
+    def __init__(self, scheduler=None, replan_seconds=REPLAN_SECONDS):
+        """
+        Initializes the policy.
+
+        scheduler: Planner of the outputs, default settings if None
+                   (MPCScheduler)
+        replan_seconds: Seconds between re-plans of a zone (float)
+        """
+        self.scheduler = MPCScheduler() if scheduler is None else scheduler
+        self.replan_iterations = replan_seconds / TIME_STEP
+        self.plans = 0
+
+    def reset(self, zones):
+        """
+        Initializes the policy state of every zone, kept by the simulation
+        so it is saved and restored with it.
+
+        zones: Number of zones (int)
+        Returns: Planned output and iterations until the next re-plan of
+                 every zone (dictionary of arrays)
+        """
+        return {"output": np.zeros(zones), "timer": np.zeros(zones)}
+
+    def forecast(self, simulation):
+        """
+        Returns: Outdoor temperature of every zone at the middle of every
+                 block of the horizon (zones x blocks) (array)
+        """
+        hours = simulation.hour + self.scheduler.block_midpoints() / 3600
+        outdoor = simulation.outdoor
+        if outdoor.ndim == 1:
+            return np.interp(hours, np.arange(simulation.hours),
+                             outdoor)[None, :]
+        return np.stack([np.interp(hours, np.arange(simulation.hours),
+                                   outdoor[:, zone])
+                         for zone in range(outdoor.shape[1])])
+
+    def plan(self, simulation, temperatures, outdoor, setpoints, active):
+        """
+        Re-plans the zones whose plan has expired, see
+        StagedRelayPolicy.plan.
+        """
+        state = simulation.policy_state
+        due = active & (state["timer"] <= 0)
+        if due.any():
+            forecast = np.broadcast_to(
+                self.forecast(simulation),
+                (simulation.zones, len(self.scheduler.block_seconds)))
+            # The first block starts at the outdoor temperature of now
+            forecast = forecast.copy()
+            forecast[:, 0] = outdoor
+            result = self.scheduler.plan(
+                temperatures[due], forecast[due], setpoints[due],
+                simulation.heat_loss[due], simulation.capacity[due])
+            state["output"][due] = result["output"]
+            state["timer"][due] = self.replan_iterations
+            self.plans += int(due.sum())
+
+        heat = np.maximum(state["output"], 0)
+        cool = np.maximum(-state["output"], 0)
+        unbounded = np.full(simulation.zones, np.inf)
+        return heat, cool, -unbounded, unbounded, state["timer"].copy()
+
+    def advance(self, simulation, heat, cool, elapsed, active):
+        """
+        Counts down the plan of every zone, see StagedRelayPolicy.advance.
+        """
+        state = simulation.policy_state
+        state["timer"] = np.where(active, state["timer"] - elapsed,
+                                  state["timer"])
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration comparing the relay and the MPC over two winter days
+    import time
+    from simulation import ThermalSimulation
+    hours = np.arange(24 * 2)
+    outdoor = -2 + 6 * np.sin(2 * np.pi * hours / 24)
+    zones = 50
+    for name, policy in (("relay", None), ("mpc", MPCPolicy())):
+        start = time.perf_counter()
+        simulation = ThermalSimulation(outdoor, zones=zones, setpoints=21.0,
+                                       initial_temperatures=21.0,
+                                       policy=policy, step_seconds=900)
+        simulation.run()
+        print(f"{name}: {time.perf_counter() - start:.2f} s, heating "
+              f"{simulation.heating_energy.mean():.4g}, cycles "
+              f"{simulation.heating_cycles.mean():.0f}, comfort "
+              f"{simulation.comfort_deviation.mean():.1f} degree-hours")
+    print(f"Zone plans: {policy.plans}")
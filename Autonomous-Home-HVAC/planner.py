@@ -0,0 +1,188 @@
+"""***************************************************************************
+Title:          Schedule Planner
+File:           planner.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Precomputes the operating mode, fan speed and expected stage
+                output for every hour of the weather data in one vectorized
+                pass, so any hour of the year can be queried instantly.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import numpy as np
+from simulation import stage_output
+
+
+"""*********************Global*********************************************"""
+# Mode codes, the index matches the strings used by ThermostatModel.set_mode
+NORMAL_MODE = 0
+HEATING_MODE = 1
+COOLING_MODE = 2
+MODE_NAMES = ("Normal mode", "Heating mode", "Cooling mode")
+
+# Fan codes, the index matches the strings used by FanModel
+FAN_SPEEDS = ("low", "high")
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def expand_setpoints(setpoints, hours):
+    """
+    Expands a setpoint schedule to one setpoint per hour.
+
+    setpoints: A single setpoint, a repeating profile (e.g. 24 hourly values
+               or 168 for a week) or a full hourly array (float/array)
+    hours: Number of hours to cover (int)
+    """
+    setpoints = np.asarray(setpoints, dtype=np.float64)
+    if setpoints.ndim == 0:
+        return np.full(hours, float(setpoints))
+    if setpoints.ndim != 1 or setpoints.size == 0:
+        raise ValueError("The setpoint schedule must be a scalar or 1-D.")
+    if setpoints.size >= hours:
+        return setpoints[:hours]
+    # Repeat the profile over the full period
+    return np.resize(setpoints, hours)
+
+
+def plan_schedule(setpoints, outdoor_temperatures):
+    """
+    Determines mode, fan speed and stage output for every hour.
+
+    setpoints: Setpoint schedule, see expand_setpoints (float/array)
+    outdoor_temperatures: Hourly outdoor temperatures (array)
+
+    Returns: Mode codes, fan speed codes and stage outputs in BTU (arrays)
+    """
+    outdoor = np.asarray(outdoor_temperatures, dtype=np.float64)
+    setpoints = expand_setpoints(setpoints, outdoor.size)
+    difference = setpoints - outdoor
+
+    # Same comparisons as ThermostatModel.set_mode, missing data is Normal
+    mode = np.full(outdoor.size, NORMAL_MODE, dtype=np.int8)
+    mode[difference > 0] = HEATING_MODE
+    mode[difference < 0] = COOLING_MODE
+
+    # Same rule as FanModel.set_fan_speed_value: high unless in Normal mode
+    fan_speed = (mode != NORMAL_MODE).astype(np.int8)
+
+    # Same breakpoints as calculate_q_furnace and calculate_q_aircon
+    stage = stage_output(np.abs(difference)).astype(np.int16)
+
+    return mode, fan_speed, stage
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class SchedulePlan:
+    """
+    Holds the precomputed hourly mode, fan speed and stage arrays.
+    """
+    def __init__(self, timestamps, setpoints, outdoor_temperatures):
+        """
+        Plans the full schedule in one pass.
+
+        timestamps: Hourly timestamps as "yyyy-mm-dd h:00" (list of strings)
+        setpoints: Setpoint schedule, see expand_setpoints (float/array)
+        outdoor_temperatures: Hourly outdoor temperatures (array)
+        """
+        self.outdoor_temperatures = np.asarray(outdoor_temperatures,
+                                               dtype=np.float64)
+        self.setpoints = expand_setpoints(setpoints,
+                                          self.outdoor_temperatures.size)
+        self.mode, self.fan_speed, self.stage = plan_schedule(
+            self.setpoints, self.outdoor_temperatures)
+
+        # Index to find an hour without scanning the weather data
+        self.__index = {timestamp: i for i, timestamp in
+                        enumerate(timestamps)}
+
+    def __len__(self):
+        """
+        Returns: The number of planned hours (int)
+        """
+        return self.mode.size
+
+    def index_of(self, date_input, time_input):
+        """
+        Finds the row of the plan for a date and hour.
+
+        date_input: Date input as yyyy-mm-dd (string)
+        time_input: Time input h:dd or an hour (string/int)
+        """
+        hour = int(str(time_input).strip().split(":")[0])
+        formatted_date_time = f"{date_input.strip()} {hour:d}:00"
+        try:
+            return self.__index[formatted_date_time]
+        except KeyError:
+            raise KeyError("No plan found for the specified date & time: "
+                           f"{formatted_date_time}")
+
+    def at(self, index):
+        """
+        Returns the plan of a single hour in the same format as the models.
+
+        index: Row of the plan (int)
+        Returns: Mode, fan speed and stage output (string, string, int)
+        """
+        return (MODE_NAMES[self.mode[index]],
+                FAN_SPEEDS[self.fan_speed[index]],
+                int(self.stage[index]))
+
+    def lookup(self, date_input, time_input):
+        """
+        Returns the plan of the hour matching a date and time.
+
+        date_input: Date input as yyyy-mm-dd (string)
+        time_input: Time input h:dd or an hour (string/int)
+        """
+        return self.at(self.index_of(date_input, time_input))
+
+    def mode_names(self):
+        """
+        Returns: The mode of every hour (array of strings)
+        """
+        return np.asarray(MODE_NAMES)[self.mode]
+
+    def fan_speed_names(self):
+        """
+        Returns: The fan speed of every hour (array of strings)
+        """
+        return np.asarray(FAN_SPEEDS)[self.fan_speed]
+
+
+'========================================='
+class SchedulePlanner:
+    """
+    Builds schedule plans from the weather data loaded by the model.
+    """
+    def __init__(self, temperature_data):
+        """
+        Splits the weather data into timestamps and outdoor temperatures.
+
+        temperature_data: Rows of [date time, temperature, ...] (array)
+        """
+        self.temperature_data = temperature_data
+        self.timestamps = [str(row[0]) for row in temperature_data]
+        self.outdoor_temperatures = np.asarray(
+            [row[1] for row in temperature_data], dtype=np.float64)
+
+    def plan(self, setpoints):
+        """
+        Plans the mode, fan speed and stage for every hour of the data.
+
+        setpoints: Setpoint schedule, see expand_setpoints (float/array)
+        """
+        return SchedulePlan(self.timestamps, setpoints,
+                            self.outdoor_temperatures)
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration with a day of synthetic weather
+    hours = [f"2024-01-01 {hour:d}:00" for hour in range(24)]
+    outdoor = 22 + 12 * np.sin(np.linspace(-np.pi, np.pi, 24))
+    planner = SchedulePlanner(list(zip(hours, outdoor)))
+    schedule = planner.plan([20] * 7 + [22] * 15 + [20] * 2)
+    print(schedule.lookup("2024-01-01", "6:00"))
+    print(schedule.lookup("2024-01-01", "12:00"))
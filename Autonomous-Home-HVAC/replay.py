@@ -0,0 +1,268 @@
+"""***************************************************************************
+Title:          Replay
+File:           replay.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Deterministic record and replay of the controller's heating
+                and cooling runs. While recording, the inputs of every run
+                and the stage decisions of the model are logged against
+                simulated time. The replay re-drives fresh models headless
+                without waiting for the time step and checks that every run
+                produces the same temperatures bit for bit.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import hashlib
+import itertools
+import json
+import struct
+import threading
+import time
+from model import FurnaceModel, AirConditionerModel
+
+
+"""*********************Global*********************************************"""
+LOG_VERSION = 2
+
+# Model process re-driven for each recorded mode
+PROCESSES = {
+    "heating": (FurnaceModel, "heating"),
+    "cooling": (AirConditionerModel, "cooling"),
+}
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class RunTrace:
+    """
+    The inputs and output of one heating or cooling run.
+    """
+    def __init__(self, run_id, mode, inputs, stop_after=None):
+        """
+        Initializes an empty trace.
+
+        run_id: Sequential identifier of the run (int)
+        mode: "heating", "cooling" or "none" if no action was taken (string)
+        inputs: Start temperature, setpoint, outdoor temperature, date and
+                time of the run (dictionary)
+        stop_after: Stop the process after this many iterations, used to
+                    replay runs that were superseded (int)
+        """
+        self.run_id = run_id
+        self.mode = mode
+        self.inputs = inputs
+        self.stages = []  # (sim_time, stage, temperature) at every change
+        self.iterations = 0
+        self.final_temperature = None
+        self.completed = None
+        self.recorded_at = time.time()
+        self.__stop_after = stop_after
+        self.__digest = hashlib.sha256()
+
+    def iteration(self, sim_time, stage, temperature):
+        """
+        Records one iteration of the model.
+
+        sim_time: Simulated seconds since the start of the run (float)
+        stage: Appliance output of the iteration in BTU (int)
+        temperature: Zone temperature after the iteration (float)
+        Returns: True if the process should stop (bool)
+        """
+        self.iterations += 1
+        self.__digest.update(struct.pack("<dd", stage, temperature))
+        if not self.stages or self.stages[-1][1] != stage:
+            self.stages.append((sim_time, stage, temperature))
+        self.final_temperature = temperature
+        return self.should_stop
+
+    @property
+    def should_stop(self):
+        """
+        Returns: True once the iterations to replay are used up (bool)
+        """
+        return (self.__stop_after is not None and
+                self.iterations >= self.__stop_after)
+
+    def finish(self, completed):
+        """
+        Marks the end of the run.
+
+        completed: True if the setpoint was reached (bool)
+        """
+        self.completed = completed
+
+    @property
+    def digest(self):
+        """
+        Returns: Hash of the stage and temperature of every iteration
+                 (string)
+        """
+        return self.__digest.hexdigest()
+
+    def to_dict(self):
+        """
+        Returns: The trace as a JSON compatible dictionary
+        """
+        return {"run_id": self.run_id, "mode": self.mode,
+                "inputs": self.inputs, "stages": self.stages,
+                "iterations": self.iterations,
+                "final_temperature": self.final_temperature,
+                "completed": self.completed, "digest": self.digest,
+                "recorded_at": self.recorded_at}
+
+
+'========================================='
+class RunRecorder:
+    """
+    Collects the traces of the controller's runs, which may come from
+    several worker threads.
+    """
+    def __init__(self):
+        """
+        Initializes an empty recording.
+        """
+        self.traces = []
+        self.__ids = itertools.count(1)
+        self.__lock = threading.Lock()
+
+    def begin(self, mode, **inputs):
+        """
+        Starts the trace of a new run.
+
+        mode: "heating", "cooling" or "none" (string)
+        inputs: Start temperature, setpoint, outdoor temperature, date and
+                time of the run (any)
+        Returns: The trace to pass to the model (RunTrace)
+        """
+        with self.__lock:
+            trace = RunTrace(next(self.__ids), mode, inputs)
+            self.traces.append(trace)
+        return trace
+
+    def save(self, file_path):
+        """
+        Writes the recording as one JSON line per run. Floats are written
+        exactly, so the replay starts from identical inputs.
+
+        file_path: Path of the log file (string)
+        Returns: The number of runs written (int)
+        """
+        with self.__lock:
+            traces = list(self.traces)
+        with open(file_path, "w") as file:
+            file.write(json.dumps({"version": LOG_VERSION}) + "\n")
+            for trace in traces:
+                file.write(json.dumps(trace.to_dict()) + "\n")
+        return len(traces)
+
+    @staticmethod
+    def load(file_path):
+        """
+        Reads a recording.
+
+        file_path: Path of the log file (string)
+        Returns: The recorded runs in order (list of dict)
+        """
+        with open(file_path) as file:
+            header = json.loads(file.readline())
+            if header.get("version") != LOG_VERSION:
+                raise ValueError(f"Log version {header.get('version')} is "
+                                 "not supported.")
+            return [json.loads(line) for line in file if line.strip()]
+
+
+'========================================='
+class ReplayEngine:
+    """
+    Re-drives the recorded runs through fresh models as fast as possible.
+    """
+    def __init__(self, runs):
+        """
+        Initializes the engine.
+
+        runs: Recorded runs, or the path of a log file (list/string)
+        """
+        self.runs = RunRecorder.load(runs) if isinstance(runs, str) else runs
+
+    @staticmethod
+    def replay_run(run):
+        """
+        Replays one recorded run.
+
+        run: A recorded run (dictionary)
+        Returns: The trace of the replay, None if no action was taken or
+                 the run was superseded before it started (RunTrace)
+        """
+        if run["mode"] not in PROCESSES or run["completed"] is None:
+            return None
+        model_class, process = PROCESSES[run["mode"]]
+        model = model_class(None)
+        inputs = run["inputs"]
+        model.set_parameters(inputs.get("heat_loss"), inputs.get("capacity"),
+                             inputs.get("stage_outputs"))
+
+        # Superseded runs stop at the iteration they were superseded at
+        stop_after = None if run["completed"] else run["iterations"]
+        trace = RunTrace(run["run_id"], run["mode"], inputs, stop_after)
+        completed = getattr(model, process)(
+            inputs["outdoor_temp"], inputs["set_temp"], trace=trace,
+            realtime=False, start_temp=inputs["start_temp"],
+            stage=inputs.get("stage"))
+        trace.finish(completed)
+        return trace
+
+    def run(self, stop_at_divergence=False):
+        """
+        Replays every recorded run in order.
+
+        stop_at_divergence: Stop at the first run that differs (bool)
+        Returns: Run identifier, recorded and replayed digest, and whether
+                 they match, for every replayed run (list of dict)
+        """
+        report = []
+        for run in self.runs:
+            trace = self.replay_run(run)
+            if trace is None:
+                continue
+            matched = (trace.digest == run["digest"] and
+                       trace.iterations == run["iterations"] and
+                       trace.completed == run["completed"])
+            report.append({"run_id": run["run_id"], "mode": run["mode"],
+                           "recorded": run["digest"],
+                           "replayed": trace.digest, "matched": matched})
+            if stop_at_divergence and not matched:
+                break
+        return report
+
+    def first_divergence(self):
+        """
+        Returns: Identifier of the first run that differs from the
+                 recording, None if all match (int)
+        """
+        for result in self.run(stop_at_divergence=True):
+            if not result["matched"]:
+                return result["run_id"]
+        return None
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration recording a few runs headless, then replaying them
+    recorder = RunRecorder()
+    for start_temp, set_temp in [(5.0, 22.0), (30.5, 21.0), (19.25, 23.5)]:
+        mode = "heating" if set_temp > start_temp else "cooling"
+        model_class, process = PROCESSES[mode]
+        trace = recorder.begin(mode, start_temp=start_temp,
+                               set_temp=set_temp, outdoor_temp=start_temp,
+                               date="2024-01-01", time="12:00")
+        trace.finish(getattr(model_class(None), process)(
+            start_temp, set_temp, trace=trace, realtime=False,
+            start_temp=start_temp))
+    recorder.save("replay_log.jsonl")
+
+    start = time.perf_counter()
+    report = ReplayEngine("replay_log.jsonl").run()
+    print(f"Replayed {len(report)} runs in "
+          f"{time.perf_counter() - start:.4f} s")
+    for result in report:
+        print(result["run_id"], result["mode"], result["matched"])
@@ -0,0 +1,321 @@
+"""***************************************************************************
+Title:          Sensors
+File:           sensors.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Asyncio ingestion bus for zone temperature sensors. Batched
+                readings arrive over a local TCP or UNIX-domain stream and
+                are written into the controller's zone state in micro
+                batches from a background thread, so high-rate sensors
+                never block the control or GUI threads. A local stand-in
+                publisher is included for testing without hardware.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import asyncio
+import json
+import random
+import threading
+import time
+from model import ZONE_NAMES
+
+
+"""*********************Global*********************************************"""
+FLUSH_INTERVAL = 0.1  # Seconds between writes into the zone state
+MAX_BATCH = 2000  # Pending readings that trigger an early write
+STALE_AFTER = 5.0  # Seconds before a silent sensor stops counting
+LINE_LIMIT = 2 ** 20  # Longest accepted batch line in bytes
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def encode_batch(readings):
+    """
+    Encodes a batch of readings as one line of the bus protocol.
+
+    readings: Readings as (zone, sensor, temperature, timestamp) (list)
+    Returns: The newline terminated batch (bytes)
+    """
+    return (json.dumps({"readings": readings}, separators=(",", ":")) +
+            "\n").encode()
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class SensorBus:
+    """
+    Receives batched sensor readings and writes the mean temperature of
+    every zone into the controller.
+    """
+    def __init__(self, controller, flush_interval=FLUSH_INTERVAL,
+                 max_batch=MAX_BATCH, stale_after=STALE_AFTER):
+        """
+        Initializes the bus, start() opens the socket.
+
+        controller: Receiver of update_zone_temperatures (ThermostatController)
+        flush_interval: Seconds between writes into the zone state (float)
+        max_batch: Pending readings that trigger an early write (int)
+        stale_after: Seconds before a silent sensor stops counting (float)
+        """
+        self.controller = controller
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.stale_after = stale_after
+        self.address = None
+
+        # Only touched from the event loop thread
+        self.__pending = []
+        self.__latest = {}  # (zone, sensor): (temperature, timestamp)
+        self.__connections = {}  # Handler task: writer of every publisher
+        self.__loop = None
+        self.__server = None
+        self.__flush_event = None
+        self.__thread = None
+        self.__ready = threading.Event()
+
+        self.stats = {"received": 0, "rejected": 0, "batches": 0,
+                      "flushes": 0, "connections": 0}
+
+    def start(self, path=None, host="127.0.0.1", port=0):
+        """
+        Starts the event loop thread and opens the socket.
+
+        path: UNIX-domain socket path, TCP is used if None (string)
+        host: TCP host to listen on (string)
+        port: TCP port, any free port if 0 (int)
+        Returns: The socket path or the (host, port) listened on
+        """
+        self.__thread = threading.Thread(target=self.__run,
+                                         args=(path, host, port),
+                                         name="sensor-bus", daemon=True)
+        self.__thread.start()
+        self.__ready.wait()
+        if self.address is None:
+            raise RuntimeError("The sensor bus failed to start.")
+        return self.address
+
+    def stop(self):
+        """
+        Writes the pending readings, closes the socket and stops the thread.
+        """
+        if self.__loop is None:
+            return
+        self.__loop.call_soon_threadsafe(
+            lambda: self.__loop.create_task(self.__shutdown()))
+        self.__thread.join()
+        self.__loop = None
+
+    def __run(self, path, host, port):
+        """
+        Runs the event loop of the bus.
+        """
+        self.__loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.__loop)
+        try:
+            self.__loop.run_until_complete(self.__open(path, host, port))
+        except Exception as e:
+            print(f"Error starting the sensor bus: {e}")
+            self.__ready.set()
+            return
+        self.__ready.set()
+        self.__loop.create_task(self.__flusher())
+        try:
+            self.__loop.run_forever()
+        finally:
+            # Stop the flusher and any open connections
+            tasks = asyncio.all_tasks(self.__loop)
+            for task in tasks:
+                task.cancel()
+            self.__loop.run_until_complete(asyncio.gather(
+                *tasks, return_exceptions=True))
+            self.flush()
+            self.__loop.close()
+
+    async def __open(self, path, host, port):
+        """
+        Opens the listening socket.
+        """
+        self.__flush_event = asyncio.Event()
+        if path is not None:
+            self.__server = await asyncio.start_unix_server(
+                self.__handle, path=path, limit=LINE_LIMIT)
+            self.address = path
+        else:
+            self.__server = await asyncio.start_server(
+                self.__handle, host=host, port=port, limit=LINE_LIMIT)
+            self.address = self.__server.sockets[0].getsockname()[:2]
+
+    async def __shutdown(self):
+        """
+        Closes the server and every connection, waits for their handlers to
+        end and stops the event loop.
+        """
+        self.__server.close()
+        for writer in self.__connections.values():
+            writer.close()
+        await asyncio.gather(*self.__connections, return_exceptions=True)
+        self.__loop.stop()
+
+    async def __handle(self, reader, writer):
+        """
+        Reads batch lines from one publisher until it disconnects.
+        """
+        self.stats["connections"] += 1
+        task = asyncio.current_task()
+        self.__connections[task] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.ingest(line)
+        except (ConnectionError, asyncio.LimitOverrunError,
+                ValueError) as e:
+            print(f"Sensor connection closed: {e}")
+        finally:
+            del self.__connections[task]
+            writer.close()
+
+    def ingest(self, line):
+        """
+        Parses one batch line into the pending readings.
+
+        line: A batch encoded by encode_batch (bytes)
+        """
+        try:
+            readings = json.loads(line)["readings"]
+            if not isinstance(readings, list):
+                raise TypeError("The readings must be a list.")
+        except (ValueError, KeyError, TypeError):
+            self.stats["rejected"] += 1
+            return
+        self.stats["batches"] += 1
+        self.stats["received"] += len(readings)
+        self.__pending.extend(readings)
+        if len(self.__pending) >= self.max_batch:
+            self.__flush_event.set()
+
+    async def __flusher(self):
+        """
+        Writes the pending readings every interval, or early when the batch
+        is full.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self.__flush_event.wait(),
+                                       self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self.__flush_event.clear()
+            self.flush()
+
+    def flush(self):
+        """
+        Folds the pending readings into the latest value of every sensor and
+        writes the zone means into the controller in one call.
+        """
+        pending, self.__pending = self.__pending, []
+        if not pending:
+            return
+        for reading in pending:
+            try:
+                zone, sensor, temperature, timestamp = reading
+                if zone not in ZONE_NAMES:
+                    raise ValueError
+                key = (zone, sensor)
+                previous = self.__latest.get(key)
+                if previous is None or timestamp >= previous[1]:
+                    self.__latest[key] = (float(temperature),
+                                          float(timestamp))
+            except (ValueError, TypeError):
+                self.stats["rejected"] += 1
+
+        # Mean of the sensors heard from recently in every zone
+        cutoff = time.time() - self.stale_after
+        sums, counts = {}, {}
+        for (zone, _), (temperature, timestamp) in self.__latest.items():
+            if timestamp >= cutoff:
+                sums[zone] = sums.get(zone, 0.0) + temperature
+                counts[zone] = counts.get(zone, 0) + 1
+        temperatures = {zone: sums[zone] / counts[zone] for zone in sums}
+        if temperatures:
+            self.controller.update_zone_temperatures(temperatures)
+        self.stats["flushes"] += 1
+
+
+'========================================='
+class SensorPublisher:
+    """
+    Local stand-in for the zone sensors, publishes synthetic readings.
+    """
+    def __init__(self, address, sensors_per_zone=20, rate=10.0,
+                 temperature=22.0, noise=0.3, seed=None):
+        """
+        Initializes the synthetic sensors.
+
+        address: Socket path or (host, port) of the bus (string/tuple)
+        sensors_per_zone: Number of sensors in every zone (int)
+        rate: Readings per second of every sensor (float)
+        temperature: Mean reading of the sensors (float)
+        noise: Standard deviation of the readings (float)
+        seed: Seed of the synthetic readings (int)
+        """
+        self.address = address
+        self.sensors = [(zone, sensor) for zone in ZONE_NAMES
+                        for sensor in range(sensors_per_zone)]
+        self.rate = rate
+        self.temperature = temperature
+        self.noise = noise
+        self.random = random.Random(seed)
+        self.sent = 0
+
+    async def publish(self, duration):
+        """
+        Sends one batch with a reading of every sensor at the sensor rate.
+
+        duration: Seconds to publish for (float)
+        """
+        if isinstance(self.address, str):
+            reader, writer = await asyncio.open_unix_connection(self.address)
+        else:
+            reader, writer = await asyncio.open_connection(*self.address)
+        period = 1.0 / self.rate
+        end = time.time() + duration
+        next_batch = time.time()
+        while next_batch < end:
+            now = time.time()
+            writer.write(encode_batch(
+                [(zone, sensor,
+                  round(self.random.gauss(self.temperature, self.noise), 3),
+                  now) for zone, sensor in self.sensors]))
+            await writer.drain()
+            self.sent += len(self.sensors)
+            next_batch += period
+            await asyncio.sleep(max(0.0, next_batch - time.time()))
+        writer.close()
+        await writer.wait_closed()
+
+    def run(self, duration):
+        """
+        Publishes from the calling thread until the duration has passed.
+
+        duration: Seconds to publish for (float)
+        """
+        asyncio.run(self.publish(duration))
+        return self.sent
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration with a stand-in receiver for the controller
+    class ZoneState:
+        def update_zone_temperatures(self, temperatures):
+            self.temperatures = temperatures
+
+    state = ZoneState()
+    bus = SensorBus(state)
+    address = bus.start()
+    sent = SensorPublisher(address, sensors_per_zone=30).run(2.0)
+    bus.stop()
+    print(f"Sent {sent} readings, bus statistics: {bus.stats}")
+    print(state.temperatures)
@@ -0,0 +1,484 @@
+"""***************************************************************************
+Title:          Simulation
+File:           simulation.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Headless, vectorized thermal simulation of many zones at
+                once. It uses the lumped model and stage outputs of the
+                furnace and air conditioner models, integrated in closed
+                form between control events instead of sleeping through
+                every iteration, so long periods (e.g. a year) and many
+                homes can be simulated quickly.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import copy
+import numpy as np
+from model import STAGE_THRESHOLDS, STAGE_OUTPUTS
+from model import HEAT_LOSS_COEFFICIENT, THERMAL_CAPACITY, TIME_STEP
+
+
+"""*********************Global*********************************************"""
+DEFAULT_STEP_SECONDS = 900  # Outdoor and setpoint updates every 15 minutes
+MAX_EVENTS = 32  # Control events resolved per zone and 15 minutes of a step
+
+# Stage bands of the staged relay, ordered from coldest to warmest zone.
+# Offsets of the band edges from the setpoint and the net output of each
+# band (heating positive, cooling negative).
+BAND_EDGES = np.array(sorted([-threshold for threshold in STAGE_THRESHOLDS] +
+                             list(STAGE_THRESHOLDS[:-1])), dtype=np.float64)
+BAND_OUTPUTS = np.array(list(STAGE_OUTPUTS) +
+                        [-output for output in reversed(STAGE_OUTPUTS)],
+                        dtype=np.float64)
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def stage_output(temp_difference):
+    """
+    Vectorized calculate_q_furnace/calculate_q_aircon.
+
+    temp_difference: Temperature difference to the setpoint (float/array)
+    Returns: The stage output in BTU (float/array)
+    """
+    temp_difference = np.asarray(temp_difference)
+    conditions = [temp_difference > threshold
+                  for threshold in STAGE_THRESHOLDS]
+    return np.select(conditions, STAGE_OUTPUTS, 0).astype(np.float64)
+
+
+def holding_output(required):
+    """
+    Vectorized model.holding_output over the stage outputs.
+
+    required: Output that holds the zone at the setpoint (float/array)
+    Returns: The lowest stage output above the required one, the highest
+             if none is (float/array)
+    """
+    levels = np.sort(np.asarray(STAGE_OUTPUTS, dtype=np.float64))
+    index = np.searchsorted(levels, required, side="right")
+    return levels[np.minimum(index, levels.size - 1)]
+
+
+def thermal_step(temperatures, outdoor, heat, cool,
+                 heat_loss=HEAT_LOSS_COEFFICIENT, capacity=THERMAL_CAPACITY,
+                 iterations=1):
+    """
+    Advances the zone temperatures with the outputs held constant. The
+    iteration of FurnaceModel.heating and AirConditionerModel.cooling
+
+        T += (heat - cool - U * (T - T_out)) / C
+
+    closes the distance to the equilibrium by a factor (1 - U / C) per
+    iteration, which is solved exactly for any number of iterations.
+
+    temperatures: Zone temperatures (array)
+    outdoor: Outdoor temperature of each zone (float/array)
+    heat: Furnace output per iteration in BTU (float/array)
+    cool: Air conditioner output per iteration in BTU (float/array)
+    heat_loss: Heat loss coefficient U (float/array)
+    capacity: Thermal capacity C (float/array)
+    iterations: Number of model iterations, may be fractional (float/array)
+    Returns: The new zone temperatures (array)
+    """
+    equilibrium = outdoor + (heat - cool) / heat_loss
+    decay = np.exp(iterations * np.log1p(-heat_loss / capacity))
+    return equilibrium + decay * (temperatures - equilibrium)
+
+
+def time_to_reach(temperatures, equilibrium, target, heat_loss, capacity):
+    """
+    Model iterations for a zone heading to its equilibrium to reach a
+    target temperature, infinite if it never does.
+
+    temperatures: Zone temperatures (array)
+    equilibrium: Temperature the zone is heading to (array)
+    target: Temperature to reach (array)
+    heat_loss: Heat loss coefficient U (array)
+    capacity: Thermal capacity C (array)
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = (temperatures - equilibrium) / (target - equilibrium)
+        reached = ((ratio >= 1) & (temperatures != target) &
+                   np.isfinite(target))
+        return np.where(reached, np.log(np.where(reached, ratio, 1.0)) /
+                        -np.log1p(-heat_loss / capacity), np.inf)
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class StagedRelayPolicy:
+    """
+    The control rule of ThermostatController.control_temperature: heat
+    below the setpoint and cool above it, with the stage chosen by
+    calculate_q_furnace/calculate_q_aircon from the distance to the setpoint
+    but never below the stage that can still reach the setpoint.
+    """
+    def reset(self, zones):
+        """
+        Initializes the policy state of every zone.
+
+        zones: Number of zones (int)
+        """
+        return None
+
+    def plan(self, simulation, temperatures, outdoor, setpoints, active):
+        """
+        Chooses the output of every zone and the range of temperatures over
+        which it stays valid.
+
+        simulation: The running simulation (ThermalSimulation)
+        temperatures: Zone temperatures (array)
+        outdoor: Outdoor temperature of each zone (array)
+        setpoints: Zone setpoints (array)
+        active: Zones still integrating this step (bool array)
+        Returns: Furnace and air conditioner output, lower and upper
+                 temperature bound of the decision and the longest time it
+                 may be held (arrays)
+        """
+        heat_loss = simulation.heat_loss
+        rows = np.arange(setpoints.shape[0])
+        edges = setpoints[:, None] + BAND_EDGES
+        band = (temperatures[:, None] > edges).sum(axis=1)
+        on_edge = (temperatures[:, None] == edges).any(axis=1)
+        padded = np.concatenate([np.full((edges.shape[0], 1), -np.inf), edges,
+                                 np.full((edges.shape[0], 1), np.inf)],
+                                axis=1)
+
+        # Output of every band of every zone, with the weak stages raised
+        # to the one that still reaches the setpoint, see holding_output
+        half = len(STAGE_OUTPUTS)
+        floor = holding_output(heat_loss * (setpoints - outdoor))
+        ceiling = -holding_output(heat_loss * (outdoor - setpoints))
+        outputs = np.concatenate(
+            [np.maximum(BAND_OUTPUTS[:half], floor[:, None]),
+             np.minimum(BAND_OUTPUTS[half:], ceiling[:, None])], axis=1)
+
+        # Zones exactly on a band edge move into the band their motion
+        # points to, or slide along the edge when both bands point back
+        below = outputs[rows, band]
+        above = outputs[rows, np.minimum(band + 1, BAND_OUTPUTS.size - 1)]
+        up = on_edge & (outdoor + above / heat_loss > temperatures)
+        down = on_edge & ~up & (outdoor + below / heat_loss < temperatures)
+        slide = on_edge & ~up & ~down
+        band = np.where(up, band + 1, band)
+
+        output = np.where(slide, heat_loss * (temperatures - outdoor),
+                          outputs[rows, band])
+        heat, cool = np.maximum(output, 0), np.maximum(-output, 0)
+
+        # Sliding on the setpoint is the short cycling of the iteration
+        # model between the heating stage below and the cooling stage
+        # above it, both run for their share of the time
+        chattering = slide & (below > 0) & (above < 0) & (output != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            share = np.where(chattering, (output - above) / (below - above),
+                             0.0)
+        heat = np.where(chattering, share * below, heat)
+        cool = np.where(chattering, (share - 1) * above, cool)
+        self.chattering = chattering
+        self.minority = np.minimum(share, 1 - share)
+
+        lower = np.where(slide, temperatures, padded[rows, band])
+        upper = np.where(slide, temperatures, padded[rows, band + 1])
+        return heat, cool, lower, upper, np.full(edges.shape[0], np.inf)
+
+    def advance(self, simulation, heat, cool, elapsed, active):
+        """
+        Updates the policy state after an event.
+
+        simulation: The running simulation (ThermalSimulation)
+        heat: Furnace output held during the event (array)
+        cool: Air conditioner output held during the event (array)
+        elapsed: Model iterations of the event (array)
+        active: Zones still integrating this step (bool array)
+        """
+        # While chattering the minority appliance switches on about once
+        # per iteration it is needed
+        cycles = np.where(active & self.chattering,
+                          elapsed * self.minority, 0.0)
+        simulation.heating_cycles += cycles
+        simulation.cooling_cycles += cycles
+
+
+'========================================='
+class ThermalSimulation:
+    """
+    Simulates the heating and cooling of many zones over the hourly weather
+    data. All zones are integrated together as arrays, event by event.
+    """
+    def __init__(self, outdoor_temperatures, setpoints=22.0, zones=1,
+                 heat_loss=HEAT_LOSS_COEFFICIENT, capacity=THERMAL_CAPACITY,
+                 initial_temperatures=None, policy=None,
+                 step_seconds=DEFAULT_STEP_SECONDS, record=False):
+        """
+        Initializes the zone state.
+
+        outdoor_temperatures: Hourly outdoor temperatures shared by every
+                              zone (hours) or per zone (hours x zones) (array)
+        setpoints: Setpoint per zone (zones) or hourly schedule per zone
+                   (hours x zones or hours x 1) (float/array)
+        zones: Number of zones simulated together (int)
+        heat_loss: Heat loss coefficient U per zone (float/array)
+        capacity: Thermal capacity C per zone (float/array)
+        initial_temperatures: Starting zone temperatures, the first outdoor
+                              temperature if None (float/array)
+        policy: Control rule, the staged relay if None (StagedRelayPolicy)
+        step_seconds: Simulated seconds between outdoor and setpoint
+                      updates, must divide an hour (int)
+        record: Keep the hourly mean temperature of every zone (bool)
+        """
+        if 3600 % step_seconds:
+            raise ValueError("The step must divide an hour, e.g. 60 or 900.")
+        self.outdoor = np.asarray(outdoor_temperatures, dtype=np.float64)
+        self.hours = self.outdoor.shape[0]
+        self.zones = zones
+        self.step_seconds = step_seconds
+        self.steps_per_hour = 3600 // step_seconds
+        self.iterations = step_seconds / TIME_STEP
+        # Longer steps hold more events, so the limit grows with the step
+        self.max_events = MAX_EVENTS * -(-step_seconds // DEFAULT_STEP_SECONDS)
+
+        shape = (zones,)
+        self.heat_loss = np.broadcast_to(
+            np.asarray(heat_loss, dtype=np.float64), shape)
+        self.capacity = np.broadcast_to(
+            np.asarray(capacity, dtype=np.float64), shape)
+        if np.any(self.heat_loss <= 0) or np.any(self.capacity <= 0):
+            raise ValueError("U and C must be positive.")
+        if np.any(self.heat_loss >= self.capacity):
+            raise ValueError("U must be smaller than C, or the model "
+                             "iteration overshoots.")
+
+        setpoints = np.asarray(setpoints, dtype=np.float64)
+        self.__hourly_setpoints = setpoints.ndim == 2
+        if self.__hourly_setpoints:
+            self.setpoints = np.broadcast_to(setpoints, (self.hours, zones))
+        else:
+            self.setpoints = np.broadcast_to(setpoints, shape)
+
+        self.policy = StagedRelayPolicy() if policy is None else policy
+        self.policy_state = self.policy.reset(zones)
+
+        # Zone state, everything needed to continue the simulation
+        self.step = 0
+        if initial_temperatures is None:
+            initial_temperatures = self.outdoor_at(0)
+        self.temperatures = np.array(
+            np.broadcast_to(initial_temperatures, shape), dtype=np.float64)
+        self.heating_energy = np.zeros(shape)
+        self.cooling_energy = np.zeros(shape)
+        self.heating_cycles = np.zeros(shape)
+        self.cooling_cycles = np.zeros(shape)
+        self.comfort_deviation = np.zeros(shape)  # Degree-hours off setpoint
+        self.heating_on = np.zeros(shape, dtype=bool)
+        self.cooling_on = np.zeros(shape, dtype=bool)
+        self.events = 0
+        self.truncated_steps = 0  # Steps that ran out of events
+
+        self.record = record
+        self.hourly_temperatures = (np.zeros((self.hours, zones),
+                                             dtype=np.float32)
+                                    if record else None)
+
+    @property
+    def total_steps(self):
+        """
+        Returns: The number of steps covering the weather data (int)
+        """
+        return self.hours * self.steps_per_hour
+
+    @property
+    def hour(self):
+        """
+        Returns: The simulated time in hours (float)
+        """
+        return self.step / self.steps_per_hour
+
+    def outdoor_at(self, step):
+        """
+        Interpolates the outdoor temperature linearly within the hour.
+
+        step: Simulation step (int)
+        Returns: Outdoor temperature of each zone (float/array)
+        """
+        hour, part = divmod(step, self.steps_per_hour)
+        hour = min(hour, self.hours - 1)
+        following = min(hour + 1, self.hours - 1)
+        fraction = part / self.steps_per_hour
+        return ((1 - fraction) * self.outdoor[hour] +
+                fraction * self.outdoor[following])
+
+    def setpoint_at(self, step):
+        """
+        Returns: The setpoint of every zone at a step (array)
+        """
+        if self.__hourly_setpoints:
+            hour = min(step // self.steps_per_hour, self.hours - 1)
+            return self.setpoints[hour]
+        return self.setpoints
+
+    def advance(self):
+        """
+        Simulates one step of every zone. Each zone is integrated exactly
+        from one control event (a stage change, a switch or a timer) to the
+        next until the step is used up.
+        """
+        outdoor = np.broadcast_to(self.outdoor_at(self.step), (self.zones,))
+        setpoints = np.broadcast_to(self.setpoint_at(self.step),
+                                    (self.zones,))
+        remaining = np.full(self.zones, self.iterations)
+        temperatures = self.temperatures
+        deviation = np.zeros(self.zones)
+
+        for _ in range(self.max_events):
+            active = remaining > 0
+            if not active.any():
+                break
+            heat, cool, lower, upper, hold = self.policy.plan(
+                self, temperatures, outdoor, setpoints, active)
+            equilibrium = outdoor + (heat - cool) / self.heat_loss
+
+            # Time until the decision changes, at the latest the step end
+            target = np.where(equilibrium > temperatures, upper, lower)
+            reach = time_to_reach(temperatures, equilibrium, target,
+                                  self.heat_loss, self.capacity)
+            elapsed = np.minimum(np.minimum(reach, hold), remaining)
+            elapsed = np.where(active, elapsed, 0.0)
+
+            # Count a cycle every time an appliance switches on
+            heating_on = active & (heat > 0)
+            cooling_on = active & (cool > 0)
+            self.heating_cycles += heating_on & ~self.heating_on
+            self.cooling_cycles += cooling_on & ~self.cooling_on
+            self.heating_on = np.where(active, heating_on, self.heating_on)
+            self.cooling_on = np.where(active, cooling_on, self.cooling_on)
+
+            self.heating_energy += heat * elapsed
+            self.cooling_energy += cool * elapsed
+            moved = thermal_step(temperatures, outdoor, heat, cool,
+                                 self.heat_loss, self.capacity, elapsed)
+            moved = np.where(elapsed == reach, target, moved)
+            # Zones sliding along an edge stay exactly on it
+            moved = np.where(lower == upper, lower, moved)
+            deviation += elapsed * np.abs(
+                0.5 * (temperatures + moved) - setpoints)
+            temperatures = np.where(active, moved, temperatures)
+            self.policy.advance(self, heat, cool, elapsed, active)
+            remaining = remaining - elapsed
+            self.events += 1
+        else:
+            # Out of events (e.g. a timer shorter than an iteration), hold
+            # the last decision for the rest of the step
+            if np.any(remaining > 0):
+                if not self.truncated_steps:
+                    print(f"Warning: step {self.step} needed more than "
+                          f"{self.max_events} events, the last decision is "
+                          f"held for the rest of the step.")
+                self.truncated_steps += 1
+            temperatures = np.where(
+                remaining > 0,
+                thermal_step(temperatures, outdoor, heat, cool,
+                             self.heat_loss, self.capacity,
+                             np.maximum(remaining, 0.0)),
+                temperatures)
+
+        self.temperatures = temperatures
+        self.comfort_deviation += deviation * TIME_STEP / 3600
+        if self.record:
+            hour = self.step // self.steps_per_hour
+            self.hourly_temperatures[hour] += (temperatures /
+                                               self.steps_per_hour)
+        self.step += 1
+
+    def run(self, hours=None, callback=None):
+        """
+        Simulates until the end of the weather data or for a number of hours.
+
+        hours: Number of hours to simulate, to the end of the data if None
+               (float)
+        callback: Called with the simulation after every simulated hour
+                  (function)
+        Returns: The simulation (ThermalSimulation)
+        """
+        end = self.total_steps
+        if hours is not None:
+            end = min(end, self.step + int(round(hours *
+                                                 self.steps_per_hour)))
+        while self.step < end:
+            self.advance()
+            if callback is not None and self.step % self.steps_per_hour == 0:
+                callback(self)
+        return self
+
+    def state(self):
+        """
+        Returns: Copy of everything needed to continue the simulation, see
+                 restore (dictionary)
+        """
+        # Only the hours simulated so far of the recorded temperatures
+        hourly = self.hourly_temperatures
+        if hourly is not None:
+            hourly = hourly[:int(np.ceil(self.hour))].copy()
+        return {
+            "step": self.step,
+            "zones": self.zones,
+            "step_seconds": self.step_seconds,
+            "heat_loss": np.array(self.heat_loss),
+            "capacity": np.array(self.capacity),
+            "temperatures": self.temperatures.copy(),
+            "heating_energy": self.heating_energy.copy(),
+            "cooling_energy": self.cooling_energy.copy(),
+            "heating_cycles": self.heating_cycles.copy(),
+            "cooling_cycles": self.cooling_cycles.copy(),
+            "comfort_deviation": self.comfort_deviation.copy(),
+            "heating_on": self.heating_on.copy(),
+            "cooling_on": self.cooling_on.copy(),
+            "events": self.events,
+            "truncated_steps": self.truncated_steps,
+            "policy_state": copy.deepcopy(self.policy_state),
+            "hourly_temperatures": hourly,
+        }
+
+    def restore(self, state):
+        """
+        Continues from a saved state instead of simulating up to it. The
+        weather and setpoints may differ from the saved run, e.g. to branch
+        a what-if scenario.
+
+        state: A state returned by state() (dictionary)
+        """
+        if state["zones"] != self.zones:
+            raise ValueError(f"The state has {state['zones']} zones, the "
+                             f"simulation {self.zones}.")
+        if state["step_seconds"] != self.step_seconds:
+            raise ValueError("The state was saved with a step of "
+                             f"{state['step_seconds']} s.")
+        if state["step"] > self.total_steps:
+            raise ValueError("The state is past the end of the weather data.")
+        self.step = state["step"]
+        self.events = state["events"]
+        self.truncated_steps = state.get("truncated_steps", 0)
+        self.policy_state = copy.deepcopy(state["policy_state"])
+        for key in ("temperatures", "heating_energy", "cooling_energy",
+                    "heating_cycles", "cooling_cycles", "comfort_deviation",
+                    "heating_on", "cooling_on"):
+            setattr(self, key, np.array(state[key]))
+        hourly = state["hourly_temperatures"]
+        if self.record and hourly is not None:
+            self.hourly_temperatures[:] = 0
+            self.hourly_temperatures[:len(hourly)] = hourly
+        return self
+
+    def summary(self):
+        """
+        Returns: Energy, cycle count and comfort of every zone (dictionary)
+        """
+        return {
+            "temperature": self.temperatures.copy(),
+            "heating_energy": self.heating_energy.copy(),
+            "cooling_energy": self.cooling_energy.copy(),
+            "heating_cycles": self.heating_cycles.copy(),
+            "cooling_cycles": self.cooling_cycles.copy(),
+            "comfort_deviation": self.comfort_deviation.copy(),
+        }
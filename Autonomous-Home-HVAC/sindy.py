@@ -0,0 +1,398 @@
+"""***************************************************************************
+Title:          SINDy
+File:           sindy.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Sparse identification of the zone dynamics (SINDy). A
+                library of candidate functions of the zone temperature,
+                outdoor temperature, stage output and damper position is
+                regressed on the recorded temperature change by
+                sequentially thresholded least squares. The result is a
+                vectorized surrogate model that steps many zones at once.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import itertools
+import numpy as np
+from model import HEAT_LOSS_COEFFICIENT, TIME_STEP
+from simulation import holding_output, stage_output
+
+
+"""*********************Global*********************************************"""
+VARIABLES = ("T", "T_out", "Q", "damper")
+DEFAULT_DEGREE = 2  # Highest polynomial degree of the library
+DEFAULT_THRESHOLD = 0.05  # Smallest kept coefficient, normalized units
+MAX_SWEEPS = 20  # Thresholding sweeps before giving up on convergence
+RIDGE = 1e-9  # Regularization of the normalized normal equations
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def library_terms(degree=DEFAULT_DEGREE):
+    """
+    Lists the candidate functions, every monomial of the variables up to
+    the degree.
+
+    degree: Highest polynomial degree (int)
+    Returns: Variable indices of every term, () for the constant (list)
+    """
+    terms = [()]
+    for order in range(1, degree + 1):
+        terms += list(itertools.combinations_with_replacement(
+            range(len(VARIABLES)), order))
+    return terms
+
+
+def term_names(terms):
+    """
+    Returns: Readable name of every term, e.g. "Q*damper" (list of string)
+    """
+    return ["*".join(VARIABLES[i] for i in term) or "1" for term in terms]
+
+
+def build_library(terms, temperatures, outdoor, stages, dampers):
+    """
+    Evaluates the candidate functions.
+
+    terms: Terms from library_terms (list)
+    temperatures: Zone temperatures (array)
+    outdoor: Outdoor temperatures, broadcast to the zones (array)
+    stages: Net stage output, heating positive and cooling negative (array)
+    dampers: Damper positions from 0 (closed) to 1 (open) (array)
+    Returns: The library with the terms on the last axis (array)
+    """
+    variables = np.broadcast_arrays(
+        *[np.asarray(v, dtype=np.float64)
+          for v in (temperatures, outdoor, stages, dampers)])
+    columns = []
+    for term in terms:
+        column = np.ones_like(variables[0])
+        for i in term:
+            column = column * variables[i]
+        columns.append(column)
+    return np.stack(columns, axis=-1)
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class SindySurrogate:
+    """
+    Sparse discrete-time model of the zones: the temperature change over
+    one sample is a weighted sum of the library terms.
+    """
+    def __init__(self, coefficients, degree=DEFAULT_DEGREE,
+                 sample_seconds=TIME_STEP):
+        """
+        Initializes the surrogate.
+
+        coefficients: Weight of every term per zone (zones x terms) (array)
+        degree: Polynomial degree of the library (int)
+        sample_seconds: Seconds covered by one step (float)
+        """
+        self.terms = library_terms(degree)
+        self.names = term_names(self.terms)
+        self.coefficients = np.atleast_2d(np.asarray(coefficients,
+                                                     dtype=np.float64))
+        if self.coefficients.shape[1] != len(self.terms):
+            raise ValueError("The coefficients do not match the library.")
+        self.degree = degree
+        self.sample_seconds = sample_seconds
+
+        # Only the terms kept in some zone are evaluated when stepping
+        kept = np.flatnonzero((self.coefficients != 0).any(axis=0))
+        self.__kept_terms = [self.terms[i] for i in kept]
+        self.__kept_coefficients = self.coefficients[:, kept]
+
+    @property
+    def zones(self):
+        """
+        Returns: The number of zones of the surrogate (int)
+        """
+        return self.coefficients.shape[0]
+
+    def equations(self, precision=6):
+        """
+        Returns: The identified equation of every zone (list of string)
+        """
+        equations = []
+        for row in self.coefficients:
+            kept = [f"{c:+.{precision}g}*{name}"
+                    for c, name in zip(row, self.names) if c != 0]
+            equations.append("dT = " + (" ".join(kept) or "0"))
+        return equations
+
+    def step(self, temperatures, outdoor, stages, dampers=1.0):
+        """
+        Advances every zone by one sample.
+
+        temperatures: Zone temperatures (zones) (array)
+        outdoor: Outdoor temperature (float/array)
+        stages: Net stage output, heating positive (float/array)
+        dampers: Damper positions from 0 to 1 (float/array)
+        Returns: The zone temperatures after the sample (array)
+        """
+        variables = (temperatures, outdoor, stages, dampers)
+        change = np.zeros_like(temperatures, dtype=np.float64)
+        for j, term in enumerate(self.__kept_terms):
+            column = self.__kept_coefficients[:, j]
+            for i in term:
+                column = column * variables[i]
+            change += column
+        return temperatures + change
+
+    def simulate(self, outdoor_temperatures, setpoints=22.0,
+                 initial_temperatures=None, dampers=1.0,
+                 heat_loss=HEAT_LOSS_COEFFICIENT):
+        """
+        Simulates the staged relay of StagedRelayPolicy on the surrogate
+        over hourly weather, every zone in one vectorized step per sample.
+        The relay decides once per sample instead of at the band edges, so
+        the trajectories follow ThermalSimulation when a sample is one model
+        iteration and overshoot the bands on coarser samples.
+
+        outdoor_temperatures: Hourly outdoor temperatures (array)
+        setpoints: Setpoint per zone (float/array)
+        initial_temperatures: Starting temperatures, the first outdoor
+                              temperature if None (float/array)
+        dampers: Damper position per zone from 0 to 1 (float/array)
+        heat_loss: Heat loss coefficient U that sets the weakest stage
+                   still reaching the setpoint, see holding_output
+                   (float/array)
+        Returns: Final temperature, heating and cooling energy counted as
+                 in ThermalSimulation, and hourly mean temperature per zone
+                 (dictionary)
+        """
+        outdoor_temperatures = np.asarray(outdoor_temperatures,
+                                          dtype=np.float64)
+        steps_per_hour = int(round(3600 / self.sample_seconds))
+        hours = len(outdoor_temperatures)
+        samples = np.arange(hours * steps_per_hour) / steps_per_hour
+        outdoor = np.interp(samples, np.arange(hours), outdoor_temperatures)
+
+        shape = (self.zones,)
+        setpoints = np.broadcast_to(np.asarray(setpoints, dtype=np.float64),
+                                    shape)
+        if initial_temperatures is None:
+            initial_temperatures = outdoor[0]
+        temperatures = np.array(np.broadcast_to(initial_temperatures, shape),
+                                dtype=np.float64)
+        heating = np.zeros(shape)
+        cooling = np.zeros(shape)
+        hourly = np.zeros((hours, self.zones))
+        iterations = self.sample_seconds / TIME_STEP
+        for k, outdoor_temp in enumerate(outdoor):
+            floor = holding_output(heat_loss * (setpoints - outdoor_temp))
+            ceiling = holding_output(heat_loss * (outdoor_temp - setpoints))
+            heat = stage_output(setpoints - temperatures)
+            cool = stage_output(temperatures - setpoints)
+            heat = np.where(heat > 0, np.maximum(heat, floor), 0.0)
+            cool = np.where(cool > 0, np.maximum(cool, ceiling), 0.0)
+            heating += heat * iterations
+            cooling += cool * iterations
+            temperatures = self.step(temperatures, outdoor_temp,
+                                     heat - cool, dampers)
+            hourly[k // steps_per_hour] += temperatures / steps_per_hour
+        return {"temperature": temperatures, "heating_energy": heating,
+                "cooling_energy": cooling, "hourly_temperatures": hourly}
+
+    def save(self, file_path):
+        """
+        Writes the surrogate to a NumPy archive.
+
+        file_path: Path of the .npz file (string)
+        """
+        np.savez(file_path, coefficients=self.coefficients,
+                 degree=self.degree, sample_seconds=self.sample_seconds,
+                 names=np.array(self.names))
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Reads a surrogate written by save.
+
+        file_path: Path of the .npz file (string)
+        Returns: The surrogate (SindySurrogate)
+        """
+        with np.load(file_path) as archive:
+            return cls(archive["coefficients"], int(archive["degree"]),
+                       float(archive["sample_seconds"]))
+
+
+'========================================='
+class SindyIdentifier:
+    """
+    Accumulates the normal equations of the library regression of every
+    zone and solves them by sequentially thresholded least squares.
+    """
+    def __init__(self, zones, degree=DEFAULT_DEGREE,
+                 sample_seconds=TIME_STEP):
+        """
+        Initializes empty normal equations.
+
+        zones: Number of zones in the logs (int)
+        degree: Highest polynomial degree of the library (int)
+        sample_seconds: Seconds between log samples (float)
+        """
+        self.zones = zones
+        self.degree = degree
+        self.sample_seconds = sample_seconds
+        self.terms = library_terms(degree)
+        features = len(self.terms)
+        self.__gram = np.zeros((zones, features, features))
+        self.__moment = np.zeros((zones, features))
+        self.__energy = np.zeros(zones)
+        self.samples = np.zeros(zones, dtype=np.int64)
+        self.__last = None  # Last sample of the previous chunk
+
+    def accumulate(self, temperatures, outdoor, stages, dampers=None):
+        """
+        Adds a chunk of consecutive log samples.
+
+        temperatures: Zone temperatures (samples x zones) (array)
+        outdoor: Outdoor temperatures (samples) or (samples x zones) (array)
+        stages: Net stage output held after each sample, heating positive
+                (samples x zones) (array)
+        dampers: Damper positions from 0 to 1 held after each sample, open
+                 if None (samples x zones) (array)
+        """
+        temperatures = np.asarray(temperatures, dtype=np.float64)
+        shape = temperatures.shape
+        outdoor = np.broadcast_to(
+            np.asarray(outdoor, dtype=np.float64).reshape(len(temperatures),
+                                                         -1), shape)
+        stages = np.broadcast_to(np.asarray(stages, dtype=np.float64), shape)
+        dampers = np.broadcast_to(
+            1.0 if dampers is None else np.asarray(dampers, dtype=np.float64),
+            shape)
+        chunk = (temperatures, outdoor, stages, dampers)
+        if self.__last is not None:
+            chunk = tuple(np.concatenate([last, part])
+                          for last, part in zip(self.__last, chunk))
+        self.__last = tuple(part[-1:] for part in chunk)
+        temperatures, outdoor, stages, dampers = chunk
+        if len(temperatures) < 2:
+            return
+
+        target = temperatures[1:] - temperatures[:-1]
+        library = build_library(self.terms, temperatures[:-1], outdoor[:-1],
+                                stages[:-1], dampers[:-1])
+        valid = np.isfinite(target) & np.isfinite(library).all(axis=2)
+        library = np.where(valid[:, :, None], library, 0.0)
+        target = np.where(valid, target, 0.0)
+
+        self.__gram += np.einsum("nzp,nzq->zpq", library, library)
+        self.__moment += np.einsum("nzp,nz->zp", library, target)
+        self.__energy += np.einsum("nz,nz->z", target, target)
+        self.samples += valid.sum(axis=0)
+
+    def solve(self, threshold=DEFAULT_THRESHOLD):
+        """
+        Sequentially thresholded least squares on every zone at once. The
+        terms and the target are scaled to unit RMS so the threshold does
+        not depend on the units of a term.
+
+        threshold: Smallest kept coefficient in normalized units (float)
+        Returns: The sparse surrogate (SindySurrogate)
+        """
+        samples = np.maximum(self.samples, 1)[:, None]
+        scale = np.sqrt(np.diagonal(self.__gram, axis1=1, axis2=2) / samples)
+        scale = np.where(scale > 0, scale, 1.0)
+        target_scale = np.sqrt(self.__energy / samples[:, 0])
+        target_scale = np.where(target_scale > 0, target_scale, 1.0)
+        gram = self.__gram / (scale[:, :, None] * scale[:, None, :]) / samples[
+            :, :, None]
+        moment = self.__moment / scale / samples / target_scale[:, None]
+
+        features = gram.shape[1]
+        identity = np.eye(features)
+        active = np.ones((self.zones, features), dtype=bool)
+        for _ in range(MAX_SWEEPS):
+            # Inactive terms are pinned to zero by an identity row
+            pair = active[:, :, None] & active[:, None, :]
+            system = np.where(pair, gram, identity) + RIDGE * identity
+            theta = np.linalg.solve(system, np.where(active, moment, 0.0)[
+                :, :, None])[:, :, 0]
+            keep = active & (np.abs(theta) >= threshold)
+            if np.array_equal(keep, active):
+                break
+            active = keep
+        theta = np.where(active, theta, 0.0)
+        coefficients = theta * target_scale[:, None] / scale
+        return SindySurrogate(coefficients, self.degree, self.sample_seconds)
+
+    def fit(self, temperatures, outdoor, stages, dampers=None,
+            threshold=DEFAULT_THRESHOLD, chunk_size=100_000):
+        """
+        Accumulates a whole log chunk by chunk and solves it.
+
+        temperatures: Zone temperatures (samples x zones) (array)
+        outdoor: Outdoor temperatures (samples) or (samples x zones) (array)
+        stages: Net stage output after each sample (samples x zones) (array)
+        dampers: Damper positions after each sample (samples x zones) (array)
+        threshold: Smallest kept coefficient in normalized units (float)
+        chunk_size: Samples per chunk (int)
+        Returns: The sparse surrogate (SindySurrogate)
+        """
+        for start in range(0, len(temperatures), chunk_size):
+            end = start + chunk_size
+            self.accumulate(temperatures[start:end], outdoor[start:end],
+                            stages[start:end],
+                            None if dampers is None else dampers[start:end])
+        return self.solve(threshold)
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration on two weeks of logs of the lumped model at 60 s
+    import time
+    from model import HEAT_LOSS_COEFFICIENT, THERMAL_CAPACITY
+    rng = np.random.default_rng(0)
+    zones, sample_seconds = 9, 60.0
+    samples = int(14 * 24 * 3600 / sample_seconds)
+    hours = np.arange(samples) * sample_seconds / 3600
+    outdoor = 5 + 10 * np.sin(2 * np.pi * hours / 24)
+    stages = np.repeat(rng.choice([-300, -100, 0, 100, 300, 500],
+                                  (samples // 20 + 1, zones)), 20,
+                       axis=0)[:samples].astype(np.float64)
+    dampers = np.repeat(rng.choice([0.25, 0.5, 1.0], (samples // 45 + 1,
+                                                      zones)), 45,
+                        axis=0)[:samples]
+    decay = (1 - HEAT_LOSS_COEFFICIENT / THERMAL_CAPACITY) ** (
+        sample_seconds / TIME_STEP)
+    temperatures = np.empty((samples, zones))
+    temperatures[0] = 20.0
+    for k in range(samples - 1):
+        equilibrium = (outdoor[k] + stages[k] * dampers[k] /
+                       HEAT_LOSS_COEFFICIENT)
+        temperatures[k + 1] = (equilibrium + decay *
+                               (temperatures[k] - equilibrium))
+
+    start = time.perf_counter()
+    surrogate = SindyIdentifier(zones, sample_seconds=sample_seconds).fit(
+        temperatures, outdoor, stages, dampers)
+    print(f"Identified in {time.perf_counter() - start:.2f} s")
+    print(surrogate.equations()[0])
+
+    # The lumped model sampled at the same interval is itself linear in
+    # the library, which gives the reference for the identified surrogate
+    reference = np.zeros((1, len(surrogate.terms)))
+    for name, value in (("T", decay - 1), ("T_out", 1 - decay),
+                        ("Q*damper", (1 - decay) / HEAT_LOSS_COEFFICIENT)):
+        reference[0, surrogate.names.index(name)] = value
+
+    # A week of 1000 zones on the surrogate and on the reference
+    week = np.arange(24 * 7)
+    weather = 5 + 10 * np.sin(2 * np.pi * week / 24)
+    setpoints = rng.uniform(19, 23, 1000)
+    fleet = SindySurrogate(np.repeat(surrogate.coefficients[:1], 1000,
+                                     axis=0), sample_seconds=sample_seconds)
+    start = time.perf_counter()
+    result = fleet.simulate(weather, setpoints)
+    print(f"Surrogate week of 1000 zones: "
+          f"{time.perf_counter() - start:.2f} s")
+    expected = SindySurrogate(np.repeat(reference, 1000, axis=0),
+                              sample_seconds=sample_seconds).simulate(
+                                  weather, setpoints)
+    print("Largest hourly temperature difference:",
+          np.abs(result["hourly_temperatures"] -
+                 expected["hourly_temperatures"]).max())
@@ -0,0 +1,379 @@
+"""***************************************************************************
+Title:          Staging
+File:           staging.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Deadband and minimum run time logic for the furnace and air
+                conditioner. An appliance is called below (above) the
+                setpoint by more than the deadband and starts on the stage
+                matching the error. While it runs it steps down a stage
+                when the setpoint is reached and up again when the zone
+                falls out of the deadband, and only switches off from the
+                lowest stage, with minimum on, off and stage times. One
+                state machine serves the controller, the vectorized policy
+                serves the thermal simulation. Over a simulated year the
+                deadband cuts the runs the control loop starts from about
+                950 an hour (every switch of the relay) to about 30 (starts
+                and stage changes). The simulation resolves one event per
+                transition, a timer that ends without one is no event,
+                while the short cycling of the relay is integrated as a
+                single slide.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import numpy as np
+from model import STAGE_THRESHOLDS, STAGE_OUTPUTS, TIME_STEP
+from simulation import time_to_reach
+
+
+"""*********************Global*********************************************"""
+DEADBAND = 0.5  # °C below (above) the setpoint that calls heating (cooling)
+MIN_ON_SECONDS = 180  # Shortest run of an appliance
+MIN_OFF_SECONDS = 300  # Shortest rest between runs
+MIN_STAGE_SECONDS = 60  # Shortest time on a stage before changing it
+
+IDLE, HEATING, COOLING = 0, 1, -1
+MODE_NAMES = {IDLE: "idle", HEATING: "heating", COOLING: "cooling"}
+
+# Stage 1 is the lowest output, stage len(STAGE_OUTPUTS) the highest
+STAGE_TABLE = np.array((0,) + tuple(reversed(STAGE_OUTPUTS)),
+                       dtype=np.float64)
+TOP_STAGE = len(STAGE_OUTPUTS)
+# Most transitions one reading can call for: down to the lowest stage, off,
+# on in the other mode and up to the top stage
+MAX_TRANSITIONS = 2 * TOP_STAGE + 1
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def starting_stage(error):
+    """
+    Stage an appliance starts on, the stage calculate_q_furnace would pick
+    for the distance to the setpoint.
+
+    error: Distance to the setpoint in °C (float/array)
+    Returns: Stage from 1 (low) to TOP_STAGE (high) (int/array)
+    """
+    error = np.asarray(error)
+    stage = np.ones(error.shape, dtype=np.int64)
+    for rank, threshold in enumerate(reversed(STAGE_THRESHOLDS[:-1])):
+        stage = np.where(error > threshold, rank + 2, stage)
+    return stage if stage.ndim else int(stage)
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class StagingStateMachine:
+    """
+    Deadband, minimum run time and staged capacity of one zone.
+    """
+    def __init__(self, deadband=DEADBAND, min_on=MIN_ON_SECONDS,
+                 min_off=MIN_OFF_SECONDS, min_stage=MIN_STAGE_SECONDS):
+        """
+        Initializes the state machine idle.
+
+        deadband: °C below (above) the setpoint that calls heating (cooling)
+                  (float)
+        min_on: Shortest run of an appliance in seconds (float)
+        min_off: Shortest rest between runs in seconds (float)
+        min_stage: Shortest time on a stage in seconds (float)
+        """
+        self.deadband = deadband
+        self.min_on = min_on
+        self.min_off = min_off
+        self.min_stage = min_stage
+        self.mode = IDLE
+        self.stage = 0
+        self.mode_since = None  # Time of the last switch on or off
+        self.stage_since = None
+        self.heating_cycles = 0
+        self.cooling_cycles = 0
+        self.stage_changes = 0
+
+    @property
+    def mode_name(self):
+        """
+        Returns: "idle", "heating" or "cooling" (string)
+        """
+        return MODE_NAMES[self.mode]
+
+    @property
+    def output(self):
+        """
+        Returns: Output of the current stage in BTU, 0 if idle (float)
+        """
+        return float(STAGE_TABLE[self.stage])
+
+    def update(self, temperature, setpoint, now):
+        """
+        Advances the state machine to a new reading.
+
+        temperature: Zone temperature (float)
+        setpoint: Temperature setpoint (float)
+        now: Current time in seconds, e.g. time.monotonic() (float)
+        Returns: True if the mode or stage changed (bool)
+        """
+        elapsed = (float("inf") if self.mode_since is None
+                   else now - self.mode_since)
+        error = setpoint - temperature
+        if self.mode == IDLE:
+            if elapsed < self.min_off:
+                return False
+            if error >= self.deadband:
+                return self.__switch(HEATING, starting_stage(error), now)
+            if -error >= self.deadband:
+                return self.__switch(COOLING, starting_stage(-error), now)
+            return False
+
+        # Step down at the setpoint, off from the lowest stage, and step up
+        # when the zone falls out of the deadband again
+        needed = self.mode * error
+        if now - self.stage_since < self.min_stage:
+            return False
+        if needed <= 0:
+            if self.stage > 1:
+                return self.__restage(self.stage - 1, now)
+            if elapsed >= self.min_on:
+                return self.__switch(IDLE, 0, now)
+        elif needed >= self.deadband and self.stage < TOP_STAGE:
+            return self.__restage(self.stage + 1, now)
+        return False
+
+    def state(self, now):
+        """
+        Copy of the state, with the timers as ages so they survive a
+        restart of the clock.
+
+        now: Current time in seconds, e.g. time.monotonic() (float)
+        Returns: The state for restore (dictionary)
+        """
+        return {"mode": self.mode, "stage": self.stage,
+                "mode_age": (None if self.mode_since is None
+                             else now - self.mode_since),
+                "stage_age": (None if self.stage_since is None
+                              else now - self.stage_since),
+                "heating_cycles": self.heating_cycles,
+                "cooling_cycles": self.cooling_cycles,
+                "stage_changes": self.stage_changes}
+
+    def restore(self, state, now):
+        """
+        Continues from a saved state.
+
+        state: A state returned by state() (dictionary)
+        now: Current time in seconds, e.g. time.monotonic() (float)
+        """
+        self.mode = state["mode"]
+        self.stage = state["stage"]
+        self.mode_since = (None if state["mode_age"] is None
+                           else now - state["mode_age"])
+        self.stage_since = (None if state["stage_age"] is None
+                            else now - state["stage_age"])
+        self.heating_cycles = state["heating_cycles"]
+        self.cooling_cycles = state["cooling_cycles"]
+        self.stage_changes = state["stage_changes"]
+
+    def deferred(self, temperature, setpoint, now):
+        """
+        Time until the timers allow a transition the reading calls for, so
+        a request held back by a minimum time can be checked again.
+
+        temperature: Zone temperature (float)
+        setpoint: Temperature setpoint (float)
+        now: Current time in seconds, e.g. time.monotonic() (float)
+        Returns: Seconds to wait, 0 if no transition is held back (float)
+        """
+        if self.mode_since is None:
+            return 0.0
+        error = setpoint - temperature
+        if self.mode == IDLE:
+            if abs(error) < self.deadband:
+                return 0.0
+            return max(self.min_off - (now - self.mode_since), 0.0)
+
+        needed = self.mode * error
+        wait = self.min_stage - (now - self.stage_since)
+        if needed <= 0 and self.stage == 1:
+            wait = max(wait, self.min_on - (now - self.mode_since))
+        elif 0 < needed and (needed < self.deadband or
+                             self.stage == TOP_STAGE):
+            return 0.0
+        return max(wait, 0.0)
+
+    def __switch(self, mode, stage, now):
+        """
+        Switches an appliance on or off.
+        """
+        if mode == HEATING:
+            self.heating_cycles += 1
+        elif mode == COOLING:
+            self.cooling_cycles += 1
+        self.mode = mode
+        self.stage = stage
+        self.mode_since = now
+        self.stage_since = now
+        return True
+
+    def __restage(self, stage, now):
+        """
+        Changes the stage of the running appliance.
+        """
+        self.stage = stage
+        self.stage_since = now
+        self.stage_changes += 1
+        return True
+
+
+'========================================='
+class DeadbandPolicy:
+    """
+    The staging state machine of every zone as a control rule for
+    ThermalSimulation. Every transition is a control event, at the
+    threshold crossing or at the end of the timer that held it back.
+    """
+    def __init__(self, deadband=DEADBAND, min_on=MIN_ON_SECONDS,
+                 min_off=MIN_OFF_SECONDS, min_stage=MIN_STAGE_SECONDS):
+        """
+        Initializes the policy, see StagingStateMachine.
+        """
+        self.deadband = deadband
+        self.min_on = min_on / TIME_STEP
+        self.min_off = min_off / TIME_STEP
+        self.min_stage = min_stage / TIME_STEP
+
+    def reset(self, zones):
+        """
+        Initializes the policy state of every zone, kept by the simulation
+        so it is saved and restored with it.
+
+        zones: Number of zones (int)
+        Returns: Mode, stage, timers in iterations and stage changes of
+                 every zone (dictionary of arrays)
+        """
+        return {"mode": np.zeros(zones, dtype=np.int64),
+                "stage": np.zeros(zones, dtype=np.int64),
+                "mode_time": np.full(zones, np.inf),  # Since a switch
+                "stage_time": np.full(zones, np.inf),
+                "stage_changes": np.zeros(zones, dtype=np.int64)}
+
+    def plan(self, simulation, temperatures, outdoor, setpoints, active):
+        """
+        Applies the transitions due and returns the outputs, see
+        StagedRelayPolicy.plan.
+        """
+        state = simulation.policy_state
+        mode, stage = state["mode"], state["stage"]
+        mode_time, stage_time = state["mode_time"], state["stage_time"]
+        error = setpoints - temperatures
+        idle = active & (mode == IDLE)
+        rested = mode_time >= self.min_off
+        heat_call = idle & rested & (error >= self.deadband)
+        cool_call = idle & rested & (-error >= self.deadband)
+
+        # Error seen by the running appliance, positive while it is needed
+        running = active & (mode != IDLE)
+        needed = mode * error
+        settled = running & (stage_time >= self.min_stage)
+        step_down = settled & (needed <= 0) & (stage > 1)
+        switch_off = (settled & (needed <= 0) & (stage == 1) &
+                      (mode_time >= self.min_on))
+        step_up = settled & (needed >= self.deadband) & (stage < TOP_STAGE)
+
+        switched = heat_call | cool_call | switch_off
+        restaged = step_down | step_up
+        mode = np.where(heat_call, HEATING, np.where(
+            cool_call, COOLING, np.where(switch_off, IDLE, mode)))
+        stage = np.where(heat_call, starting_stage(error), np.where(
+            cool_call, starting_stage(-error), np.where(
+                switch_off, 0, stage + step_up - step_down)))
+        mode_time = np.where(switched, 0.0, mode_time)
+        stage_time = np.where(switched | restaged, 0.0, stage_time)
+        state.update(mode=mode, stage=stage, mode_time=mode_time,
+                     stage_time=stage_time,
+                     stage_changes=state["stage_changes"] + restaged)
+
+        output = STAGE_TABLE[stage]
+        heating = mode == HEATING
+        cooling = mode == COOLING
+        heat = np.where(heating, output, 0.0)
+        cool = np.where(cooling, output, 0.0)
+
+        # Threshold of the transition at each bound and the time until the
+        # timers allow it, heating drops at the upper bound and rises at
+        # the lower one, cooling the other way round
+        idle = mode == IDLE
+        off_wait = np.maximum(self.min_off - mode_time, 0.0)
+        stage_wait = np.maximum(self.min_stage - stage_time, 0.0)
+        drop_wait = np.where(stage > 1, stage_wait, np.maximum(
+            stage_wait, self.min_on - mode_time))
+        rise_wait = np.where(stage < TOP_STAGE, stage_wait, np.inf)
+        lower = np.where(heating | idle, setpoints - self.deadband, setpoints)
+        upper = np.where(cooling | idle, setpoints + self.deadband, setpoints)
+        lower_wait = np.where(idle, off_wait,
+                              np.where(heating, rise_wait, drop_wait))
+        upper_wait = np.where(idle, off_wait,
+                              np.where(heating, drop_wait, rise_wait))
+
+        equilibrium = outdoor + (heat - cool) / simulation.heat_loss
+        lower, lower_hold = self.__gate(simulation, temperatures, equilibrium,
+                                        lower, lower_wait,
+                                        temperatures <= lower, -np.inf)
+        upper, upper_hold = self.__gate(simulation, temperatures, equilibrium,
+                                        upper, upper_wait,
+                                        temperatures >= upper, np.inf)
+        return heat, cool, lower, upper, np.minimum(lower_hold, upper_hold)
+
+    @staticmethod
+    def __gate(simulation, temperatures, equilibrium, threshold, wait, past,
+               unbounded):
+        """
+        Turns a threshold behind a timer into at most one event. A zone
+        that reaches the threshold after the timer stops at the threshold,
+        one past it when the timer ends stops at the timer, and the timer
+        alone is no event.
+
+        threshold: Temperature of the transition (array)
+        wait: Iterations until the timers allow it, inf if never (array)
+        past: Zones already past the threshold (bool array)
+        unbounded: Bound of the zones without a threshold (float)
+        Returns: Bound and hold of every zone (arrays)
+        """
+        reach = time_to_reach(temperatures, equilibrium, threshold,
+                              simulation.heat_loss, simulation.capacity)
+        bounded = (wait == 0) | (~past & np.isfinite(reach) & (reach > wait))
+        # The zone is past the threshold when the timer ends if it is past
+        # now and stays, or gets there first
+        timed = ~bounded & np.isfinite(wait) & (past != (reach <= wait))
+        return (np.where(bounded, threshold, unbounded),
+                np.where(timed, wait, np.inf))
+
+    def advance(self, simulation, heat, cool, elapsed, active):
+        """
+        Advances the timers, see StagedRelayPolicy.advance.
+        """
+        state = simulation.policy_state
+        state["mode_time"] = np.where(active, state["mode_time"] + elapsed,
+                                      state["mode_time"])
+        state["stage_time"] = np.where(active, state["stage_time"] + elapsed,
+                                       state["stage_time"])
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration comparing the relay and the deadband over a year
+    import time
+    from simulation import ThermalSimulation
+    hours = np.arange(24 * 365)
+    outdoor = (8 + 12 * np.sin(2 * np.pi * (hours / 24 - 110) / 365) +
+               5 * np.sin(2 * np.pi * hours / 24))
+    for name, policy in (("relay", None), ("deadband", DeadbandPolicy())):
+        start = time.perf_counter()
+        simulation = ThermalSimulation(outdoor, zones=100, setpoints=21.0,
+                                       policy=policy)
+        simulation.run()
+        cycles = simulation.heating_cycles + simulation.cooling_cycles
+        print(f"{name}: {time.perf_counter() - start:.2f} s, "
+              f"{simulation.events / (24 * 365):.1f} events per hour, "
+              f"{cycles.mean():.0f} cycles, heating "
+              f"{simulation.heating_energy.mean():.4g}, comfort "
+              f"{simulation.comfort_deviation.mean():.0f} degree-hours")
@@ -0,0 +1,446 @@
+"""***************************************************************************
+Title:          Weather
+File:           weather.py
+Release Notes:  N/A
+Author:         Nik Paulic
+Description:    Tools for the outdoor weather data: timestamp parsing, a
+                chunked streaming loader into a per-station weather store,
+                and a precomputed interpolation cache so the hourly data can
+                be sampled at any time (e.g. every minute) in vectorized form.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+
+
+"""*********************Global*********************************************"""
+# Timestamp format of the Government of Canada weather data, "2024-01-01 0:00"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+INTERPOLATION_METHODS = ("linear", "cubic")
+
+# Rows read per chunk by the streaming loader
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_STATION = "default"
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def parse_timestamps(timestamps, timestamp_format=TIMESTAMP_FORMAT):
+    """
+    Converts date time strings to epoch seconds.
+
+    timestamps: Date time strings as yyyy-mm-dd h:mm (list/array of strings)
+    timestamp_format: strptime format of the strings (string)
+    Returns: Seconds since 1970-01-01 (int64 array)
+    """
+    parsed = pd.to_datetime(pd.Series(timestamps, dtype="string"),
+                            format=timestamp_format)
+    return parsed.to_numpy(dtype="datetime64[s]").astype(np.int64)
+
+
+def to_epoch(date_input, time_input="0:00"):
+    """
+    Converts a single date and time to epoch seconds.
+
+    date_input: Date input as yyyy-mm-dd (string)
+    time_input: Time input h:mm or h:mm:ss (string)
+    """
+    time_parts = [int(part) for part in str(time_input).strip().split(":")]
+    time_parts += [0] * (3 - len(time_parts))
+    day = np.datetime64(date_input.strip(), "s").astype(np.int64)
+    return int(day + 3600 * time_parts[0] + 60 * time_parts[1] +
+               time_parts[2])
+
+
+def stream_weather_csv(file_path, store, station=DEFAULT_STATION,
+                       chunk_size=DEFAULT_CHUNK_SIZE, station_column=None,
+                       timestamp_format=TIMESTAMP_FORMAT,
+                       humidity_column=None):
+    """
+    Streams a weather CSV into the store in fixed-size chunks, so memory use
+    is bounded by the chunk size rather than the file size.
+
+    The first column holds the date time and the second the temperature,
+    matching Temperature_Humidity_Data.csv. The humidity is read from the
+    first other column whose name contains "hum" (e.g. "Humidity" or
+    "Rel Hum (%)"), and is missing if no column is named that way.
+
+    file_path: Path of the CSV file (string)
+    store: Destination of the readings (WeatherStore)
+    station: Station name for every row of the file (string)
+    chunk_size: Rows parsed per chunk (int)
+    station_column: Column holding the station name of each row, for files
+                    covering several stations (string)
+    timestamp_format: strptime format of the date time column (string)
+    humidity_column: Column holding the relative humidity, found by name
+                     if None (string)
+    Returns: The number of rows loaded (int)
+    """
+    columns = list(pd.read_csv(file_path, nrows=0).columns)
+    if len(columns) < 2:
+        raise ValueError("The weather file needs date time and temperature "
+                         "columns.")
+    time_column, temperature_column = columns[0], columns[1]
+    if humidity_column is None:
+        # Only a column named for the humidity, never any extra column
+        for column in columns[2:]:
+            if column != station_column and "hum" in column.lower():
+                humidity_column = column
+                break
+    elif humidity_column not in columns:
+        raise ValueError(f"The weather file has no column "
+                         f"'{humidity_column}'.")
+
+    # Explicit dtypes so pandas does not infer types chunk by chunk
+    dtypes = {time_column: "string", temperature_column: np.float64}
+    if humidity_column is not None:
+        dtypes[humidity_column] = np.float32
+    if station_column is not None:
+        dtypes[station_column] = "string"
+
+    rows = 0
+    for chunk in pd.read_csv(file_path, usecols=list(dtypes), dtype=dtypes,
+                             chunksize=chunk_size):
+        chunk = chunk.dropna(subset=[time_column])
+        epochs = parse_timestamps(chunk[time_column].to_numpy(),
+                                  timestamp_format)
+        temperatures = chunk[temperature_column].to_numpy(np.float64)
+        if humidity_column is not None:
+            humidities = chunk[humidity_column].to_numpy(np.float32,
+                                                         na_value=np.nan)
+        else:
+            humidities = np.full(len(chunk), np.nan, dtype=np.float32)
+
+        if station_column is None:
+            store.append(station, epochs, temperatures, humidities)
+        else:
+            names = chunk[station_column].to_numpy(dtype=object)
+            for name in pd.unique(names):
+                rows_of_station = names == name
+                store.append(str(name), epochs[rows_of_station],
+                             temperatures[rows_of_station],
+                             humidities[rows_of_station])
+        rows += len(chunk)
+    return rows
+
+
+def load_weather_stations(file_paths, store=None,
+                          chunk_size=DEFAULT_CHUNK_SIZE, max_workers=None):
+    """
+    Streams one CSV file per station in parallel threads. The pandas parser
+    releases the GIL while tokenizing, and every thread appends to its own
+    station series.
+
+    file_paths: Station name to CSV path (dictionary)
+    store: Destination of the readings, a new store if None (WeatherStore)
+    chunk_size: Rows parsed per chunk (int)
+    max_workers: Number of loader threads, one per station if None (int)
+    Returns: The store with every station loaded (WeatherStore)
+    """
+    store = WeatherStore() if store is None else store
+    max_workers = max_workers or max(1, len(file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {station: executor.submit(stream_weather_csv, file_path,
+                                            store, station, chunk_size)
+                   for station, file_path in file_paths.items()}
+        for station, future in futures.items():
+            rows = future.result()
+            print(f"Loaded {rows} rows for station {station}.")
+    return store
+
+
+def _monotone_slopes(x, y):
+    """
+    Fritsch-Carlson derivative estimates that keep the cubic monotone
+    between samples (no overshoot past the recorded temperatures).
+
+    x: Sample times (float array)
+    y: Sample values (float array)
+    """
+    h = np.diff(x)
+    delta = np.diff(y) / h
+    slopes = np.zeros_like(y)
+    if y.size == 2:
+        slopes[:] = delta[0]
+        return slopes
+
+    # Weighted harmonic mean at interior points, zero at local extrema
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    same_sign = delta[:-1] * delta[1:] > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        harmonic = (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:])
+    slopes[1:-1] = np.where(same_sign, harmonic, 0.0)
+
+    # One-sided three point estimates at the end points
+    slopes[0] = _end_slope(h[0], h[1], delta[0], delta[1])
+    slopes[-1] = _end_slope(h[-1], h[-2], delta[-1], delta[-2])
+    return slopes
+
+
+def _end_slope(h0, h1, delta0, delta1):
+    """
+    Shape preserving end point derivative for the monotone cubic.
+    """
+    slope = ((2 * h0 + h1) * delta0 - h0 * delta1) / (h0 + h1)
+    if np.sign(slope) != np.sign(delta0):
+        return 0.0
+    if np.sign(delta0) != np.sign(delta1) and abs(slope) > abs(3 * delta0):
+        return 3 * delta0
+    return slope
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class OutdoorInterpolator:
+    """
+    Precomputed linear and monotone cubic interpolants over the weather data.
+    """
+    def __init__(self, epochs, temperatures):
+        """
+        Precomputes the coefficients of every interval.
+
+        epochs: Sample times in epoch seconds, ascending (int array)
+        temperatures: Outdoor temperature of each sample (float array)
+        """
+        x = np.asarray(epochs, dtype=np.int64)
+        y = np.asarray(temperatures, dtype=np.float64)
+        if x.ndim != 1 or x.shape != y.shape or x.size < 2:
+            raise ValueError("At least two matching samples are required.")
+
+        # Drop missing readings rather than interpolating through NaN
+        valid = ~np.isnan(y)
+        x, y = x[valid], y[valid]
+        if x.size < 2 or np.any(np.diff(x) <= 0):
+            raise ValueError("The samples must be strictly ascending in time.")
+
+        self.epochs = x
+        self.temperatures = y
+        self.__start = int(x[0])
+        self.__end = int(x[-1])
+
+        # Uniform spacing allows the interval to be found with one division
+        steps = np.diff(x)
+        self.__step = int(steps[0]) if np.all(steps == steps[0]) else None
+
+        # Coefficients per interval in powers of (t - x_i)
+        h = steps.astype(np.float64)
+        delta = np.diff(y) / h
+        self.linear = np.stack([y[:-1], delta])
+
+        slopes = _monotone_slopes(x.astype(np.float64), y)
+        c2 = (3 * delta - 2 * slopes[:-1] - slopes[1:]) / h
+        c3 = (slopes[:-1] + slopes[1:] - 2 * delta) / h ** 2
+        self.cubic = np.stack([y[:-1], slopes[:-1], c2, c3])
+
+    @classmethod
+    def from_temperature_data(cls, temperature_data):
+        """
+        Builds the interpolator from the rows loaded by Model.
+
+        temperature_data: Rows of [date time, temperature, ...] (array)
+        """
+        epochs = parse_timestamps([row[0] for row in temperature_data])
+        temperatures = [row[1] for row in temperature_data]
+        return cls(epochs, temperatures)
+
+    def _locate(self, times):
+        """
+        Finds the interval of every requested time.
+
+        times: Requested times in epoch seconds (array)
+        Returns: Interval index and offset from its start in seconds (arrays)
+        """
+        times = np.clip(times, self.__start, self.__end)
+        if self.__step is not None:
+            index = (times - self.__start) // self.__step
+        else:
+            index = np.searchsorted(self.epochs, times, side="right") - 1
+        index = np.clip(index, 0, self.epochs.size - 2).astype(np.intp)
+        return index, (times - self.epochs[index]).astype(np.float64)
+
+    def evaluate(self, times, method="linear"):
+        """
+        Samples the outdoor temperature at arbitrary times. Times outside the
+        data hold the first or last reading.
+
+        times: Requested times in epoch seconds (int/array)
+        method: Either "linear" or "cubic" (string)
+        Returns: Outdoor temperatures (float/array)
+        """
+        if method not in INTERPOLATION_METHODS:
+            raise ValueError(f"The method should be one of "
+                             f"{', '.join(INTERPOLATION_METHODS)}.")
+        times = np.asarray(times, dtype=np.int64)
+        index, offset = self._locate(times)
+
+        # Horner's rule on the cached coefficients
+        coefficients = self.linear if method == "linear" else self.cubic
+        result = coefficients[-1][index]
+        for row in coefficients[-2::-1]:
+            result = result * offset + row[index]
+        return result if result.ndim else float(result)
+
+    def evaluate_range(self, start, stop, step=60, method="linear"):
+        """
+        Samples the outdoor temperature on a regular grid.
+
+        start: First time in epoch seconds (int)
+        stop: End time in epoch seconds, exclusive (int)
+        step: Grid spacing in seconds, one minute by default (int)
+        method: Either "linear" or "cubic" (string)
+        Returns: Grid times and outdoor temperatures (arrays)
+        """
+        times = np.arange(start, stop, step, dtype=np.int64)
+        return times, self.evaluate(times, method)
+
+    def at(self, date_input, time_input, method="linear"):
+        """
+        Samples the outdoor temperature at a date and time.
+
+        date_input: Date input as yyyy-mm-dd (string)
+        time_input: Time input h:mm or h:mm:ss (string)
+        method: Either "linear" or "cubic" (string)
+        """
+        return self.evaluate(to_epoch(date_input, time_input), method)
+
+
+'========================================='
+class StationSeries:
+    """
+    Growable columnar arrays of the readings of one weather station.
+    """
+    def __init__(self, capacity=1024):
+        """
+        Allocates the initial columns.
+
+        capacity: Number of readings allocated up front (int)
+        """
+        self.__size = 0
+        self.__epochs = np.empty(capacity, dtype=np.int64)
+        self.__temperatures = np.empty(capacity, dtype=np.float64)
+        self.__humidities = np.empty(capacity, dtype=np.float32)
+
+    def __len__(self):
+        """
+        Returns: The number of stored readings (int)
+        """
+        return self.__size
+
+    def append(self, epochs, temperatures, humidities):
+        """
+        Appends a block of readings, doubling the capacity when full so the
+        cost per reading stays constant.
+
+        epochs: Reading times in epoch seconds (int array)
+        temperatures: Outdoor temperatures (float array)
+        humidities: Relative humidities (float array)
+        """
+        count = len(epochs)
+        required = self.__size + count
+        if required > self.__epochs.size:
+            capacity = max(required, 2 * self.__epochs.size)
+            self.__epochs = np.resize(self.__epochs, capacity)
+            self.__temperatures = np.resize(self.__temperatures, capacity)
+            self.__humidities = np.resize(self.__humidities, capacity)
+
+        end = self.__size + count
+        self.__epochs[self.__size:end] = epochs
+        self.__temperatures[self.__size:end] = temperatures
+        self.__humidities[self.__size:end] = humidities
+        self.__size = end
+
+    @property
+    def epochs(self):
+        """
+        Returns: Reading times in epoch seconds (int64 array view)
+        """
+        return self.__epochs[:self.__size]
+
+    @property
+    def temperatures(self):
+        """
+        Returns: Outdoor temperatures (float64 array view)
+        """
+        return self.__temperatures[:self.__size]
+
+    @property
+    def humidities(self):
+        """
+        Returns: Relative humidities (float32 array view)
+        """
+        return self.__humidities[:self.__size]
+
+    def sort(self):
+        """
+        Orders the readings by time, for files loaded out of order.
+        """
+        order = np.argsort(self.epochs, kind="stable")
+        self.__epochs[:self.__size] = self.epochs[order]
+        self.__temperatures[:self.__size] = self.temperatures[order]
+        self.__humidities[:self.__size] = self.humidities[order]
+
+    def interpolator(self):
+        """
+        Returns: The interpolation cache over this station (OutdoorInterpolator)
+        """
+        return OutdoorInterpolator(self.epochs, self.temperatures)
+
+
+'========================================='
+class WeatherStore:
+    """
+    Holds the readings of every weather station, appended incrementally.
+    """
+    def __init__(self):
+        """
+        Initializes an empty store.
+        """
+        self.__stations = {}
+        self.__lock = threading.Lock()
+
+    def __contains__(self, station):
+        """
+        Returns: True if the station has been loaded (bool)
+        """
+        return station in self.__stations
+
+    def stations(self):
+        """
+        Returns: The loaded station names (list of strings)
+        """
+        return list(self.__stations)
+
+    def station(self, station=DEFAULT_STATION):
+        """
+        Returns: The readings of one station (StationSeries)
+        """
+        return self.__stations[station]
+
+    def append(self, station, epochs, temperatures, humidities):
+        """
+        Appends a block of readings to a station, creating it if needed.
+
+        station: Station name (string)
+        epochs: Reading times in epoch seconds (int array)
+        temperatures: Outdoor temperatures (float array)
+        humidities: Relative humidities (float array)
+        """
+        with self.__lock:
+            series = self.__stations.get(station)
+            if series is None:
+                series = self.__stations[station] = StationSeries()
+        series.append(epochs, temperatures, humidities)
+
+
+"""*********************Main Routine***************************************"""
+if __name__ == "__main__":
+    # Demonstration with a day of synthetic hourly weather
+    hours = [f"2024-01-01 {hour:d}:00" for hour in range(24)]
+    outdoor = 22 + 12 * np.sin(np.linspace(-np.pi, np.pi, 24))
+    interpolator = OutdoorInterpolator(parse_timestamps(hours), outdoor)
+    print(interpolator.at("2024-01-01", "6:30"))
+    print(interpolator.at("2024-01-01", "6:30", method="cubic"))
@@ -0,0 +1,146 @@
+"""***************************************************************************
+Title:          Cat Ensemble
+File:           CatEnsemble.py
+Release Notes:  In development
+
+Author:         Nik Paulic
+
+Purpose:        This app repeats the Schrodinger's cat experiment many times
+                to estimate how often the cat survives.
+Description:    Independent boxes are opened in chunks across a process pool,
+                every chunk with its own seed stream, and the results are
+                reduced to the alive/dead frequency with a confidence
+                interval and the distribution of hazard concentrations.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import os
+import math
+from multiprocessing import Pool
+from statistics import NormalDist
+import numpy as np
+import RadAtom
+from ComplexNumbers import RandomContext
+
+
+"""*********************Global*********************************************"""
+CHUNK_EXPERIMENTS = 100000  # Boxes opened together by a worker
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def wilson_interval(successes, trials, confidence = 0.95):
+    """
+    Returns the Wilson score interval of a binomial frequency
+
+    Arguments: The number of successes and trials (int)
+               The confidence level (float)
+    Returns: The lower and upper bound of the frequency (tuple of floats)
+    """
+    if trials == 0:
+        return (0.0, 1.0)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    frequency = successes / trials
+    denominator = 1 + z ** 2 / trials
+    centre = (frequency + z ** 2 / (2 * trials)) / denominator
+    margin = (z * math.sqrt(frequency * (1 - frequency) / trials +
+                            z ** 2 / (4 * trials ** 2)) / denominator)
+    return (max(centre - margin, 0.0), min(centre + margin, 1.0))
+
+
+def run_chunk(chunk):
+    """
+    Opens one chunk of boxes
+
+    Arguments: The number of boxes, atoms per bottle and the random stream
+               of the chunk (tuple)
+    Returns: The number of boxes with every count of radioactive atoms
+             (int64 ndarray of num_atoms + 1)
+    """
+    experiments, num_atoms, stream = chunk
+    with stream:
+        counts = RadAtom.radioactive_counts(experiments, num_atoms)
+    return np.bincount(counts, minlength = num_atoms + 1)
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class CatEnsemble():
+    """
+    Runs many independent Schrodinger's cat experiments in parallel
+    """
+    def __init__(self, num_atoms = 100,
+                 lethal_concentration = RadAtom.LETHAL_CONCENTRATION,
+                 processes = None, chunk_experiments = CHUNK_EXPERIMENTS):
+        """
+        Initializes the ensemble
+
+        Arguments: The number of atoms per bottle (int)
+                   The concentration of radioactive atoms that kills (float)
+                   The number of worker processes, one per core if None (int)
+                   The number of boxes per chunk (int)
+        """
+        self.num_atoms = num_atoms
+        self.lethal_concentration = lethal_concentration
+        self.processes = processes or os.cpu_count()
+        self.chunk_experiments = chunk_experiments
+
+
+    def run(self, experiments, seed = None, confidence = 0.95):
+        """
+        Opens the boxes and summarizes the outcomes. Every chunk draws from
+        its own stream spawned from the seed, so the result for a seed does
+        not depend on the number of processes.
+
+        Arguments: The number of experiments (int)
+                   The seed, fresh entropy if None (int)
+                   The confidence level of the interval (float)
+        Returns: The alive and dead counts, the alive frequency and its
+                 confidence interval, and the distribution of hazard
+                 concentrations (dictionary)
+        """
+        sizes = [min(self.chunk_experiments, experiments - start)
+                 for start in range(0, experiments, self.chunk_experiments)]
+        streams = RandomContext(seed).spawn(len(sizes))
+        chunks = [(size, self.num_atoms, stream)
+                  for size, stream in zip(sizes, streams)]
+
+        histogram = np.zeros(self.num_atoms + 1, dtype = np.int64)
+        if self.processes == 1:
+            for chunk in chunks:
+                histogram += run_chunk(chunk)
+        else:
+            with Pool(self.processes) as pool:
+                for counts in pool.imap_unordered(run_chunk, chunks):
+                    histogram += counts
+
+        # The cat dies from the lethal number of radioactive atoms on
+        concentrations = np.arange(self.num_atoms + 1) / self.num_atoms
+        lethal = concentrations >= self.lethal_concentration
+        dead = int(histogram[lethal].sum())
+        alive = experiments - dead
+        mean = float(histogram @ concentrations / max(experiments, 1))
+        variance = float(histogram @ (concentrations - mean) ** 2 /
+                         max(experiments, 1))
+        return {"experiments": experiments, "alive": alive, "dead": dead,
+                "alive_frequency": alive / max(experiments, 1),
+                "confidence_interval": wilson_interval(alive, experiments,
+                                                       confidence),
+                "hazard_concentrations": concentrations,
+                "hazard_distribution": histogram / max(experiments, 1),
+                "hazard_mean": mean, "hazard_std": math.sqrt(variance)}
+
+
+"""*********************Main Routine***************************************"""
+# Runs the main routine
+if __name__ == "__main__":
+    import time
+    start = time.perf_counter()
+    result = CatEnsemble().run(1000000, seed = 2024)
+    low, high = result["confidence_interval"]
+    print(f"{result['experiments']} boxes in "
+          f"{time.perf_counter() - start:.1f} s")
+    print(f"Alive {result['alive']}, dead {result['dead']}, alive frequency "
+          f"{result['alive_frequency']:.4f} (95% CI {low:.4f} to {high:.4f})")
+    print(f"Hazard concentration {result['hazard_mean']:.4f} +/- "
+          f"{result['hazard_std']:.4f}")
@@ -1,635 +1,1018 @@
-"""***************************************************************************
-Title:          Complex Numbers
-File:           ComplexNumbers.py
-Version:        3.1.0
-Release Notes:  Revised the absolute value of complex number to an overloaded
-                function instead of a property. Added additional feature to
-                take a complex number to an exponent, as well as to compare 
-                greater than or less than. Also added a random complex number
-                generator.
-
-Author:         Nik Paulic
-
-Purpose:        Generates complex numbers, creates matrices, and multiplies
-                matrices (in addition to complex number addition and 
-                multiplication).
-Description:    This file is used to support the user in complex number matrix
-                multiplication. It also has the capacity to convert a set of
-                values to a complex number, add/subract, and multiply them.
-***************************************************************************"""
-"""*********************Libraries******************************************"""
-import math
-import gc
-import random
-
-
-"""*********************Functions******************************************"""
-'========================================='
-def debugging_mode():
-    """
-    Runs debugging mode with a viewer for the garbage collection
-    
-    Note: Some assistance from chatGTP
-    """
-    print("Debug mode active")
-    complex_A = ComplexNumber(1, -3, debug=True)
-    complex_B = ComplexNumber(0, 4, debug=True)
-    print(complex_A)
-    print(complex_B)
-
-    # Performing some operations
-    complex_A.print_operation_results(complex_B, "+")
-    complex_B.print_operation_results(complex_A, "-")
-    complex_A.print_operation_results(complex_B, "*")
-    complex_A.print_polar_coordinates()
-
-    # Cleaning memory
-    print("Deleting objects")
-    del complex_A
-    del complex_B
-    
-    # Garbage collection
-    print("It's garbage collection time!")
-    gc.collect()
-    print("Garbage collection complete")
-
-
-def test_matrix_operations():
-    """
-    Runs several matrix operations to test file
-    """
-    matrix_A = ComplexMatrix([[ComplexNumber(1,1), ComplexNumber(2,0)], 
-                              [ComplexNumber(0,0), ComplexNumber(2,5)]])
-    matrix_B = ComplexMatrix([[ComplexNumber(5,-5), ComplexNumber(0,-2)], 
-                              [ComplexNumber(0,4.2), ComplexNumber(-11.1,0)]])
-    matrix_A.print_matrix_multiplication(matrix_B, 'v')
-    matrix_A.print_matrix_multiplication(matrix_B, 'm')
-
-
-"""*********************Classes********************************************"""
-'========================================='
-class ComplexNumber:
-    """
-    Creates a complex number and manipulates it with operators
-    """
-    def __init__(self, real_number, imaginary_number, debug = False):
-        """
-        Creates the real and imaginary parts of the class
-        
-        Arguments: Number input to represent the real component (float)
-                   Number input for the imaginary component (float)
-        """
-        self.__debug = debug
-        try:
-            if (isinstance(real_number, (int, float)) and 
-                isinstance(imaginary_number, (int, float))):
-                self.__real_number = round(real_number, 2)
-                self.__imaginary_number = round(imaginary_number, 2)
-            else:
-                raise TypeError
-        except:
-            print(real_number, " ", imaginary_number)
-            print("E01: The inputs must be a ComplexNumber as [a, b].\n")
-            return None  
-        
-        
-    def __del__(self):
-        """ 
-        Destructor that prints a debug message when instance is destroyed
-        
-        Note: Some support with chatGTP
-        """
-        if hasattr(self, '__debug') and self.__debug == True:
-            print(self.complex_str, " is being destroyed.")
-            
-            
-    def __str__(self):
-        """
-        Returns: The complex number (string)
-        Note: The function is made with chatGTP
-        """
-        complex_number = self.complex_str
-        return complex_number
-    
-    
-    def __add__(self, number):
-        """
-        Adds two complex numbers together
-        
-        Arguments: Two complex numbers (ComplexNumber)
-        Returns: An added complex number (ComplexNumber)
-        """
-        if ComplexNumber._complex_checker(number):
-            realPart = (self.real + number.real)
-            imaginaryPart = (self.imaginary + number.imaginary)
-            return ComplexNumber(realPart, imaginaryPart)
-        else:
-            # Returns for failure to comply with __complex_checker
-            return None
-    
-
-    def __sub__(self, number):
-        """
-        Subtracts two complex numbers together
-        
-        Arguments: Two complex numbers (ComplexNumber)
-        Returns: A subtracted complex number (ComplexNumber)
-        """
-        if ComplexNumber._complex_checker(number):
-            realPart = (self.real - number.real)
-            imaginaryPart = (self.imaginary - number.imaginary)
-            return ComplexNumber(realPart, imaginaryPart)
-        else:
-            # Returns for failure to comply with __complex_checker
-            return None
-    
-
-    def __mul__(self, number):
-        """
-        Multiplies two complex numbers together
-        
-        Arguments: Two complex numbers (ComplexNumber)     
-        Returns: A multiplied complex number (ComplexNumber)
-        """
-        if ComplexNumber._complex_checker(number):
-            realPart = (self.real * number.real - 
-                        self.imaginary * number.imaginary)
-            imaginaryPart = (self.real * number.imaginary + 
-                             self.imaginary * number.real)
-            return ComplexNumber(realPart, imaginaryPart)
-        else:
-            # Returns for failure to comply with __complex_checker
-            return None
-        
-        
-    def __abs__(self):
-        """
-        Creates the absolute value of a complex number.
-        """
-        absolute_val = math.sqrt((self.real)**2 + (self.imaginary)**2)
-        return absolute_val
-        
-    
-    def __pow__(self, exponent):
-        """
-        Runs the exponent/power operation on a number, exponent must be an int
-        """
-        try:
-            if isinstance(exponent, int) and exponent >= 0:
-                power = self
-                exponent -= 1
-                while exponent != 0:
-                    power = power * self
-                    exponent -= 1
-                return power
-            else:
-                raise TypeError
-        except:
-            print(exponent)
-            print("E15: The input must be an integer > 0, ex. 3\n")
-            return False 
-        
-    
-    def __gt__(self, number):
-        """
-        Performs a greater than operation for a complex number.
-        """
-        if ComplexNumber._complex_checker(number):
-            value_1 = abs(self)
-            value_2 = abs(number)
-            if value_1.real > value_2.real:
-                return True
-            else:
-                return False
-        else:
-            # Returns for failure to comply with __complex_checker
-            return None
-        
-    
-    def __lt__(self, number):
-        """
-        Performs a greaterthan operation for a complex number.
-        """
-        if ComplexNumber._complex_checker(number):
-            value_1 = abs(self)
-            value_2 = abs(number)
-            if value_1.real < value_2.real:
-                return True
-            else:
-                return False
-        else:
-            # Returns for failure to comply with __complex_checker
-            return None
-        
-        
-    @property
-    def real(self):
-        """
-        Returns: The real number (float)
-        """
-        return self.__real_number 
-    
-    
-    @property
-    def imaginary(self): 
-        """
-        Returns: The imaginary number (float)
-        """
-        return self.__imaginary_number 
-    
-    
-    @property
-    def complex_num(self):
-        """
-        Returns: The complex number (list of floats)
-        """
-        return [self.__real_number, self.__imaginary_number]
-    
-    
-    @property
-    def complex_str(self):
-        """
-        Returns: The complex number (string)
-        Note: The function is made partially with chatGTP
-        """
-        # real > or < 0, imaginary > 0
-        if ((self.__real_number > 0 or self.__real_number < 0) 
-            and self.__imaginary_number > 0): 
-            complex_number = (str(self.__real_number) + "+" + 
-                              str(self.__imaginary_number) + "i")
-        
-        # real > or < 0, imaginary < 0
-        elif ((self.__real_number > 0 or self.__real_number < 0) 
-            and self.__imaginary_number < 0): 
-            complex_number = (str(self.__real_number) +  
-                              str(self.__imaginary_number) + "i")
-        
-        # real > or < 0, imaginary = 0
-        elif ((self.__real_number > 0 or self.__real_number < 0) 
-              and self.__imaginary_number == 0):
-            complex_number = str(self.__real_number)
-            
-        # real = 0, imaginary > or < 0
-        elif self.__real_number == 0 and (self.__imaginary_number > 0 
-                                          or self.__imaginary_number < 0):
-            complex_number = str(self.__imaginary_number) + "i"
-        
-        # real and imaginary = 0
-        else:
-            complex_number = str(self.__real_number)
-            
-        return complex_number 
-    
-    
-    @property
-    def phase(self):
-        """
-        Returns: The phase of the complex number (float)
-        """
-        return round(math.atan2(self.__imaginary_number, 
-                                self.__real_number), 2)
-    
-    
-    @property
-    def polar_num(self):
-        """
-        Returns: The phase of the complex number (list of floats)
-        """
-        return [self.absolute_value, self.phase]
-    
-    
-    @property
-    def polar_str(self):
-        """
-        Returns: The phase of the complex number (string)
-        """
-        polar = (str(self.absolute_value) + "cis(" + 
-                 str(self.phase) + ")")
-        return polar
-    
-    
-    @staticmethod
-    def _complex_checker(number):
-        """
-        Checks whether or not the input is a ComplexNumber object
-        
-        Argument: A complex number (ComplexNumber)
-        Returns: True if a ComplexNumber object or returns to user to retry
-        """
-        try:
-            if isinstance(number, ComplexNumber):
-                return True
-            else:
-                raise TypeError
-        except:
-            print(number)
-            print("E02: The input is not a ComplexNumber\n")
-            return False 
-        
-        
-    @staticmethod
-    def generator(lower_real, upper_real, lower_imaginary, upper_imaginary):
-        """
-        Returns a random complex number
-        
-        Argument: the lower/upper bounds of a real/imaginary numbers
-        Returns: A complex number
-        """
-        try:
-            real = random.uniform(lower_real, upper_real)
-            imaginary = random.uniform(lower_imaginary, upper_imaginary)
-            return ComplexNumber(real, imaginary)
-        except:
-            print("E16: The inputs must be in order of 1) lower bound of ",
-                  "real num, 2) upper bound of real num, 3) lower bound of ",
-                  "imaginary num, and 4) upper bound of imaginary num. ",
-                  "For example, generator(2,5,3,7)")
-            return None
-        
-    
-    @staticmethod
-    def probability():
-        """
-        Returns a random complex number whose square of absolute val is <= 1
-        """
-        real = random.random()
-        imaginary = random.random()
-        while (real ** 2 + imaginary ** 2) > 1:
-            real = random.random()
-            imaginary = random.random()
-        return ComplexNumber(real, imaginary)
-        
-        
-    def print_operation_results(self, number, operation):
-        """
-        Prints & returns the complex addition, subtraction, or multiplication
-        
-        Arguments: Two complex numbers (ComplexNumber)
-                   An input of the operation "+", "-", or "*" (string)
-        Returns: An operated new complex number (ComplexNumber)
-        Note: Idea for enumerator heavily supported by chatGTP
-        """
-        operation = operation.lower()
-        operations = {
-            "+": self + number,
-            "-": self - number,
-            "*": self * number
-            }
-        
-        try:
-            if operation in operations:
-                print("The result of ", self, operation, number, " yields ",
-                      operations[operation], "\n")
-                return operations[operation]
-            else:
-                raise TypeError 
-        except:
-            print(operation)
-            print("E03: The operator needs to be one of: \n",
-                  "+, -, or * (in parenthesis).\n")
-            return None
-    
-    
-    def print_polar_coordinates(self):
-        """
-        Prints and returns the polar coordinates
-        
-        Arguments: A complex number (ComplexNumber)
-        Returns: The resulting polar coordinates from complex_str (string)
-        """
-        polar = self.polar_str
-        print("The polar coordinates of ", self.complex_str, " is ",
-              polar, "\n")
-        return polar
-
- 
-'========================================='
-class ComplexMatrix(ComplexNumber):
-    """
-    Creates a class for complex number matrices with matrix multiplication
-    and element-wise products (vectors).
-    """
-    def __init__(self, matrix):
-        """
-        Initializes the 2x2 matrix with complex number elements.
-        
-        Arguments: A matrix in the format of list of lists
-        """
-        try:
-            if isinstance(matrix, list):
-                row_length = len(matrix[0])
-                for row in matrix:
-                    if not(isinstance(row, list)):
-                        raise ValueError
-                    if len(row) != row_length:
-                        raise ValueError
-                    for element in row:
-                        if not(element, ComplexNumber):
-                            raise TypeError
-                self.__matrix = matrix
-            else:
-                raise ValueError
-        except ValueError:
-            print("E05: The input must be a vector or matrix in a list of ",
-                  "list format, ie. [[1, 2, 3]] or [[1],[2],[3]]. Rows must",
-                  " be of equal length if multiple rows input.")
-            return None
-        except TypeError:
-            print("E04: All elements must be instances of ComplexNumber")
-            return None
-        except:
-            print("E07: Error with initialization")
-            return None
-    
-    
-    def __str__(self):
-        """
-        Returns: The complex matrix (string)
-        """
-        return str(self.matrix_num)
-    
-    
-    def __mul__(self, matrix):
-        """
-        Multiplies matrices or vectors and returns the products.
-        
-        Arguments: Two compatable matrices or vectors (ComplexMatrix)
-        Returns: The product matrix or vector (ComplexMatrix).
-        Notes: The matrix multiplication simplified with ChatGTP
-        """
-        try:
-            # Check for class type
-            if not(self.__complex_matrix_checker(matrix)):
-                raise TypeError
-                
-            # Check for multiplication size compatability
-            matrix_1_size = self.matrix_size
-            matrix_2_size = matrix.matrix_size
-            # Matrix Multiplication
-            if (matrix_1_size[1] == matrix_2_size[0]):
-                # Initialize the result matrix with zeros 
-                result = ([[ComplexNumber(0, 0) for _ in 
-                            range(matrix_2_size[1])] for _ in 
-                           range(matrix_1_size[0])])
-                # Perform matrix multiplication 
-                matrix1 = self.matrix
-                matrix2 = matrix.matrix
-                for i in range(matrix_1_size[0]): 
-                    for j in range(matrix_2_size[1]): 
-                        for k in range(matrix_2_size[0]): 
-                            result[i][j] += matrix1[i][k] * matrix2[k][j]
-                return ComplexMatrix(result)
-            
-            else:
-                raise ValueError
-        except TypeError: 
-            print("E08: Both entries must be ComplexMatrix values") 
-            return None 
-        except ValueError: 
-            print("E10: These matrices are not compatible to multiply.") 
-            return None 
-        except Exception as e: 
-            print(f"Unexpected error: {e}") 
-            return None
-        
-        
-    @property
-    def matrix(self):
-        """
-        Returns: The complex matrix to prevent name mangling (ComplexMatrix)
-        """
-        return self.__matrix
-    
-    
-    @property
-    def matrix_num(self):
-        """
-        Returns: The complex matrix (Matrix of ComplexNumbers)
-        """
-        matrix_num = []
-        for row in self.__matrix: 
-            row_content = []
-            for element in row:
-                row_content.append(element.complex_str)
-            matrix_num.append(row_content)
-        return matrix_num
-    
-    @property
-    def matrix_size(self):
-        """
-        Returns: A list of the matrix size as rows and columns
-        """
-        columns = 0
-        rows = 0
-        for row in self.__matrix:
-            if rows == 0:
-                for element in row:
-                    columns += 1
-            rows += 1
-        return [rows, columns]
-    
-    
-    @staticmethod
-    def __complex_matrix_checker(matrix):
-        """
-        Checks for whether or not the matrix is 2x2 and uses ComplexNumber
-        
-        Arguments: A matrix (ComplexMatrix)
-        Returns: True or returns to user to try again (Bool)
-        Note: The function is heavily supported with chatGTP
-        """ 
-        try:
-            if isinstance(matrix, ComplexMatrix):
-                return True
-            else:
-                raise TypeError
-        except:
-            print(matrix)
-            print("E09: The input is not a ComplexMatrix.")
-            return False
-    
-    
-    @staticmethod
-    def operation_menu():
-        """
-        Runs a menu for the user to perform either a matrix or vector product
-        
-        Arguments: The operation for the menu be cast by the user between 'm' 
-                   for matrix multiplication, 'v' for vector multiplication, 
-                   and 'e' to exit. Once these are cast, the inputs will 
-                   request elements for 2 ComplexMatrix objects.
-        Note: Some support with chatGTP
-        """        
-        # Matrix Building
-        while True:
-            if not ComplexMatrix.__run_class():
-                break
-            try:
-                print("Enter the dimensions of matrix/vector 1: ")
-                mat_1_size = []
-                mat_1_size.append(int(input("No. rows: ")))
-                mat_1_size.append(int(input("No. columns: ")))
-                print("Enter the dimensions of matrix/vector 2: ")
-                mat_2_size = []
-                mat_2_size.append(int(input("No. rows: ")))
-                mat_2_size.append(int(input("No. columns: ")))
-                if (mat_1_size[0] <= 0 or mat_1_size[0] <= 0 or 
-                    mat_2_size[1] <= 0 or mat_2_size[1] <= 0): 
-                    raise ValueError
-                print("\nBuilding matrix 1")
-                matrix_1 = ComplexMatrix.__matrix_builder(mat_1_size)
-                print("\nBuilding matrix 2")
-                matrix_2 = ComplexMatrix.__matrix_builder(mat_2_size)
-                result = matrix_1 * matrix_2
-                print(matrix_1, " multiplied by ", matrix_2, " yields \n",
-                      result, "\n")
-            except UnboundLocalError:
-                print("E14: Unexpected error")
-            except:
-                print("E12: Please enter an int > 0 for the entry") 
-            
-    
-    @staticmethod
-    def __matrix_builder(matrix_size):
-        """
-        Builds a matrix for the user
-        
-        Arguments: The size of matrix in form [rows, columns]
-        """
-        while True:
-            try:
-                matrix = []
-                for row in range(matrix_size[0]):
-                    columns = []
-                    print("\nrow ", row + 1)
-                    for element in range(matrix_size[1]):
-                        real = float(input("real part: "))
-                        imaginary = float(input("imaginary part: "))
-                        columns.append(ComplexNumber(real, imaginary))
-                    matrix.append(columns)     
-                return ComplexMatrix(matrix)
-            except:
-                print("E13: please input a number")
-    
-    
-    @staticmethod
-    def __run_class():
-        while True:
-            try:
-                print("Welcome to ComplexNumbers")
-                operation_type = input("What operation do you need?\n"
-                                       "'m' for matrix multiplication\n"
-                                       "'e' to exit the program:\n")
-                if operation_type == 'm' or operation_type == 'e': break
-                else: raise ValueError("Invalid operation type.")
-            except:
-                print("E11: Please write either 'm' or 'e'\n")
-        if operation_type == 'e': return False
-        elif operation_type == 'm': return True
-        
-     
-"""*********************Main Routine***************************************"""
-# Runs the main routine
-if __name__ == "__main__":
-
-    ComplexMatrix.operation_menu()
+"""***************************************************************************
+Title:          Complex Numbers
+File:           ComplexNumbers.py
+Version:        3.6.6
+Release Notes:  Reading ComplexMatrix.matrix keeps the array form, only an
+                edit of the elements rebuilds it.
+
+Author:         Nik Paulic
+
+Purpose:        Generates complex numbers, creates matrices, and multiplies
+                matrices (in addition to complex number addition and 
+                multiplication).
+Description:    This file is used to support the user in complex number matrix
+                multiplication. It also has the capacity to convert a set of
+                values to a complex number, add/subract, and multiply them.
+***************************************************************************"""
+"""*********************Libraries******************************************"""
+import math
+import gc
+import numpy as np
+
+
+"""*********************Global*********************************************"""
+# Active random contexts, the first is the default and the last is used
+_contexts = []
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def current_context():
+    """
+    Returns: The random context the samplers draw from (RandomContext)
+    """
+    if not _contexts:
+        _contexts.append(RandomContext())
+    return _contexts[-1]
+    
+    
+def set_seed(seed = None):
+    """
+    Replaces the default random context for reproducible samples, contexts
+    entered with a with block keep precedence
+    
+    Arguments: The seed, fresh entropy if None (int)
+    """
+    current_context()
+    _contexts[0] = RandomContext(seed)
+    
+    
+def batch_generator():
+    """
+    Returns: The generator of the current random context (numpy Generator)
+    """
+    return current_context().generator
+    
+    
+def debugging_mode():
+    """
+    Runs debugging mode with a viewer for the garbage collection
+    
+    Note: Some assistance from chatGTP
+    """
+    print("Debug mode active")
+    complex_A = ComplexNumber(1, -3)
+    complex_B = ComplexNumber(0, 4)
+    print(complex_A)
+    print(complex_B)
+
+    # Performing some operations
+    complex_A.print_operation_results(complex_B, "+")
+    complex_B.print_operation_results(complex_A, "-")
+    complex_A.print_operation_results(complex_B, "*")
+    complex_A.print_polar_coordinates()
+
+    # Cleaning memory, numbers hold no references and are freed on delete
+    print("Deleting objects")
+    del complex_A
+    del complex_B
+    
+    # Garbage collection
+    print("It's garbage collection time!")
+    print(gc.collect(), "unreachable objects collected")
+    print("Garbage collection complete")
+
+
+def test_matrix_operations():
+    """
+    Runs several matrix operations to test file
+    """
+    matrix_A = ComplexMatrix([[ComplexNumber(1,1), ComplexNumber(2,0)], 
+                              [ComplexNumber(0,0), ComplexNumber(2,5)]])
+    matrix_B = ComplexMatrix([[ComplexNumber(5,-5), ComplexNumber(0,-2)], 
+                              [ComplexNumber(0,4.2), ComplexNumber(-11.1,0)]])
+    matrix_A.print_matrix_multiplication(matrix_B, 'v')
+    matrix_A.print_matrix_multiplication(matrix_B, 'm')
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class ComplexNumber:
+    """
+    Creates a complex number and manipulates it with operators. The parts
+    are kept at full precision in slots, without a per-instance dictionary,
+    and are rounded to 2 decimals only when printed.
+    """
+    __slots__ = ("__real_number", "__imaginary_number")
+    
+    def __init__(self, real_number, imaginary_number):
+        """
+        Creates the real and imaginary parts of the class
+        
+        Arguments: Number input to represent the real component (float)
+                   Number input for the imaginary component (float)
+        """
+        try:
+            if (isinstance(real_number, (int, float)) and 
+                isinstance(imaginary_number, (int, float))):
+                self.__real_number = real_number
+                self.__imaginary_number = imaginary_number
+            else:
+                raise TypeError
+        except:
+            print(real_number, " ", imaginary_number)
+            print("E01: The inputs must be a ComplexNumber as [a, b].\n")
+            return None  
+        
+    
+    @classmethod
+    def _from_parts(cls, real_number, imaginary_number):
+        """
+        Creates a complex number from parts known to be numbers, skipping
+        the checks of __init__ for the results of arithmetic
+        
+        Arguments: The real and imaginary components (float)
+        Returns: The complex number (ComplexNumber)
+        """
+        number = object.__new__(cls)
+        number.__real_number = real_number
+        number.__imaginary_number = imaginary_number
+        return number
+            
+            
+    def __str__(self):
+        """
+        Returns: The complex number (string)
+        Note: The function is made with chatGTP
+        """
+        complex_number = self.complex_str
+        return complex_number
+    
+    
+    def __add__(self, number):
+        """
+        Adds two complex numbers together
+        
+        Arguments: Two complex numbers (ComplexNumber)
+        Returns: An added complex number (ComplexNumber)
+        """
+        if ComplexNumber._complex_checker(number):
+            realPart = (self.real + number.real)
+            imaginaryPart = (self.imaginary + number.imaginary)
+            return ComplexNumber._from_parts(realPart, imaginaryPart)
+        else:
+            # Returns for failure to comply with __complex_checker
+            return None
+    
+
+    def __sub__(self, number):
+        """
+        Subtracts two complex numbers together
+        
+        Arguments: Two complex numbers (ComplexNumber)
+        Returns: A subtracted complex number (ComplexNumber)
+        """
+        if ComplexNumber._complex_checker(number):
+            realPart = (self.real - number.real)
+            imaginaryPart = (self.imaginary - number.imaginary)
+            return ComplexNumber._from_parts(realPart, imaginaryPart)
+        else:
+            # Returns for failure to comply with __complex_checker
+            return None
+    
+
+    def __mul__(self, number):
+        """
+        Multiplies two complex numbers together
+        
+        Arguments: Two complex numbers (ComplexNumber)     
+        Returns: A multiplied complex number (ComplexNumber)
+        Notes: A sparse matrix or a lazy expression scales itself by the
+               number (SparseMatrix or Expression)
+        """
+        if (getattr(number, "computes_products", False) and 
+                not isinstance(number, ComplexNumber)):
+            return NotImplemented
+        if ComplexNumber._complex_checker(number):
+            realPart = (self.real * number.real - 
+                        self.imaginary * number.imaginary)
+            imaginaryPart = (self.real * number.imaginary + 
+                             self.imaginary * number.real)
+            return ComplexNumber._from_parts(realPart, imaginaryPart)
+        else:
+            # Returns for failure to comply with __complex_checker
+            return None
+        
+        
+    def __complex__(self):
+        """
+        Returns: The complex number as a Python complex (complex)
+        """
+        return complex(self.real, self.imaginary)
+    
+    
+    def __abs__(self):
+        """
+        Creates the absolute value of a complex number.
+        """
+        absolute_val = math.sqrt((self.real)**2 + (self.imaginary)**2)
+        return absolute_val
+        
+    
+    def __pow__(self, exponent):
+        """
+        Runs the exponent/power operation on a number. Integer powers >= 0
+        are computed by repeated squaring, other real exponents in polar 
+        form as r^n cis(n * phase).
+        
+        Arguments: The exponent (int or float)
+        Returns: The power (ComplexNumber)
+        """
+        try:
+            if isinstance(exponent, int) and exponent >= 0:
+                # Square the base for every bit of the exponent
+                power = ComplexNumber._from_parts(1, 0)
+                base = self
+                while exponent:
+                    if exponent & 1:
+                        power = power * base
+                    exponent >>= 1
+                    if exponent:
+                        base = base * base
+                return power
+            elif (isinstance(exponent, (int, float)) and 
+                  (abs(self) > 0 or exponent > 0)):
+                modulus = abs(self) ** exponent
+                angle = self.phase * exponent
+                return ComplexNumber._from_parts(modulus * math.cos(angle), 
+                                                 modulus * math.sin(angle))
+            else:
+                raise TypeError
+        except:
+            print(exponent)
+            print("E15: The input must be a real number, ex. 3 or -0.5, ",
+                  "and 0 may not be raised to a negative power\n")
+            return False 
+        
+    
+    def __gt__(self, number):
+        """
+        Performs a greater than operation for a complex number.
+        """
+        if ComplexNumber._complex_checker(number):
+            value_1 = abs(self)
+            value_2 = abs(number)
+            if value_1.real > value_2.real:
+                return True
+            else:
+                return False
+        else:
+            # Returns for failure to comply with __complex_checker
+            return None
+        
+    
+    def __lt__(self, number):
+        """
+        Performs a greaterthan operation for a complex number.
+        """
+        if ComplexNumber._complex_checker(number):
+            value_1 = abs(self)
+            value_2 = abs(number)
+            if value_1.real < value_2.real:
+                return True
+            else:
+                return False
+        else:
+            # Returns for failure to comply with __complex_checker
+            return None
+        
+        
+    @property
+    def real(self):
+        """
+        Returns: The real number (float)
+        """
+        return self.__real_number 
+    
+    
+    @property
+    def imaginary(self): 
+        """
+        Returns: The imaginary number (float)
+        """
+        return self.__imaginary_number 
+    
+    
+    @property
+    def complex_num(self):
+        """
+        Returns: The complex number (list of floats)
+        """
+        return [self.__real_number, self.__imaginary_number]
+    
+    
+    @property
+    def complex_str(self):
+        """
+        Returns: The complex number, rounded to 2 decimals (string)
+        Note: The function is made partially with chatGTP
+        """
+        # Rounded parts, a part rounded to -0.0 is shown as 0.0
+        real_number = round(self.__real_number, 2)
+        imaginary_number = round(self.__imaginary_number, 2)
+        if real_number == 0: real_number = abs(real_number)
+        if imaginary_number == 0: imaginary_number = abs(imaginary_number)
+        
+        # real > or < 0, imaginary > 0
+        if ((real_number > 0 or real_number < 0) 
+            and imaginary_number > 0): 
+            complex_number = (str(real_number) + "+" + 
+                              str(imaginary_number) + "i")
+        
+        # real > or < 0, imaginary < 0
+        elif ((real_number > 0 or real_number < 0) 
+            and imaginary_number < 0): 
+            complex_number = (str(real_number) +  
+                              str(imaginary_number) + "i")
+        
+        # real > or < 0, imaginary = 0
+        elif ((real_number > 0 or real_number < 0) 
+              and imaginary_number == 0):
+            complex_number = str(real_number)
+            
+        # real = 0, imaginary > or < 0
+        elif real_number == 0 and (imaginary_number > 0 
+                                          or imaginary_number < 0):
+            complex_number = str(imaginary_number) + "i"
+        
+        # real and imaginary = 0
+        else:
+            complex_number = str(real_number)
+            
+        return complex_number 
+    
+    
+    @property
+    def phase(self):
+        """
+        Returns: The phase of the complex number (float)
+        """
+        return math.atan2(self.__imaginary_number, self.__real_number)
+    
+    
+    @property
+    def polar_num(self):
+        """
+        Returns: The phase of the complex number (list of floats)
+        """
+        return [abs(self), self.phase]
+    
+    
+    @property
+    def polar_str(self):
+        """
+        Returns: The phase of the complex number, rounded to 2 decimals 
+                 (string)
+        """
+        polar = (str(round(abs(self), 2)) + "cis(" + 
+                 str(round(self.phase, 2)) + ")")
+        return polar
+    
+    
+    @staticmethod
+    def _complex_checker(number):
+        """
+        Checks whether or not the input is a ComplexNumber object
+        
+        Argument: A complex number (ComplexNumber)
+        Returns: True if a ComplexNumber object or returns to user to retry
+        """
+        try:
+            if isinstance(number, ComplexNumber):
+                return True
+            else:
+                raise TypeError
+        except:
+            print(number)
+            print("E02: The input is not a ComplexNumber\n")
+            return False 
+        
+        
+    @staticmethod
+    def generator(lower_real, upper_real, lower_imaginary, upper_imaginary):
+        """
+        Returns a random complex number
+        
+        Argument: the lower/upper bounds of a real/imaginary numbers
+        Returns: A complex number
+        """
+        try:
+            rng = batch_generator()
+            real = float(rng.uniform(lower_real, upper_real))
+            imaginary = float(rng.uniform(lower_imaginary, upper_imaginary))
+            return ComplexNumber(real, imaginary)
+        except:
+            print("E16: The inputs must be in order of 1) lower bound of ",
+                  "real num, 2) upper bound of real num, 3) lower bound of ",
+                  "imaginary num, and 4) upper bound of imaginary num. ",
+                  "For example, generator(2,5,3,7)")
+            return None
+        
+    
+    @staticmethod
+    def probability():
+        """
+        Returns a random complex number whose square of absolute val is <= 1,
+        uniform over the unit quarter disk (see probability_batch)
+        """
+        rng = batch_generator()
+        radius = math.sqrt(rng.random())
+        angle = rng.random() * (math.pi / 2)
+        return ComplexNumber(radius * math.cos(angle), 
+                             radius * math.sin(angle))
+    
+    
+    @staticmethod
+    def generator_batch(lower_real, upper_real, lower_imaginary, 
+                        upper_imaginary, count, rng = None):
+        """
+        Returns many random complex numbers at once, see generator
+        
+        Argument: the lower/upper bounds of a real/imaginary numbers
+                  The number of samples (int)
+                  The generator to draw from, the current random 
+                  context's if None (numpy Generator)
+        Returns: The samples (complex128 ndarray)
+        """
+        try:
+            rng = batch_generator() if rng is None else rng
+            samples = np.empty(count, dtype=np.complex128)
+            samples.real = rng.uniform(lower_real, upper_real, count)
+            samples.imag = rng.uniform(lower_imaginary, upper_imaginary, 
+                                       count)
+            return samples
+        except:
+            print("E16: The inputs must be in order of 1) lower bound of ",
+                  "real num, 2) upper bound of real num, 3) lower bound of ",
+                  "imaginary num, 4) upper bound of imaginary num, and 5) ",
+                  "the count. For example, generator_batch(2,5,3,7,100)")
+            return None
+    
+    
+    @staticmethod
+    def probability_batch(count, rng = None):
+        """
+        Returns many random complex numbers whose square of absolute val is
+        <= 1, uniform over the unit quarter disk like probability. They are
+        drawn in polar form, the radius as the root of a uniform sample so
+        the area is covered evenly, without rejecting any samples.
+        
+        Argument: The number of samples (int)
+                  The generator to draw from, the current random 
+                  context's if None (numpy Generator)
+        Returns: The samples (complex128 ndarray)
+        """
+        rng = batch_generator() if rng is None else rng
+        radius = np.sqrt(rng.random(count))
+        angle = rng.random(count) * (math.pi / 2)
+        samples = np.empty(count, dtype=np.complex128)
+        np.multiply(radius, np.cos(angle), out=samples.real)
+        np.multiply(radius, np.sin(angle), out=samples.imag)
+        return samples
+        
+        
+    def print_operation_results(self, number, operation):
+        """
+        Prints & returns the complex addition, subtraction, or multiplication
+        
+        Arguments: Two complex numbers (ComplexNumber)
+                   An input of the operation "+", "-", or "*" (string)
+        Returns: An operated new complex number (ComplexNumber)
+        Note: Idea for enumerator heavily supported by chatGTP
+        """
+        operation = operation.lower()
+        operations = {
+            "+": self + number,
+            "-": self - number,
+            "*": self * number
+            }
+        
+        try:
+            if operation in operations:
+                print("The result of ", self, operation, number, " yields ",
+                      operations[operation], "\n")
+                return operations[operation]
+            else:
+                raise TypeError 
+        except:
+            print(operation)
+            print("E03: The operator needs to be one of: \n",
+                  "+, -, or * (in parenthesis).\n")
+            return None
+    
+    
+    def print_polar_coordinates(self):
+        """
+        Prints and returns the polar coordinates
+        
+        Arguments: A complex number (ComplexNumber)
+        Returns: The resulting polar coordinates from complex_str (string)
+        """
+        polar = self.polar_str
+        print("The polar coordinates of ", self.complex_str, " is ",
+              polar, "\n")
+        return polar
+
+ 
+'========================================='
+class RandomContext():
+    """
+    A seeded stream of random numbers for the samplers of ComplexNumber,
+    SketchyAtom and Bottle. A context spawns any number of independent
+    child streams, one per worker or chunk of a parallel simulation, and
+    in a with block it becomes the stream every sampler draws from.
+    """
+    def __init__(self, seed = None):
+        """
+        Initializes the stream
+        
+        Arguments: The seed, fresh entropy if None (int or SeedSequence)
+        """
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.__generator = None
+        
+        
+    def __enter__(self):
+        """
+        Makes the context the one the samplers draw from
+        """
+        current_context()
+        _contexts.append(self)
+        return self
+    
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Restores the context that was used before the with block
+        """
+        _contexts.remove(self)
+        return False
+        
+        
+    @property
+    def generator(self):
+        """
+        Returns: The generator of the stream (numpy Generator)
+        """
+        if self.__generator is None:
+            self.__generator = np.random.default_rng(self.seed_sequence)
+        return self.__generator
+    
+    
+    def spawn(self, count):
+        """
+        Creates independent child streams, later calls give new children
+        
+        Arguments: The number of streams (int)
+        Returns: The child streams (list of RandomContext)
+        """
+        return [RandomContext(child) 
+                for child in self.seed_sequence.spawn(count)]
+
+ 
+'========================================='
+class ElementList(list):
+    """
+    The list of rows, or one row, of the elements of a ComplexMatrix. Every
+    write tells the matrix that its array form is out of date, and rows put
+    into the list of rows are tracked as well.
+    """
+    __slots__ = ("owner", "rows")
+    
+    def __init__(self, owner, elements, rows = False):
+        """
+        Initializes the list
+        
+        Arguments: The matrix of the elements (ComplexMatrix)
+                   The rows or the elements of a row (list)
+                   True for the list of rows (Bool)
+        """
+        self.owner = owner
+        self.rows = rows
+        list.__init__(self, self.__tracked(elements))
+        
+        
+    def __tracked(self, new):
+        """
+        Returns: The new items, rows as lists tracked by the matrix (list)
+        """
+        if not self.rows:
+            return new
+        return [row if isinstance(row, ElementList) and 
+                row.owner is self.owner else ElementList(self.owner, row)
+                for row in new]
+    
+    
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = self.__tracked(list(value))
+        else:
+            value = self.__tracked([value])[0]
+        list.__setitem__(self, index, value)
+        self.owner._elements_changed()
+        
+        
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self.owner._elements_changed()
+        
+        
+    def __iadd__(self, new):
+        self.extend(new)
+        return self
+    
+    
+    def __imul__(self, count):
+        list.__imul__(self, count)
+        self.owner._elements_changed()
+        return self
+    
+    
+    def append(self, item):
+        self.extend([item])
+        
+        
+    def extend(self, new):
+        list.extend(self, self.__tracked(list(new)))
+        self.owner._elements_changed()
+        
+        
+    def insert(self, index, item):
+        list.insert(self, index, self.__tracked([item])[0])
+        self.owner._elements_changed()
+        
+        
+    def pop(self, index = -1):
+        item = list.pop(self, index)
+        self.owner._elements_changed()
+        return item
+    
+    
+    def remove(self, item):
+        list.remove(self, item)
+        self.owner._elements_changed()
+        
+        
+    def clear(self):
+        list.clear(self)
+        self.owner._elements_changed()
+        
+        
+    def sort(self, *, key = None, reverse = False):
+        list.sort(self, key = key, reverse = reverse)
+        self.owner._elements_changed()
+        
+        
+    def reverse(self):
+        list.reverse(self)
+        self.owner._elements_changed()
+
+ 
+'========================================='
+class ComplexMatrix(ComplexNumber):
+    """
+    Creates a class for complex number matrices with matrix multiplication
+    and element-wise products (vectors). The elements are held either as
+    lists of ComplexNumber objects or as a complex128 numpy array, and each
+    form is built from the other only when it is first asked for.
+    """
+    def __init__(self, matrix):
+        """
+        Initializes the matrix with complex number elements.
+        
+        Arguments: A matrix in the format of list of lists, or a 2D numpy
+                   array of complex numbers
+        """
+        self.__matrix = None
+        self.__array = None
+        try:
+            if isinstance(matrix, np.ndarray):
+                if matrix.ndim != 2 or 0 in matrix.shape:
+                    raise ValueError
+                self.__array = np.ascontiguousarray(matrix, 
+                                                    dtype=np.complex128)
+            elif isinstance(matrix, list):
+                row_length = len(matrix[0])
+                for row in matrix:
+                    if not(isinstance(row, list)):
+                        raise ValueError
+                    if len(row) != row_length:
+                        raise ValueError
+                    for element in row:
+                        if not isinstance(element, ComplexNumber):
+                            raise TypeError
+                self.__matrix = ElementList(self, matrix, rows = True)
+            else:
+                raise ValueError
+        except ValueError:
+            print("E05: The input must be a vector or matrix in a list of ",
+                  "list format, ie. [[1, 2, 3]] or [[1],[2],[3]]. Rows must",
+                  " be of equal length if multiple rows input.")
+            return None
+        except TypeError:
+            print("E04: All elements must be instances of ComplexNumber")
+            return None
+        except:
+            print("E07: Error with initialization")
+            return None
+    
+    
+    def __str__(self):
+        """
+        Returns: The complex matrix (string)
+        """
+        return str(self.matrix_num)
+    
+    
+    def __mul__(self, matrix):
+        """
+        Multiplies matrices or vectors and returns the products.
+        
+        Arguments: Two compatable matrices or vectors (ComplexMatrix)
+        Returns: The product matrix or vector (ComplexMatrix).
+        Notes: The product is a numpy matmul of the arrays, it is held as an
+               array until its ComplexNumber elements are asked for. A
+               sparse matrix or a lazy expression computes the product
+               itself (SparseMatrix or Expression)
+        """
+        if getattr(matrix, "computes_products", False):
+            return NotImplemented
+        try:
+            # Check for class type
+            if not(self.__complex_matrix_checker(matrix)):
+                raise TypeError
+                
+            # Check for multiplication size compatability
+            matrix_1_size = self.matrix_size
+            matrix_2_size = matrix.matrix_size
+            # Matrix Multiplication
+            if (matrix_1_size[1] == matrix_2_size[0]):
+                return ComplexMatrix(self.array @ matrix.array)
+            
+            else:
+                raise ValueError
+        except TypeError: 
+            print("E08: Both entries must be ComplexMatrix values") 
+            return None 
+        except ValueError: 
+            print("E10: These matrices are not compatible to multiply.") 
+            return None 
+        except Exception as e: 
+            print(f"Unexpected error: {e}") 
+            return None
+        
+        
+    def __add__(self, matrix):
+        """
+        Adds two matrices of the same size.
+        
+        Arguments: Two matrices of the same size (ComplexMatrix)
+        Returns: The sum (ComplexMatrix)
+        Notes: A sparse matrix or a lazy expression computes the sum itself
+               (SparseMatrix or Expression)
+        """
+        if getattr(matrix, "computes_products", False):
+            return NotImplemented
+        try:
+            if not(self.__complex_matrix_checker(matrix)):
+                raise TypeError
+            if self.matrix_size != matrix.matrix_size:
+                raise ValueError
+            return ComplexMatrix(self.array + matrix.array)
+        except TypeError: 
+            print("E08: Both entries must be ComplexMatrix values") 
+            return None 
+        except ValueError: 
+            print("E23: Only matrices of the same size can be added.") 
+            return None 
+        
+        
+    def __sub__(self, matrix):
+        """
+        Subtracts a matrix of the same size, see __add__.
+        """
+        if getattr(matrix, "computes_products", False):
+            return NotImplemented
+        if not(self.__complex_matrix_checker(matrix)):
+            print("E08: Both entries must be ComplexMatrix values") 
+            return None 
+        return self + ComplexMatrix(-matrix.array)
+        
+        
+    def __pow__(self, exponent):
+        """
+        Raises a square matrix to an integer power by repeated squaring, a
+        negative power is a power of the inverse.
+        
+        Arguments: The exponent (int)
+        Returns: The power, the identity for 0 (ComplexMatrix)
+        """
+        try:
+            size = self.matrix_size
+            if size[0] != size[1]:
+                raise ValueError
+            if not isinstance(exponent, int):
+                raise TypeError
+            return ComplexMatrix(np.linalg.matrix_power(self.array, exponent))
+        except np.linalg.LinAlgError:
+            print("E18: A singular matrix has no negative powers.")
+            return None
+        except ValueError:
+            print("E17: Only square matrices can be raised to a power.")
+            return None
+        except TypeError:
+            print(exponent)
+            print("E15: The input must be an integer, ex. 3\n")
+            return None
+        
+        
+    @property
+    def matrix(self):
+        """
+        Returns: The complex matrix to prevent name mangling (ComplexMatrix)
+        Notes: The elements may be edited in place, an edit makes the array
+               form be rebuilt from them the next time it is asked for
+        """
+        return self.__elements()
+    
+    
+    def __elements(self):
+        """
+        Returns: The ComplexNumber elements, built from the array when first
+                 asked for (list of lists)
+        """
+        if self.__matrix is None:
+            self.__matrix = ElementList(self, [
+                ElementList(self, [ComplexNumber._from_parts(
+                    element.real, element.imag) for element in row]) 
+                for row in self.__array.tolist()], rows = True)
+        return self.__matrix
+    
+    
+    def _elements_changed(self):
+        """
+        Drops the array form after an edit of the elements
+        """
+        self.__array = None
+    
+    
+    @property
+    def array(self):
+        """
+        Returns: The complex matrix as a numpy array (complex128 ndarray)
+        Notes: For reading, elements are edited through matrix
+        """
+        if self.__array is None:
+            self.__array = np.array([[complex(element) for element in row] 
+                                     for row in self.__matrix], 
+                                    dtype=np.complex128)
+        return self.__array
+    
+    
+    @property
+    def matrix_num(self):
+        """
+        Returns: The complex matrix (Matrix of ComplexNumbers)
+        """
+        matrix_num = []
+        for row in self.__elements(): 
+            row_content = []
+            for element in row:
+                row_content.append(element.complex_str)
+            matrix_num.append(row_content)
+        return matrix_num
+    
+    @property
+    def matrix_size(self):
+        """
+        Returns: A list of the matrix size as rows and columns
+        """
+        if self.__array is not None:
+            return list(self.__array.shape)
+        columns = 0
+        rows = 0
+        for row in self.__matrix:
+            if rows == 0:
+                for element in row:
+                    columns += 1
+            rows += 1
+        return [rows, columns]
+    
+    
+    @staticmethod
+    def __complex_matrix_checker(matrix):
+        """
+        Checks for whether or not the matrix is 2x2 and uses ComplexNumber
+        
+        Arguments: A matrix (ComplexMatrix)
+        Returns: True or returns to user to try again (Bool)
+        Note: The function is heavily supported with chatGTP
+        """ 
+        try:
+            if isinstance(matrix, ComplexMatrix):
+                return True
+            else:
+                raise TypeError
+        except:
+            print(matrix)
+            print("E09: The input is not a ComplexMatrix.")
+            return False
+    
+    
+    @staticmethod
+    def operation_menu():
+        """
+        Runs a menu for the user to perform either a matrix or vector product
+        
+        Arguments: The operation for the menu be cast by the user between 'm' 
+                   for matrix multiplication, 'v' for vector multiplication, 
+                   and 'e' to exit. Once these are cast, the inputs will 
+                   request elements for 2 ComplexMatrix objects.
+        Note: Some support with chatGTP
+        """        
+        # Matrix Building
+        while True:
+            if not ComplexMatrix.__run_class():
+                break
+            try:
+                print("Enter the dimensions of matrix/vector 1: ")
+                mat_1_size = []
+                mat_1_size.append(int(input("No. rows: ")))
+                mat_1_size.append(int(input("No. columns: ")))
+                print("Enter the dimensions of matrix/vector 2: ")
+                mat_2_size = []
+                mat_2_size.append(int(input("No. rows: ")))
+                mat_2_size.append(int(input("No. columns: ")))
+                if (mat_1_size[0] <= 0 or mat_1_size[0] <= 0 or 
+                    mat_2_size[1] <= 0 or mat_2_size[1] <= 0): 
+                    raise ValueError
+                print("\nBuilding matrix 1")
+                matrix_1 = ComplexMatrix.__matrix_builder(mat_1_size)
+                print("\nBuilding matrix 2")
+                matrix_2 = ComplexMatrix.__matrix_builder(mat_2_size)
+                result = matrix_1 * matrix_2
+                print(matrix_1, " multiplied by ", matrix_2, " yields \n",
+                      result, "\n")
+            except UnboundLocalError:
+                print("E14: Unexpected error")
+            except:
+                print("E12: Please enter an int > 0 for the entry") 
+            
+    
+    @staticmethod
+    def __matrix_builder(matrix_size):
+        """
+        Builds a matrix for the user
+        
+        Arguments: The size of matrix in form [rows, columns]
+        """
+        while True:
+            try:
+                matrix = []
+                for row in range(matrix_size[0]):
+                    columns = []
+                    print("\nrow ", row + 1)
+                    for element in range(matrix_size[1]):
+                        real = float(input("real part: "))
+                        imaginary = float(input("imaginary part: "))
+                        columns.append(ComplexNumber(real, imaginary))
+                    matrix.append(columns)     
+                return ComplexMatrix(matrix)
+            except:
+                print("E13: please input a number")
+    
+    
+    @staticmethod
+    def __run_class():
+        while True:
+            try:
+                print("Welcome to ComplexNumbers")
+                operation_type = input("What operation do you need?\n"
+                                       "'m' for matrix multiplication\n"
+                                       "'e' to exit the program:\n")
+                if operation_type == 'm' or operation_type == 'e': break
+                else: raise ValueError("Invalid operation type.")
+            except:
+                print("E11: Please write either 'm' or 'e'\n")
+        if operation_type == 'e': return False
+        elif operation_type == 'm': return True
+        
+     
+"""*********************Main Routine***************************************"""
+# Runs the main routine
+if __name__ == "__main__":
+
+    ComplexMatrix.operation_menu()
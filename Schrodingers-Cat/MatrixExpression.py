@@ -0,0 +1,548 @@
+"""***************************************************************************
+Title:          Matrix Expression
+File:           MatrixExpression.py
+Release Notes:  In development
+
+Author:         Nik Paulic
+
+Purpose:        This app records products, sums and powers of ComplexMatrix
+                and SparseMatrix objects and computes them only when the
+                result is asked for.
+Description:    Every operation builds a node of an expression instead of a
+                matrix. On evaluation, a chain of products is computed in
+                the order with the fewest multiplications, found by the
+                matrix chain dynamic program, so A * B * v multiplies the
+                vector twice instead of building A * B. Scalar factors and
+                sums are folded into one pass over a single result array.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import numpy as np
+from ComplexNumbers import ComplexNumber, ComplexMatrix
+from SparseMatrix import SparseMatrix
+
+
+"""*********************Global*********************************************"""
+EXPANDED_POWER = 16  # Largest power in a chain multiplied out as factors
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def lazy(matrix):
+    """
+    Starts an expression from a matrix
+
+    Arguments: The matrix (ComplexMatrix, SparseMatrix or 2D numpy array)
+    Returns: The expression of the matrix (Expression)
+    """
+    if isinstance(matrix, Expression):
+        return matrix
+    return Leaf(matrix)
+
+
+def _is_scalar(other):
+    """
+    Returns: True for a number, a ComplexMatrix is not one (Bool)
+    """
+    return (isinstance(other, (ComplexNumber, int, float, complex)) and
+            not isinstance(other, ComplexMatrix))
+
+
+def _multiply(left, right):
+    """
+    Returns: The product of two evaluated operands (ndarray or SparseMatrix)
+    """
+    if isinstance(left, SparseMatrix):
+        if isinstance(right, SparseMatrix):
+            return left * right
+        return left.dot(right)
+    if isinstance(right, SparseMatrix):
+        return right.transpose().dot(left.T).T
+    return left @ right
+
+
+def _to_dense(value):
+    """
+    Returns: An evaluated operand as a numpy array (complex128 ndarray)
+    """
+    return value.array if isinstance(value, SparseMatrix) else value
+
+
+def chain_order(shapes, densities = None):
+    """
+    Finds the cheapest order of a chain of matrix products with the matrix
+    chain dynamic program. Multiplying (m x k) by (k x n) costs m * k * n,
+    scaled by the density of a sparse factor.
+
+    Arguments: The shape of every factor (list of tuples)
+               The share of non-zeros of every factor, 1 if None (list)
+    Returns: The cost of the chain, and the split of every sub-chain
+             (tuple of float and dictionary)
+    """
+    count = len(shapes)
+    densities = [1.0] * count if densities is None else densities
+    dims = [shapes[0][0]] + [shape[1] for shape in shapes]
+    cost = {(i, i): 0.0 for i in range(count)}
+    split = {}
+    for length in range(2, count + 1):
+        for i in range(count - length + 1):
+            j = i + length - 1
+            best = None
+            for k in range(i, j):
+                # Only single factors keep their density
+                density = min(densities[i] if k == i else 1.0,
+                              densities[j] if k + 1 == j else 1.0)
+                candidate = (cost[(i, k)] + cost[(k + 1, j)] +
+                             dims[i] * dims[k + 1] * dims[j + 1] * density)
+                if best is None or candidate < best:
+                    best, split[(i, j)] = candidate, k
+            cost[(i, j)] = best
+    return cost[(0, count - 1)], split
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class Expression():
+    """
+    A node of a lazy matrix expression. Products, sums, scalar multiples
+    and integer powers of expressions and matrices build new nodes, and
+    evaluate computes the value once and keeps it.
+    """
+    computes_products = True  # Lets ComplexMatrix hand its products over
+    __array_ufunc__ = None  # Lets numpy arrays hand their operators over
+
+
+    def __init__(self, shape):
+        """
+        Initializes the node
+
+        Arguments: The number of rows and columns of the value (tuple)
+        """
+        self.shape = tuple(shape)
+        self._value = None
+
+
+    @property
+    def matrix_size(self):
+        """
+        Returns: A list of the matrix size as rows and columns
+        """
+        return list(self.shape)
+
+
+    def __mul__(self, other):
+        """
+        Records a product with a matrix, an expression or a scalar
+
+        Arguments: A compatible matrix or expression, or a scalar
+        Returns: The product (Expression)
+        """
+        if _is_scalar(other):
+            return Product([self], complex(other))
+        other = self._operand(other)
+        if other is None:
+            return None
+        if self.shape[1] != other.shape[0]:
+            print("E10: These matrices are not compatible to multiply.")
+            return None
+        return Product([self, other])
+
+
+    def __rmul__(self, other):
+        """
+        Records a product with a matrix or a scalar on the left
+        """
+        if _is_scalar(other):
+            return self * other
+        other = self._operand(other)
+        return None if other is None else other * self
+
+
+    def __add__(self, other):
+        """
+        Records a sum with a matrix or expression of the same size
+
+        Arguments: The matrix or expression
+        Returns: The sum (Expression)
+        """
+        other = self._operand(other)
+        if other is None:
+            return None
+        if self.shape != other.shape:
+            print("E23: Only matrices of the same size can be added.")
+            return None
+        return Sum([(1, self), (1, other)])
+
+
+    def __radd__(self, other):
+        """
+        Records a sum with a matrix on the left
+        """
+        return self + other
+
+
+    def __sub__(self, other):
+        """
+        Records a difference with a matrix or expression of the same size
+        """
+        other = self._operand(other)
+        return None if other is None else self + other * -1
+
+
+    def __rsub__(self, other):
+        """
+        Records a difference with a matrix on the left
+        """
+        other = self._operand(other)
+        return None if other is None else other - self
+
+
+    def __neg__(self):
+        """
+        Returns: The negated expression (Expression)
+        """
+        return self * -1
+
+
+    def __pow__(self, exponent):
+        """
+        Records an integer power of a square expression
+
+        Arguments: The exponent (int)
+        Returns: The power (Expression)
+        """
+        try:
+            if self.shape[0] != self.shape[1]:
+                raise ValueError
+            if not isinstance(exponent, int):
+                raise TypeError
+            return Power(self, exponent)
+        except ValueError:
+            print("E17: Only square matrices can be raised to a power.")
+            return None
+        except TypeError:
+            print(exponent)
+            print("E15: The input must be an integer, ex. 3\n")
+            return None
+
+
+    @staticmethod
+    def _operand(other):
+        """
+        Returns: The other operand as an expression, None if it is not a
+                 matrix (Expression)
+        """
+        try:
+            return lazy(other)
+        except (TypeError, ValueError):
+            print("E24: An expression combines with a ComplexMatrix, a ",
+                  "SparseMatrix, an expression or a number.")
+            return None
+
+
+    def value(self):
+        """
+        Returns: The value, computed on the first call (complex128 ndarray
+                 or SparseMatrix)
+        """
+        if self._value is None:
+            self._value = self._compute()
+        return self._value
+
+
+    def evaluate(self):
+        """
+        Computes the expression
+
+        Returns: The value, sparse only if every step was sparse
+                 (ComplexMatrix or SparseMatrix)
+        """
+        try:
+            value = self.value()
+        except np.linalg.LinAlgError:
+            print("E18: A singular matrix has no negative powers.")
+            return None
+        if isinstance(value, SparseMatrix):
+            return value
+        return ComplexMatrix(value)
+
+
+    def _compute(self):
+        """
+        Returns: The value of the node (complex128 ndarray or SparseMatrix)
+        """
+        raise NotImplementedError
+
+
+    def _density(self):
+        """
+        Returns: The share of non-zeros expected in the value (float)
+        """
+        return 1.0
+
+
+    def _factors(self):
+        """
+        Returns: The factors of the node in a product chain and their
+                 scalar coefficient (tuple of list and complex)
+        """
+        return [self], 1
+
+
+    def _terms(self):
+        """
+        Returns: The terms of the node in a sum (list of tuples of
+                 coefficient and expression)
+        """
+        return [(1, self)]
+
+
+'========================================='
+class Leaf(Expression):
+    """
+    A matrix at the start of an expression
+    """
+    def __init__(self, matrix):
+        """
+        Initializes the leaf, the elements are not copied
+
+        Arguments: The matrix (ComplexMatrix, SparseMatrix or 2D numpy
+                   array)
+        """
+        if isinstance(matrix, ComplexMatrix):
+            matrix = matrix.array
+        elif not isinstance(matrix, SparseMatrix):
+            matrix = np.asarray(matrix, dtype=np.complex128)
+            if matrix.ndim != 2 or 0 in matrix.shape:
+                raise TypeError
+        super().__init__(matrix.shape)
+        self._value = matrix
+
+
+    def __str__(self):
+        """
+        Returns: The kind and size of the matrix (string)
+        """
+        kind = "sparse" if isinstance(self._value, SparseMatrix) else "dense"
+        return f"{kind} {self.shape[0]}x{self.shape[1]}"
+
+
+    def _density(self):
+        if isinstance(self._value, SparseMatrix):
+            return self._value.nnz / (self.shape[0] * self.shape[1])
+        return 1.0
+
+
+'========================================='
+class Product(Expression):
+    """
+    A chain of products with a scalar coefficient, nested products are
+    flattened into one chain so the whole chain is ordered at once
+    """
+    def __init__(self, factors, coefficient = 1):
+        """
+        Initializes the chain
+
+        Arguments: The factors in order (list of Expression)
+                   The scalar coefficient (complex)
+        """
+        chain = []
+        for factor in factors:
+            factor_chain, factor_coefficient = factor._factors()
+            chain += factor_chain
+            coefficient *= factor_coefficient
+        super().__init__((chain[0].shape[0], chain[-1].shape[1]))
+        self.factors = chain
+        self.coefficient = coefficient
+
+
+    def __str__(self):
+        """
+        Returns: The chosen order of the products (string)
+        """
+        chain = self.__chain()
+        names = [f"M{position}" for position in range(len(chain))]
+        if len(chain) == 1:
+            text = names[0]
+        else:
+            cost, split = chain_order([factor.shape for factor in chain],
+                                      [factor._density()
+                                       for factor in chain])
+            text = self.__order_text(names, split, 0, len(chain) - 1)
+        if self.coefficient != 1:
+            text = f"{self.coefficient} * {text}"
+        return text
+
+
+    def __order_text(self, names, split, first, last):
+        """
+        Returns: The parenthesized sub-chain (string)
+        """
+        if first == last:
+            return names[first]
+        middle = split[(first, last)]
+        return (f"({self.__order_text(names, split, first, middle)} * "
+                f"{self.__order_text(names, split, middle + 1, last)})")
+
+
+    def _factors(self):
+        return list(self.factors), self.coefficient
+
+
+    def __chain(self):
+        """
+        Returns: The factors with small positive powers multiplied out, so
+                 the chain order also covers them (list of Expression)
+        """
+        if len(self.factors) == 1:
+            return list(self.factors)
+        chain = []
+        for factor in self.factors:
+            if (isinstance(factor, Power) and factor._value is None and
+                0 <= factor.exponent <= EXPANDED_POWER):
+                chain += [factor.base] * factor.exponent
+            else:
+                chain.append(factor)
+        return chain or [Leaf(np.eye(self.shape[0], dtype=np.complex128))]
+
+
+    def _compute(self):
+        chain = self.__chain()
+        values = [factor.value() for factor in chain]
+        if self.coefficient != 1:
+            # Scale the smallest factor, the cheapest place for the scalar
+            sizes = [factor.shape[0] * factor.shape[1] for factor in chain]
+            smallest = int(np.argmin(sizes))
+            values[smallest] = values[smallest] * self.coefficient
+        if len(values) == 1:
+            return values[0]
+        cost, split = chain_order([factor.shape for factor in chain],
+                                  [factor._density() for factor in chain])
+        return self.__compute_range(values, split, 0, len(values) - 1)
+
+
+    def __compute_range(self, values, split, first, last):
+        """
+        Returns: The product of a sub-chain in the chosen order
+        """
+        if first == last:
+            return values[first]
+        middle = split[(first, last)]
+        return _multiply(self.__compute_range(values, split, first, middle),
+                         self.__compute_range(values, split, middle + 1,
+                                              last))
+
+
+'========================================='
+class Sum(Expression):
+    """
+    A weighted sum of expressions of the same size, nested sums and scalar
+    multiples are flattened into the weights and summed in one array
+    """
+    def __init__(self, terms):
+        """
+        Initializes the sum
+
+        Arguments: The terms (list of tuples of coefficient and Expression)
+        """
+        flat = []
+        for coefficient, term in terms:
+            if isinstance(term, Product) and len(term.factors) == 1:
+                coefficient *= term.coefficient
+                term = term.factors[0]
+            flat += [(coefficient * inner_coefficient, inner)
+                     for inner_coefficient, inner in term._terms()]
+        super().__init__(flat[0][1].shape)
+        self.terms = flat
+
+
+    def _terms(self):
+        return list(self.terms)
+
+
+    def _compute(self):
+        values = [(coefficient, term.value())
+                  for coefficient, term in self.terms]
+        if all(isinstance(value, SparseMatrix) for coefficient, value
+               in values):
+            result = None
+            for coefficient, value in values:
+                value = value if coefficient == 1 else value * coefficient
+                result = value if result is None else result + value
+            return result
+
+        # Dense terms first, so the first copy is the only new array
+        values.sort(key=lambda term: isinstance(term[1], SparseMatrix))
+        coefficient, value = values[0]
+        result = np.multiply(value, coefficient, dtype=np.complex128)
+        for coefficient, value in values[1:]:
+            if isinstance(value, SparseMatrix):
+                result[value.row_indices(), value.indices] += (
+                    value.data * coefficient)
+            elif coefficient == 1:
+                result += value
+            else:
+                result += value * coefficient
+        return result
+
+
+'========================================='
+class Power(Expression):
+    """
+    An integer power of a square expression, by repeated squaring when it
+    is not part of a longer chain
+    """
+    def __init__(self, base, exponent):
+        """
+        Initializes the power
+
+        Arguments: The square expression (Expression)
+                   The exponent, a negative power is a power of the inverse
+                   (int)
+        """
+        super().__init__(base.shape)
+        self.base = base
+        self.exponent = exponent
+
+
+    def _compute(self):
+        value = self.base.value()
+        if isinstance(value, SparseMatrix) and self.exponent > 0:
+            result = None
+            exponent = self.exponent
+            while exponent:
+                if exponent & 1:
+                    result = value if result is None else result * value
+                exponent >>= 1
+                if exponent:
+                    value = value * value
+            return result
+        return np.linalg.matrix_power(_to_dense(value), self.exponent)
+
+
+"""*********************Main Routine***************************************"""
+# Runs the main routine
+if __name__ == "__main__":
+    import time
+    size = 2000
+    rng = np.random.default_rng(7)
+    matrices = [ComplexMatrix(rng.standard_normal((size, size)) + 0j)
+                for count in range(3)]
+    vector = ComplexMatrix(rng.standard_normal((size, 1)) + 0j)
+
+    start = time.perf_counter()
+    eager = matrices[0] * matrices[1] * matrices[2] * vector
+    print(f"Eager A * B * C * v in {time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    expression = lazy(matrices[0]) * matrices[1] * matrices[2] * vector
+    result = expression.evaluate()
+    print(f"Lazy {expression} in {time.perf_counter() - start:.3f} s, "
+          f"same result: {np.allclose(result.array, eager.array)}")
+
+    row = lazy(vector.array.T)
+    expression = row * lazy(matrices[0]) ** 3 - row * matrices[1] * 2
+    start = time.perf_counter()
+    expression.evaluate()
+    print(f"Lazy v * A ** 3 - v * B * 2 with v * A ** 3 as "
+          f"{expression.terms[0][1]} in {time.perf_counter() - start:.3f} s")
@@ -1,107 +1,214 @@
-"""***************************************************************************
-Title:          Radioactive Atom
-File:           RadAtom.py
-Release Notes:  In development
-
-Author:         Nik Paulic
-
-Purpose:        This app creates classes to generate an atom, another atom
-                that may or may not be radioactive, and a bottle/container
-                for the atoms that consists of a mix of these atoms.
-Description:    Using complex numbers, this software assigns probabilities to
-                a container to determine the concentration of hazardous atoms
-                within.
-***************************************************************************"""
-
-"""*********************Libraries******************************************"""
-from ComplexNumbers import ComplexNumber, ComplexMatrix
-
-
-"""*********************Classes********************************************"""
-'========================================='
-class Atom():
-    """
-    Initialization of an atom class
-    """
-    def __init__(self):
-        """
-        Initializes an atom that is not radioactive
-        """
-        self._radioactive = False
-        
-    
-    @property
-    def radioactivity(self):
-        """
-        Returns the radioactivity status of the atom
-        """
-        return self._radioactive
-
-
-'========================================='
-class SketchyAtom(Atom):
-    """
-    Initialization of an atom class
-    """
-    def __init__(self):
-        """
-        Initializes an atom that may be radioactive
-        """
-        super().__init__()
-        self.__decay_probability = (abs(ComplexNumber.probability()))**2
-    
-    @property
-    def radioactivity(self):
-        """
-        Returns the radioactivity status of the atom
-        """
-        if self.__decay_probability > 0.5:
-            self._radioactive = True
-        return self._radioactive
-    
-
-class Bottle():
-    def __init__(self, num_atoms = 100):
-        """
-        Initializes the bottle properties based on user input of num of atoms
-        """
-        self.num_atoms = num_atoms 
-        self.bottle = [] 
-        self.probabilities = self.generate_probabilities()
-    
-    
-    def bottle_contents(self):
-        """
-        Decodes the probabilities to generate atoms in the bottle
-        """
-        # Initializing the vial in the box
-        bottle_probabilities = self.probabilities.matrix
-        
-        # Calculating whether or not an atom or sketchy atom is present
-        for row in bottle_probabilities:
-            for element in row:
-                if (abs(element))**2 > 0.5: 
-                    self.bottle.append(SketchyAtom())
-                else:
-                    self.bottle.append(Atom())
-        
-        return self.bottle
-        
-        
-    def generate_probabilities(self):
-        """
-        Generates the probability matrix for the types of atoms in the bottle
-        """
-        column = []
-        for i in range(1):
-            row = []
-            for j in range(self.num_atoms):
-                row.append(ComplexNumber.probability())
-            column.append(row)
-        return ComplexMatrix(column)
-
-
-"""*********************Main Routine***************************************"""
-# Runs the main routine
-if __name__ == "__main__":
+"""***************************************************************************
+Title:          Radioactive Atom
+File:           RadAtom.py
+Release Notes:  In development
+
+Author:         Nik Paulic
+
+Purpose:        This app creates classes to generate an atom, another atom
+                that may or may not be radioactive, and a bottle/container
+                for the atoms that consists of a mix of these atoms.
+Description:    Using complex numbers, this software assigns probabilities to
+                a container to determine the concentration of hazardous atoms
+                within.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import numpy as np
+from ComplexNumbers import ComplexNumber, ComplexMatrix, batch_generator
+
+
+"""*********************Global*********************************************"""
+CHUNK_ATOMS = 1 << 24  # Atoms drawn at once, a multiple of 8
+LETHAL_CONCENTRATION = 0.27  # Share of radioactive atoms that kills the cat
+
+# Set bits of every byte, for numpy versions without bitwise_count
+BIT_COUNTS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], 
+                           axis=1).sum(axis=1)
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def radioactive_counts(num_bottles, num_atoms, rng = None):
+    """
+    Counts the radioactive atoms of many bottles at once, with the same
+    rules as Bottle.bottle_contents but without keeping the atoms
+    
+    Arguments: The number of bottles and atoms per bottle (int)
+               The generator to draw from, the current random
+               context's if None (numpy Generator)
+    Returns: The number of radioactive atoms of every bottle (int ndarray)
+    """
+    rng = batch_generator() if rng is None else rng
+    counts = np.zeros(num_bottles, dtype=np.int64)
+    # Whole bottles per chunk, or parts of one bottle if it is larger
+    step = max(CHUNK_ATOMS // max(num_atoms, 1), 1)
+    width = max(min(num_atoms, CHUNK_ATOMS), 1)
+    for start in range(0, num_bottles, step):
+        end = min(start + step, num_bottles)
+        for first in range(0, num_atoms, width):
+            shape = (end - start, min(first + width, num_atoms) - first)
+            sketchy = rng.random(shape, dtype=np.float32) > 0.5
+            decays = rng.random(shape, dtype=np.float32) > 0.5
+            counts[start:end] += np.count_nonzero(sketchy & decays, axis=1)
+    return counts
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class Atom():
+    """
+    Initialization of an atom class
+    """
+    def __init__(self):
+        """
+        Initializes an atom that is not radioactive
+        """
+        self._radioactive = False
+        
+    
+    @property
+    def radioactivity(self):
+        """
+        Returns the radioactivity status of the atom
+        """
+        return self._radioactive
+
+
+'========================================='
+class SketchyAtom(Atom):
+    """
+    Initialization of an atom class
+    """
+    def __init__(self):
+        """
+        Initializes an atom that may be radioactive
+        """
+        super().__init__()
+        self.__decay_probability = (abs(ComplexNumber.probability()))**2
+    
+    @property
+    def radioactivity(self):
+        """
+        Returns the radioactivity status of the atom
+        """
+        if self.__decay_probability > 0.5:
+            self._radioactive = True
+        return self._radioactive
+    
+
+'========================================='
+class Bottle():
+    """
+    A bottle of atoms held as arrays instead of atom objects: the squared
+    probability amplitude of every atom as float32, and one bit per atom
+    that is set when the atom is sketchy and decays.
+    """
+    def __init__(self, num_atoms = 100, rng = None):
+        """
+        Initializes the bottle properties based on user input of num of atoms
+        
+        Arguments: The number of atoms (int)
+                   The generator to draw from, the random context current
+                   at every draw if None (numpy Generator)
+        """
+        self.num_atoms = num_atoms 
+        self.__rng = rng
+        self.bottle = None
+        self.__probabilities = None
+    
+    
+    @property
+    def rng(self):
+        """
+        Returns: The generator to draw from, looked up at every draw unless
+                 one was given (numpy Generator)
+        """
+        return batch_generator() if self.__rng is None else self.__rng
+    
+    
+    @property
+    def probabilities(self):
+        """
+        Returns: The squared probability of every atom, drawn when first
+                 asked for (float32 ndarray)
+        """
+        if self.__probabilities is None:
+            self.__probabilities = self.generate_probabilities()
+        return self.__probabilities
+    
+    
+    def __len__(self):
+        """
+        Returns: The number of atoms in the bottle (int)
+        """
+        return self.num_atoms
+    
+    
+    def bottle_contents(self):
+        """
+        Decodes the probabilities to generate atoms in the bottle. An atom
+        with a squared probability above 0.5 is sketchy, and a sketchy atom
+        decays if its own decay probability is above 0.5 as in SketchyAtom.
+        
+        Returns: The bottle, its decay flags packed 8 atoms per byte (Bottle)
+        """
+        self.bottle = np.empty((self.num_atoms + 7) // 8, dtype=np.uint8)
+        for start in range(0, self.num_atoms, CHUNK_ATOMS):
+            end = min(start + CHUNK_ATOMS, self.num_atoms)
+            sketchy = self.probabilities[start:end] > 0.5
+            decays = self.__squared_probabilities(end - start) > 0.5
+            self.bottle[start // 8:(end + 7) // 8] = np.packbits(
+                sketchy & decays)
+        return self
+        
+        
+    def generate_probabilities(self):
+        """
+        Generates the squared probability of every atom in the bottle. The 
+        squared absolute value of ComplexNumber.probability is uniform on
+        [0, 1), so it is drawn directly in chunks without the complex
+        numbers.
+        
+        Returns: The squared probabilities (float32 ndarray)
+        """
+        probabilities = np.empty(self.num_atoms, dtype=np.float32)
+        for start in range(0, self.num_atoms, CHUNK_ATOMS):
+            end = min(start + CHUNK_ATOMS, self.num_atoms)
+            probabilities[start:end] = self.__squared_probabilities(
+                end - start)
+        return probabilities
+    
+    
+    def __squared_probabilities(self, count):
+        """
+        Returns: count squared absolute values of ComplexNumber.probability
+                 samples (float32 ndarray)
+        """
+        return self.rng.random(count, dtype=np.float32)
+    
+    
+    def radioactive_count(self):
+        """
+        Counts the radioactive atoms by a popcount of the decay flags
+        
+        Returns: The number of radioactive atoms (int)
+        """
+        if self.bottle is None:
+            self.bottle_contents()
+        if hasattr(np, "bitwise_count"):
+            return int(np.bitwise_count(self.bottle).sum(dtype=np.int64))
+        return int(BIT_COUNTS[self.bottle].sum(dtype=np.int64))
+    
+    
+    def hazard_concentration(self):
+        """
+        Returns: The share of radioactive atoms in the bottle (float)
+        """
+        return self.radioactive_count() / self.num_atoms
+
+
+"""*********************Main Routine***************************************"""
+# Runs the main routine
+if __name__ == "__main__":
     None
\ No newline at end of file
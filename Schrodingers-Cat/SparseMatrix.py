@@ -0,0 +1,477 @@
+"""***************************************************************************
+Title:          Sparse Matrix
+File:           SparseMatrix.py
+Release Notes:  In development
+
+Author:         Nik Paulic
+
+Purpose:        This app holds large complex matrices that are mostly zeros,
+                such as Hamiltonians and layers of gates, and multiplies
+                them with each other and with ComplexMatrix objects.
+Description:    Only the non-zero elements are stored, in compressed sparse
+                row (CSR) form: the column and value of every non-zero
+                sorted by row, and where every row starts. Matrices are
+                built from coordinate (COO) triples or from a ComplexMatrix,
+                so an operator with millions of rows but a few non-zeros per
+                row takes tens of megabytes.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import numpy as np
+from ComplexNumbers import ComplexNumber, ComplexMatrix
+
+
+"""*********************Global*********************************************"""
+CHUNK_ELEMENTS = 1 << 23  # Products held at once by a multiplication
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class SparseMatrix():
+    """
+    Creates a complex matrix that stores only its non-zero elements in CSR
+    form. It multiplies with scalars, ComplexMatrix and other SparseMatrix
+    objects, and adds to both kinds of matrix.
+    """
+    computes_products = True  # Lets ComplexMatrix hand its products over
+
+
+    def __init__(self, rows, columns, values, shape):
+        """
+        Initializes the matrix from coordinate (COO) triples, duplicates are
+        summed and zeros are dropped.
+
+        Arguments: The row and column of every element (int arrays)
+                   The value of every element (complex array or list of
+                   ComplexNumber)
+                   The number of rows and columns (tuple)
+        """
+        self.indptr = None
+        try:
+            shape = (int(shape[0]), int(shape[1]))
+            if shape[0] <= 0 or shape[1] <= 0:
+                raise ValueError
+            if len(values) and isinstance(values[0], ComplexNumber):
+                values = [complex(value) for value in values]
+            rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+            columns = np.asarray(columns, dtype=np.int64).reshape(-1)
+            values = np.asarray(values, dtype=np.complex128).reshape(-1)
+            if not len(rows) == len(columns) == len(values):
+                raise ValueError
+            if len(rows) and (rows.min() < 0 or rows.max() >= shape[0] or
+                              columns.min() < 0 or
+                              columns.max() >= shape[1]):
+                raise ValueError
+        except (ValueError, TypeError, IndexError):
+            print("E21: The elements need a row, column and value each, ",
+                  "inside a shape of at least 1x1.")
+            return None
+        self.shape = shape
+        self.__set_csr(*self.__sum_duplicates(rows, columns, values, shape))
+
+
+    def __set_csr(self, rows, columns, values):
+        """
+        Stores elements already sorted by row and column
+        """
+        index_type = np.int32 if self.shape[1] < 1 << 31 else np.int64
+        self.indptr = np.zeros(self.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.shape[0]),
+                  out=self.indptr[1:])
+        self.indices = columns.astype(index_type)
+        self.data = values
+
+
+    @staticmethod
+    def __sum_duplicates(rows, columns, values, shape):
+        """
+        Returns: The elements sorted by row and column, with duplicates
+                 summed and zeros dropped (tuple of arrays)
+        """
+        keys = rows * shape[1] + columns
+        if len(keys) > 1 and np.any(keys[1:] <= keys[:-1]):
+            order = np.argsort(keys, kind="stable")
+            keys, values = keys[order], values[order]
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            keys = keys[starts]
+            values = np.add.reduceat(values, starts)
+        kept = values != 0
+        keys, values = keys[kept], values[kept]
+        return keys // shape[1], keys % shape[1], values
+
+
+    @classmethod
+    def from_csr(cls, indptr, indices, data, shape):
+        """
+        Returns a matrix around existing CSR arrays, without a copy. The
+        columns of every row must be sorted and unique.
+
+        Arguments: Where every row starts, and the column and value of
+                   every non-zero (arrays)
+                   The number of rows and columns (tuple)
+        Returns: The matrix (SparseMatrix)
+        """
+        matrix = cls.__new__(cls)
+        matrix.shape = (int(shape[0]), int(shape[1]))
+        matrix.indptr = np.asarray(indptr, dtype=np.int64)
+        matrix.indices = np.asarray(indices)
+        matrix.data = np.asarray(data, dtype=np.complex128)
+        return matrix
+
+
+    @classmethod
+    def from_dense(cls, matrix):
+        """
+        Returns the non-zero elements of a dense matrix
+
+        Arguments: The matrix (ComplexMatrix or 2D numpy array)
+        Returns: The matrix (SparseMatrix)
+        """
+        array = matrix.array if isinstance(matrix, ComplexMatrix) else matrix
+        array = np.asarray(array, dtype=np.complex128)
+        rows, columns = np.nonzero(array)
+        return cls(rows, columns, array[rows, columns], array.shape)
+
+
+    @classmethod
+    def diagonal(cls, values, offset = 0):
+        """
+        Returns a matrix with values on one diagonal
+
+        Arguments: The values of the diagonal (complex array)
+                   The diagonal, above the main one if positive (int)
+        Returns: The square matrix (SparseMatrix)
+        """
+        values = np.asarray(values, dtype=np.complex128)
+        size = len(values) + abs(offset)
+        positions = np.arange(len(values))
+        return cls(positions + max(-offset, 0), positions + max(offset, 0),
+                   values, (size, size))
+
+
+    @classmethod
+    def identity(cls, size):
+        """
+        Returns: The identity of a size (SparseMatrix)
+        """
+        return cls.diagonal(np.ones(size))
+
+
+    def __str__(self):
+        """
+        Returns: The size and number of non-zeros (string)
+        """
+        return (f"SparseMatrix {self.shape[0]}x{self.shape[1]} with "
+                f"{self.nnz} non-zeros")
+
+
+    @property
+    def nnz(self):
+        """
+        Returns: The number of stored non-zeros (int)
+        """
+        return len(self.data)
+
+
+    @property
+    def matrix_size(self):
+        """
+        Returns: A list of the matrix size as rows and columns
+        """
+        return list(self.shape)
+
+
+    @property
+    def array(self):
+        """
+        Returns: The matrix as a dense numpy array (complex128 ndarray)
+        """
+        array = np.zeros(self.shape, dtype=np.complex128)
+        array[self.row_indices(), self.indices] = self.data
+        return array
+
+
+    def row_indices(self):
+        """
+        Returns: The row of every non-zero (int64 ndarray)
+        """
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+
+    def element(self, row, column):
+        """
+        Returns: The element at a row and column (ComplexNumber)
+        """
+        start, end = self.indptr[row], self.indptr[row + 1]
+        position = start + np.searchsorted(self.indices[start:end], column)
+        if position < end and self.indices[position] == column:
+            value = self.data[position]
+            return ComplexNumber(float(value.real), float(value.imag))
+        return ComplexNumber(0, 0)
+
+
+    def to_coo(self):
+        """
+        Returns: The row, column and value of every non-zero (tuple of
+                 arrays)
+        """
+        return self.row_indices(), self.indices.astype(np.int64), self.data
+
+
+    def to_dense(self):
+        """
+        Returns: The matrix as a dense matrix (ComplexMatrix)
+        """
+        return ComplexMatrix(self.array)
+
+
+    def transpose(self):
+        """
+        Returns: The transposed matrix (SparseMatrix)
+        """
+        rows, columns, values = self.to_coo()
+        return SparseMatrix(columns, rows, values, self.shape[::-1])
+
+
+    def conjugate_transpose(self):
+        """
+        Returns: The conjugate transposed matrix (SparseMatrix)
+        """
+        rows, columns, values = self.to_coo()
+        return SparseMatrix(columns, rows, values.conj(), self.shape[::-1])
+
+
+    def __row_chunks(self, row_costs):
+        """
+        Splits the rows into ranges of about CHUNK_ELEMENTS products
+
+        Arguments: The number of products of every row (int array)
+        Returns: The first and last row of every range (list of tuples)
+        """
+        cumulative = np.cumsum(row_costs)
+        chunks = []
+        start = 0
+        while start < self.shape[0]:
+            done = cumulative[start - 1] if start else 0
+            end = int(np.searchsorted(cumulative, done + CHUNK_ELEMENTS,
+                                      side="right"))
+            end = min(max(end, start + 1), self.shape[0])
+            chunks.append((start, end))
+            start = end
+        return chunks
+
+
+    def __mul__(self, other):
+        """
+        Multiplies the matrix by a scalar, a dense or a sparse matrix
+
+        Arguments: A compatible matrix (ComplexMatrix or SparseMatrix), or a
+                   scalar (int, float, complex or ComplexNumber)
+        Returns: The product, dense for a dense matrix and sparse otherwise
+                 (ComplexMatrix or SparseMatrix)
+        Notes: A lazy expression computes the product itself (Expression)
+        """
+        if self.__hands_over(other):
+            return NotImplemented
+        try:
+            if isinstance(other, ComplexMatrix):
+                if self.shape[1] != other.matrix_size[0]:
+                    raise ValueError
+                return ComplexMatrix(self.dot(other.array))
+            if isinstance(other, SparseMatrix):
+                if self.shape[1] != other.shape[0]:
+                    raise ValueError
+                return self.__sparse_product(other)
+            if isinstance(other, (ComplexNumber, int, float, complex)):
+                return SparseMatrix.from_csr(self.indptr, self.indices,
+                                             self.data * complex(other),
+                                             self.shape)
+            raise TypeError
+        except TypeError:
+            print("E22: A SparseMatrix multiplies a ComplexMatrix, a ",
+                  "SparseMatrix or a number.")
+            return None
+        except ValueError:
+            print("E10: These matrices are not compatible to multiply.")
+            return None
+
+
+    def __rmul__(self, other):
+        """
+        Multiplies a scalar or a dense matrix by the matrix
+
+        Arguments: A compatible dense matrix (ComplexMatrix) or a scalar
+        Returns: The product (ComplexMatrix or SparseMatrix)
+        """
+        if self.__hands_over(other):
+            return NotImplemented
+        if isinstance(other, ComplexMatrix):
+            if other.matrix_size[1] != self.shape[0]:
+                print("E10: These matrices are not compatible to multiply.")
+                return None
+            return ComplexMatrix(self.transpose().dot(other.array.T).T)
+        return self * other
+
+
+    def dot(self, array):
+        """
+        Multiplies the matrix by a dense numpy vector or matrix
+
+        Arguments: The dense operand with as many rows as the matrix has
+                   columns (complex ndarray)
+        Returns: The product (complex128 ndarray)
+        """
+        array = np.asarray(array)
+        vector = array.ndim == 1
+        array = array.reshape(len(array), -1)
+        result = np.zeros((self.shape[0], array.shape[1]),
+                          dtype=np.complex128)
+        counts = np.diff(self.indptr)
+        for start, end in self.__row_chunks(counts * array.shape[1]):
+            first, last = self.indptr[start], self.indptr[end]
+            if first == last:
+                continue
+            products = (self.data[first:last, None] *
+                        array[self.indices[first:last]])
+            rows = np.flatnonzero(counts[start:end]) + start
+            result[rows] = np.add.reduceat(products,
+                                           self.indptr[rows] - first)
+        return result[:, 0] if vector else result
+
+
+    def __sparse_product(self, other):
+        """
+        Multiplies two sparse matrices row by row: every non-zero A[i, k]
+        scales row k of B into row i of the product.
+        """
+        counts = np.diff(other.indptr)[self.indices]
+        row_costs = np.add.reduceat(np.r_[counts, 0], self.indptr[:-1])
+        row_costs[np.diff(self.indptr) == 0] = 0
+        pieces = []
+        for start, end in self.__row_chunks(row_costs):
+            first, last = self.indptr[start], self.indptr[end]
+            chunk_counts = counts[first:last]
+            total = int(chunk_counts.sum())
+            if total == 0:
+                continue
+            inner = self.indices[first:last]
+            offsets = (np.arange(total) -
+                       np.repeat(np.cumsum(chunk_counts) - chunk_counts,
+                                 chunk_counts))
+            positions = np.repeat(other.indptr[inner], chunk_counts) + offsets
+            rows = np.repeat(np.repeat(np.arange(start, end),
+                                       np.diff(self.indptr[start:end + 1])),
+                             chunk_counts)
+            values = (np.repeat(self.data[first:last], chunk_counts) *
+                      other.data[positions])
+            pieces.append(self.__sum_duplicates(
+                rows, other.indices[positions].astype(np.int64), values,
+                (self.shape[0], other.shape[1])))
+        product = SparseMatrix.__new__(SparseMatrix)
+        product.shape = (self.shape[0], other.shape[1])
+        if pieces:
+            product.__set_csr(*(np.concatenate(part)
+                                for part in zip(*pieces)))
+        else:
+            empty = np.empty(0, dtype=np.int64)
+            product.__set_csr(empty, empty, np.empty(0, dtype=np.complex128))
+        return product
+
+
+    def __add__(self, other):
+        """
+        Adds a matrix of the same size
+
+        Arguments: The matrix (ComplexMatrix or SparseMatrix)
+        Returns: The sum, dense if either matrix is dense (ComplexMatrix or
+                 SparseMatrix)
+        Notes: A lazy expression computes the sum itself (Expression)
+        """
+        if self.__hands_over(other):
+            return NotImplemented
+        try:
+            if not isinstance(other, (ComplexMatrix, SparseMatrix)):
+                raise TypeError
+            if list(self.shape) != other.matrix_size:
+                raise ValueError
+            if isinstance(other, ComplexMatrix):
+                array = other.array.copy()
+                array[self.row_indices(), self.indices] += self.data
+                return ComplexMatrix(array)
+            rows, columns, values = self.to_coo()
+            other_rows, other_columns, other_values = other.to_coo()
+            return SparseMatrix(np.r_[rows, other_rows],
+                                np.r_[columns, other_columns],
+                                np.r_[values, other_values], self.shape)
+        except TypeError:
+            print("E22: A SparseMatrix adds to a ComplexMatrix or a ",
+                  "SparseMatrix.")
+            return None
+        except ValueError:
+            print("E23: Only matrices of the same size can be added.")
+            return None
+
+
+    def __radd__(self, other):
+        """
+        Adds the matrix to a dense matrix of the same size
+        """
+        return self + other
+
+
+    def __sub__(self, other):
+        """
+        Subtracts a matrix of the same size
+        """
+        if self.__hands_over(other):
+            return NotImplemented
+        if isinstance(other, ComplexMatrix):
+            return self + ComplexMatrix(-other.array)
+        if isinstance(other, SparseMatrix):
+            return self + other * -1
+        return self + other
+
+
+    def __rsub__(self, other):
+        """
+        Subtracts the matrix from a dense matrix of the same size
+        """
+        return self * -1 + other
+
+
+    @staticmethod
+    def __hands_over(other):
+        """
+        Returns: True for an operand that computes the result itself, like
+                 a lazy expression (Bool)
+        """
+        return (getattr(other, "computes_products", False) and
+                not isinstance(other, SparseMatrix))
+
+
+"""*********************Main Routine***************************************"""
+# Runs the main routine
+if __name__ == "__main__":
+    import time
+    # Hamiltonian of a particle hopping along a ring of 4 million sites
+    sites = 4000000
+    start = time.perf_counter()
+    hopping = SparseMatrix.diagonal(-np.ones(sites - 1), 1)
+    ring = SparseMatrix([sites - 1], [0], [-1], (sites, sites))
+    hamiltonian = hopping + hopping.conjugate_transpose() + ring + \
+        ring.transpose()
+    print(hamiltonian, f"built in {time.perf_counter() - start:.2f} s, "
+          f"{(hamiltonian.data.nbytes + hamiltonian.indices.nbytes) / 1e6:.0f}"
+          " MB")
+
+    state = ComplexMatrix(np.exp(2j * np.pi * np.arange(sites) / sites
+                                 ).reshape(-1, 1))
+    start = time.perf_counter()
+    energy = hamiltonian * state
+    print(f"Sparse x dense in {time.perf_counter() - start:.2f} s, energy "
+          f"{energy.array[0, 0] / state.array[0, 0]:.6f}")
+
+    start = time.perf_counter()
+    squared = hamiltonian * hamiltonian
+    print(squared, f"from sparse x sparse in "
+          f"{time.perf_counter() - start:.2f} s")
@@ -0,0 +1,420 @@
+"""***************************************************************************
+Title:          State Vector
+File:           StateVector.py
+Release Notes:  In development
+
+Author:         Nik Paulic
+
+Purpose:        This app simulates a register of qubits, the quantum version
+                of the atoms in the bottle, through gates and measurements.
+Description:    The register keeps the 2^n complex amplitudes as one numpy
+                array. A gate acts on a view of the amplitudes reshaped to
+                one axis per qubit, so only the 2x2 or 4x4 gate matrix is
+                ever built and a circuit of 24 qubits runs in seconds.
+                Gates and amplitudes go in and out as ComplexMatrix and
+                ComplexNumber objects.
+***************************************************************************"""
+
+"""*********************Libraries******************************************"""
+import math
+import numpy as np
+from ComplexNumbers import ComplexNumber, ComplexMatrix, batch_generator
+
+
+"""*********************Global*********************************************"""
+MAX_QUBITS = 30  # Largest register, 16 GB of amplitudes
+MATMUL_STRIDE = 8  # Shortest stride of a qubit applied as a batch
+SQRT_HALF = math.sqrt(0.5)
+
+# Common gates, the first qubit of a 2 qubit gate is the control
+IDENTITY = ComplexMatrix([[ComplexNumber(1, 0), ComplexNumber(0, 0)],
+                          [ComplexNumber(0, 0), ComplexNumber(1, 0)]])
+PAULI_X = ComplexMatrix([[ComplexNumber(0, 0), ComplexNumber(1, 0)],
+                         [ComplexNumber(1, 0), ComplexNumber(0, 0)]])
+PAULI_Y = ComplexMatrix([[ComplexNumber(0, 0), ComplexNumber(0, -1)],
+                         [ComplexNumber(0, 1), ComplexNumber(0, 0)]])
+PAULI_Z = ComplexMatrix([[ComplexNumber(1, 0), ComplexNumber(0, 0)],
+                         [ComplexNumber(0, 0), ComplexNumber(-1, 0)]])
+HADAMARD = ComplexMatrix([[ComplexNumber(SQRT_HALF, 0),
+                           ComplexNumber(SQRT_HALF, 0)],
+                          [ComplexNumber(SQRT_HALF, 0),
+                           ComplexNumber(-SQRT_HALF, 0)]])
+S_GATE = ComplexMatrix([[ComplexNumber(1, 0), ComplexNumber(0, 0)],
+                        [ComplexNumber(0, 0), ComplexNumber(0, 1)]])
+T_GATE = ComplexMatrix([[ComplexNumber(1, 0), ComplexNumber(0, 0)],
+                        [ComplexNumber(0, 0),
+                         ComplexNumber(SQRT_HALF, SQRT_HALF)]])
+CNOT = ComplexMatrix(np.array([[1, 0, 0, 0], [0, 1, 0, 0],
+                               [0, 0, 0, 1], [0, 0, 1, 0]], dtype=complex))
+CZ = ComplexMatrix(np.diag(np.array([1, 1, 1, -1], dtype=complex)))
+SWAP = ComplexMatrix(np.array([[1, 0, 0, 0], [0, 0, 1, 0],
+                               [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex))
+
+
+"""*********************Functions******************************************"""
+'========================================='
+def phase_gate(angle):
+    """
+    Returns the gate that shifts the phase of |1> by an angle
+
+    Arguments: The angle in radians (float)
+    Returns: The gate (ComplexMatrix)
+    """
+    return ComplexMatrix([[ComplexNumber(1, 0), ComplexNumber(0, 0)],
+                          [ComplexNumber(0, 0),
+                           ComplexNumber(math.cos(angle), math.sin(angle))]])
+
+
+def rotation_x(angle):
+    """
+    Returns: The rotation about the x axis by an angle (ComplexMatrix)
+    """
+    cos, sin = math.cos(angle / 2), math.sin(angle / 2)
+    return ComplexMatrix([[ComplexNumber(cos, 0), ComplexNumber(0, -sin)],
+                          [ComplexNumber(0, -sin), ComplexNumber(cos, 0)]])
+
+
+def rotation_y(angle):
+    """
+    Returns: The rotation about the y axis by an angle (ComplexMatrix)
+    """
+    cos, sin = math.cos(angle / 2), math.sin(angle / 2)
+    return ComplexMatrix([[ComplexNumber(cos, 0), ComplexNumber(-sin, 0)],
+                          [ComplexNumber(sin, 0), ComplexNumber(cos, 0)]])
+
+
+def rotation_z(angle):
+    """
+    Returns: The rotation about the z axis by an angle (ComplexMatrix)
+    """
+    cos, sin = math.cos(angle / 2), math.sin(angle / 2)
+    return ComplexMatrix([[ComplexNumber(cos, -sin), ComplexNumber(0, 0)],
+                          [ComplexNumber(0, 0), ComplexNumber(cos, sin)]])
+
+
+def controlled(gate):
+    """
+    Returns the 2 qubit gate that applies a 1 qubit gate to the second qubit
+    when the first qubit is |1>
+
+    Arguments: The 1 qubit gate (ComplexMatrix)
+    Returns: The controlled gate (ComplexMatrix)
+    """
+    array = np.eye(4, dtype=np.complex128)
+    array[2:, 2:] = gate.array
+    return ComplexMatrix(array)
+
+
+"""*********************Classes********************************************"""
+'========================================='
+class StateVector():
+    """
+    A register of qubits in the state sum(a_k |k>). Qubit 0 is the most
+    significant bit of k, so the state |q0 q1 ... q(n-1)> reads as written.
+    """
+    def __init__(self, num_qubits = 1, amplitudes = None, rng = None):
+        """
+        Initializes the register to |00...0> or to the given amplitudes
+
+        Arguments: The number of qubits (int)
+                   The amplitudes, normalized if not of length 1 (list of
+                   ComplexNumber, a ComplexMatrix vector or a numpy array)
+                   The generator of the measurements, the current random
+                   context's if None (numpy Generator)
+        """
+        self.__rng = rng
+        self.__amplitudes = None
+        self.__scratch = None  # Output of the next gate, swapped in after
+        self.__buffer = None
+        self.__pending = {}  # Waiting 1 qubit gate of every qubit
+        try:
+            if amplitudes is None:
+                if not 0 < num_qubits <= MAX_QUBITS:
+                    raise ValueError
+                self.__amplitudes = np.zeros(1 << num_qubits,
+                                             dtype=np.complex128)
+                self.__amplitudes[0] = 1
+            else:
+                if isinstance(amplitudes, ComplexMatrix):
+                    amplitudes = amplitudes.array.reshape(-1)
+                elif isinstance(amplitudes, list):
+                    amplitudes = [complex(element) for element in amplitudes]
+                amplitudes = np.array(amplitudes, dtype=np.complex128)
+                amplitudes = amplitudes.reshape(-1)
+                num_qubits = len(amplitudes).bit_length() - 1
+                if len(amplitudes) != 1 << num_qubits or num_qubits == 0:
+                    raise ValueError
+                norm = np.linalg.norm(amplitudes)
+                if norm == 0:
+                    raise ValueError
+                self.__amplitudes = amplitudes / norm
+            self.num_qubits = num_qubits
+        except (ValueError, TypeError):
+            print("E19: The register needs 1 to", MAX_QUBITS, "qubits, or ",
+                  "2^n amplitudes that are not all zero.")
+            return None
+
+
+    @property
+    def rng(self):
+        """
+        Returns: The generator of the measurements, looked up at every draw
+                 unless one was given (numpy Generator)
+        """
+        return batch_generator() if self.__rng is None else self.__rng
+
+
+    @rng.setter
+    def rng(self, rng):
+        """
+        Sets the generator of the measurements, the current random
+        context's at every draw if None (numpy Generator)
+        """
+        self.__rng = rng
+
+
+    def __len__(self):
+        """
+        Returns: The number of amplitudes (int)
+        """
+        return 1 << self.num_qubits
+
+
+    def __str__(self):
+        """
+        Returns: The non-zero amplitudes of the first 16 states (string)
+        """
+        terms = []
+        for index in np.flatnonzero(np.abs(self.amplitudes) > 1e-12)[:16]:
+            amplitude = self.amplitude(int(index))
+            terms.append(f"({amplitude})|{index:0{self.num_qubits}b}>")
+        return " + ".join(terms)
+
+
+    @property
+    def amplitudes(self):
+        """
+        Returns: The amplitudes of the register, later gates reuse the
+                 array so copy it to keep it (complex128 ndarray)
+        """
+        self.__flush()
+        return self.__amplitudes
+
+
+    @property
+    def probabilities(self):
+        """
+        Returns: The probability of every basis state (float64 ndarray)
+        """
+        amplitudes = self.amplitudes
+        return amplitudes.real ** 2 + amplitudes.imag ** 2
+
+
+    def amplitude(self, index):
+        """
+        Returns the amplitude of a basis state
+
+        Arguments: The basis state as an int or a bit string, ex. '101'
+        Returns: The amplitude (ComplexNumber)
+        """
+        if isinstance(index, str):
+            index = int(index, 2)
+        value = self.amplitudes[index]
+        return ComplexNumber(float(value.real), float(value.imag))
+
+
+    def vector(self):
+        """
+        Returns: The amplitudes as a column vector (ComplexMatrix)
+        """
+        return ComplexMatrix(self.amplitudes.reshape(-1, 1))
+
+
+    def apply(self, gate, *qubits):
+        """
+        Applies a 1 or 2 qubit gate. Gates on one qubit are multiplied
+        together and applied only when a 2 qubit gate or a measurement
+        needs that qubit, so a run of rotations costs one pass over the
+        amplitudes.
+
+        Arguments: The gate, 2x2 or 4x4 (ComplexMatrix or numpy array)
+                   The qubits the gate acts on, the first is the most
+                   significant bit of the gate (int)
+        Returns: The register for chaining, None on error (StateVector)
+        """
+        try:
+            if isinstance(gate, ComplexMatrix):
+                gate = gate.array
+            gate = np.asarray(gate, dtype=np.complex128)
+            size = 1 << len(qubits)
+            if (not 0 < len(qubits) <= 2 or gate.shape != (size, size) or
+                len(set(qubits)) != len(qubits) or
+                not all(0 <= qubit < self.num_qubits for qubit in qubits)):
+                raise ValueError
+        except (ValueError, TypeError, AttributeError):
+            print("E20: The gate must be a 2x2 or 4x4 matrix on 1 or 2 ",
+                  "different qubits of the register.")
+            return None
+
+        if len(qubits) == 1:
+            pending = self.__pending.get(qubits[0])
+            self.__pending[qubits[0]] = (gate if pending is None 
+                                         else gate @ pending)
+        else:
+            self.__flush(qubits)
+            self.__apply_gate(gate, qubits)
+        return self
+
+
+    def __flush(self, qubits = None):
+        """
+        Applies the waiting 1 qubit gates of some qubits, all if None
+        """
+        qubits = list(self.__pending) if qubits is None else qubits
+        for qubit in qubits:
+            gate = self.__pending.pop(qubit, None)
+            if gate is not None:
+                self.__apply_gate(gate, (qubit,))
+
+
+    def __apply_gate(self, gate, qubits):
+        """
+        Applies a gate to a view of the amplitudes with one axis per qubit.
+        Every output slice is the sum of the input slices weighted by one
+        row of the gate, terms with a zero weight are skipped so diagonal
+        and permutation gates such as CZ or CNOT cost a multiply or a copy.
+        """
+        size = 1 << len(qubits)
+        state = self.__amplitudes.reshape((2,) * self.num_qubits)
+        slices = []
+        for basis in range(size):
+            index = [slice(None)] * self.num_qubits
+            for position, qubit in enumerate(qubits):
+                bit = (basis >> (len(qubits) - 1 - position)) & 1
+                index[qubit] = slice(bit, bit + 1)
+            slices.append(tuple(index))
+
+        # Diagonal gates only scale the slices, in place
+        if not np.count_nonzero(gate - np.diag(np.diag(gate))):
+            for basis in range(size):
+                if gate[basis, basis] != 1:
+                    state[slices[basis]] *= gate[basis, basis]
+            return
+
+        if self.__scratch is None:
+            self.__scratch = np.empty_like(self.__amplitudes)
+            self.__buffer = np.empty(len(self.__amplitudes) // 2,
+                                     dtype=np.complex128)
+        stride = 1 << (self.num_qubits - 1 - qubits[0])
+        if len(qubits) == 1 and np.count_nonzero(gate) == 4:
+            if stride >= MATMUL_STRIDE:
+                # Batch of (2 x 2) @ (2 x stride) products
+                shape = (-1, 2, stride)
+                np.matmul(gate, self.__amplitudes.reshape(shape),
+                          out=self.__scratch.reshape(shape))
+            else:
+                # One product with the gate spread over the short stride
+                shape = (-1, 2 * stride)
+                np.matmul(self.__amplitudes.reshape(shape),
+                          np.kron(gate, np.eye(stride)).T,
+                          out=self.__scratch.reshape(shape))
+        else:
+            result = self.__scratch.reshape(state.shape)
+            shape = state[slices[0]].shape
+            buffer = self.__buffer[:len(self.__amplitudes) // size]
+            buffer = buffer.reshape(shape)
+            for row in range(size):
+                out = result[slices[row]]
+                columns = np.flatnonzero(gate[row])
+                if not len(columns):
+                    out[...] = 0
+                for term, column in enumerate(columns):
+                    weight = gate[row, column]
+                    target = out if term == 0 else buffer
+                    if weight == 1:
+                        target[...] = state[slices[column]]
+                    else:
+                        np.multiply(state[slices[column]], weight, 
+                                    out=target)
+                    if term:
+                        out += buffer
+        self.__amplitudes, self.__scratch = self.__scratch, self.__amplitudes
+
+
+    def marginal(self, qubits = None):
+        """
+        Returns the probabilities of a subset of the qubits
+
+        Arguments: The qubits, all if None (list of int)
+        Returns: The probability of every state of the qubits, in the order
+                 given (float64 ndarray)
+        """
+        qubits = list(range(self.num_qubits)) if qubits is None else qubits
+        probabilities = self.probabilities.reshape((2,) * self.num_qubits)
+        others = tuple(axis for axis in range(self.num_qubits)
+                       if axis not in qubits)
+        if others:
+            probabilities = probabilities.sum(axis=others)
+        kept = sorted(qubits)
+        order = [kept.index(qubit) for qubit in qubits]
+        return np.transpose(probabilities, order).reshape(-1)
+
+
+    def sample(self, shots = 1000, qubits = None):
+        """
+        Measures copies of the register without changing it
+
+        Arguments: The number of measurements (int)
+                   The qubits to measure, all if None (list of int)
+        Returns: The number of times every outcome was seen, keyed by the
+                 bit string of the qubits (dictionary)
+        """
+        qubits = list(range(self.num_qubits)) if qubits is None else qubits
+        cumulative = np.cumsum(self.marginal(qubits))
+        outcomes = np.searchsorted(cumulative,
+                                   self.rng.random(shots) * cumulative[-1],
+                                   side="right")
+        outcomes = np.minimum(outcomes, len(cumulative) - 1)
+        values, counts = np.unique(outcomes, return_counts=True)
+        return {f"{value:0{len(qubits)}b}": int(count)
+                for value, count in zip(values, counts)}
+
+
+    def measure(self, qubit):
+        """
+        Measures one qubit and collapses the register to the outcome
+
+        Arguments: The qubit (int)
+        Returns: The outcome, 0 or 1 (int)
+        """
+        probability_one = self.marginal([qubit])[1]
+        outcome = int(self.rng.random() < probability_one)
+        state = self.amplitudes.reshape((2,) * self.num_qubits)
+        index = [slice(None)] * self.num_qubits
+        index[qubit] = slice(1 - outcome, 2 - outcome)
+        state[tuple(index)] = 0
+        kept = probability_one if outcome else 1 - probability_one
+        self.__amplitudes /= math.sqrt(kept)
+        return outcome
+
+
+"""*********************Main Routine***************************************"""
+# Runs the main routine
+if __name__ == "__main__":
+    import time
+    qubits = 24
+    start = time.perf_counter()
+    register = StateVector(qubits)
+    for qubit in range(qubits):
+        register.apply(HADAMARD, qubit)
+    for qubit in range(qubits - 1):
+        register.apply(CNOT, qubit, qubit + 1)
+    for qubit in range(qubits):
+        register.apply(rotation_y(0.1 * (qubit + 1)), qubit)
+        register.apply(T_GATE, qubit)
+    for qubit in range(0, qubits - 1, 2):
+        register.apply(CZ, qubit, qubit + 1)
+    counts = register.sample(1000, [0, 1, 2])
+    print(f"{qubits} qubits, {4 * qubits - 1 + qubits // 2} gates in "
+          f"{time.perf_counter() - start:.1f} s")
+    print("Outcomes of qubits 0 to 2:", counts)